@@ -14,6 +14,7 @@ if parent_dir not in sys.path:
 
 from database.db_manager import DatabaseManager
 from admin.processor import PerformanceProcessor
+from utils.caption_parser import SUGGESTION_FIELDS
 
 # 페이지 설정
 st.set_page_config(
@@ -30,8 +31,187 @@ if 'db_manager' not in st.session_state:
 db = st.session_state.db_manager
 processor = st.session_state.processor
 
+
+def render_post_detail(post: dict):
+    """게시물 상세 (이미지 서명 URL 생성 + 입력 폼) 렌더링"""
+    # 2단 레이아웃
+    col_left, col_right = st.columns([1, 2])
+    
+    with col_left:
+        st.markdown("### 📸 이미지")
+        
+        # 이미지 표시
+        images = processor.get_post_images(post['id'])
+        if images:
+            for img in images:
+                st.image(
+                    img['url'],
+                    caption=f"이미지 {img['index'] + 1}",
+                    use_column_width=True
+                )
+                st.markdown(f"[원본 보기]({img['original_url']})")
+        elif post['suggestions'].get('images_deferred'):
+            score = post['suggestions'].get('classification', {}).get('score')
+            st.info(
+                f"⏸️ 공연 공지가 아닌 것으로 분류되어 이미지 수집을 보류했습니다 (점수 {score}). "
+                "Instagram 게시물에서 확인하거나 `python main.py --mode deferred`로 이미지를 수집하세요."
+            )
+        else:
+            st.warning("이미지 없음")
+        
+        st.markdown("### 📝 원본 데이터")
+        if post['suggestions'].get('caption_updated_at'):
+            st.warning(f"✏️ 저장 후 캡션이 수정되었습니다 ({post['suggestions']['caption_updated_at']}). 입력 내용을 확인하세요.")
+        st.text_area(
+            "캡션",
+            value=post['description'] or '',
+            height=150,
+            disabled=True,
+            key=f"caption_{post['id']}"
+        )
+        
+        st.markdown(f"**Instagram URL:**")
+        st.markdown(f"[게시물 보기]({post['post_url']})")
+    
+    with col_right:
+        st.markdown("### ✏️ 데이터 입력")
+        
+        # 미처리 게시물은 캡션에서 추출한 제안값으로 빈 항목을 미리 채움 (확인 후 저장)
+        suggested = post.get('suggestions', {}) if post['status'] == 'pending' else {}
+        if any(key in suggested for key in SUGGESTION_FIELDS if key != 'version'):
+            st.info("🤖 캡션에서 추출한 값으로 미리 채웠습니다. 확인 후 저장하세요.")
+        
+        with st.form(key=f"form_{post['id']}"):
+            # 제목
+            title = st.text_input(
+                "공연 제목 *",
+                value=post.get('title') or suggested.get('title', ''),
+                placeholder="예: 힙합 파티 나이트",
+                key=f"title_{post['id']}"
+            )
+            
+            # 날짜/시간
+            col_date, col_time = st.columns(2)
+            with col_date:
+                perform_date = st.date_input(
+                    "공연 날짜 *",
+                    value=post.get('perform_date') or suggested.get('perform_date') or datetime.now().date(),
+                    key=f"date_{post['id']}"
+                )
+            
+            with col_time:
+                perform_time = st.time_input(
+                    "공연 시간",
+                    value=post.get('perform_time') or suggested.get('perform_time'),
+                    key=f"time_{post['id']}"
+                )
+            
+            # 가격
+            col_booking, col_onsite = st.columns(2)
+            with col_booking:
+                booking_price = st.number_input(
+                    "예매 가격 (원)",
+                    min_value=0,
+                    value=post.get('booking_price') or suggested.get('booking_price', 0),
+                    step=1000,
+                    key=f"booking_{post['id']}"
+                )
+            
+            with col_onsite:
+                onsite_price = st.number_input(
+                    "현장 가격 (원)",
+                    min_value=0,
+                    value=post.get('onsite_price') or suggested.get('onsite_price', 0),
+                    step=1000,
+                    key=f"onsite_{post['id']}"
+                )
+            
+            # 예매 URL
+            booking_url = st.text_input(
+                "예매 링크",
+                value=post.get('booking_url') or suggested.get('booking_url', ''),
+                placeholder="https://...",
+                key=f"booking_url_{post['id']}"
+            )
+            
+            # 아티스트
+            artists = st.text_area(
+                "아티스트 (쉼표로 구분)",
+                value=', '.join(post.get('artists') or suggested.get('artists', [])),
+                placeholder="DJ A, MC B, 밴드 C",
+                height=80,
+                key=f"artists_{post['id']}"
+            )
+            
+            # 취소 여부
+            is_cancelled = st.checkbox(
+                "공연 취소됨",
+                value=post.get('is_cancelled', False),
+                key=f"cancelled_{post['id']}"
+            )
+            
+            # 버튼
+            col_btn1, col_btn2 = st.columns(2)
+            
+            with col_btn1:
+                submitted = st.form_submit_button(
+                    "✅ 저장",
+                    type="primary",
+                    use_container_width=True
+                )
+            
+            with col_btn2:
+                deleted = st.form_submit_button(
+                    "🗑️ 삭제",
+                    use_container_width=True
+                )
+            
+            # 처리
+            if submitted:
+                if not title or not perform_date:
+                    st.error("제목과 날짜는 필수입니다!")
+                else:
+                    # 날짜/시간 결합
+                    perform_datetime = datetime.combine(
+                        perform_date,
+                        perform_time if perform_time else datetime.min.time()
+                    )
+                    
+                    # 아티스트 파싱
+                    artist_list = [a.strip() for a in artists.split(',') if a.strip()]
+                    
+                    # 데이터 저장
+                    data = {
+                        'perform_id': post['id'],
+                        'title': title,
+                        'perform_date': perform_datetime,
+                        'booking_price': booking_price,
+                        'onsite_price': onsite_price,
+                        'booking_url': booking_url if booking_url else None,
+                        'artists': artist_list,
+                        'is_cancelled': is_cancelled
+                    }
+                    
+                    if processor.save_performance(data):
+                        st.success("✅ 저장되었습니다!")
+                        st.rerun()
+                    else:
+                        st.error("❌ 저장 실패")
+            
+            if deleted:
+                if processor.delete_performance(post['id']):
+                    st.warning("🗑️ 삭제되었습니다.")
+                    st.rerun()
+                else:
+                    st.error("삭제 실패")
+
 # 사이드바
 st.sidebar.title("🎵 공연 데이터 관리")
+
+# 통계/클럽 목록은 TTL 동안 캐시됨 - 다른 작업자의 변경을 바로 보려면 새로고침
+if st.sidebar.button("🔄 새로고침", use_container_width=True):
+    processor.invalidate_cache()
+
 st.sidebar.markdown("---")
 
 # 필터
@@ -54,6 +234,21 @@ date_range = st.sidebar.slider(
     format="%d일 전"
 )
 
+st.sidebar.markdown("---")
+
+# 표시 방식
+render_mode = st.sidebar.radio(
+    "표시 방식",
+    ["열린 게시물만", "전체 펼침"],
+    help="열린 게시물만: 선택한 게시물의 이미지/입력 폼만 불러옵니다"
+)
+
+page_size = st.sidebar.select_slider(
+    "페이지당 게시물",
+    options=[10, 20, 50, 100],
+    value=20
+)
+
 # 메인 화면
 st.title("🎵 Instagram 공연 데이터 관리")
 st.markdown("---")
@@ -84,168 +279,93 @@ st.subheader(f"📋 게시물 목록 ({len(posts)}개)")
 if not posts:
     st.info("표시할 게시물이 없습니다.")
 else:
-    # 게시물 표시
-    for post in posts:
-        with st.expander(
-            f"🎪 {post['club_name']} | {post['created_at']} | {post['status_text']}",
-            expanded=False
-        ):
-            # 2단 레이아웃
-            col_left, col_right = st.columns([1, 2])
-            
-            with col_left:
-                st.markdown("### 📸 이미지")
-                
-                # 이미지 표시
-                images = processor.get_post_images(post['id'])
-                if images:
-                    for img in images:
-                        st.image(
-                            img['url'],
-                            caption=f"이미지 {img['index'] + 1}",
-                            use_column_width=True
-                        )
+    # 일괄 작업
+    with st.expander("🧹 일괄 작업", expanded=False):
+        post_labels = {
+            post['id']: f"#{post['id']} {post['club_name']} | {post['created_at']} | {post['status_text']}"
+            for post in posts
+        }
+        
+        with st.form(key="bulk_form"):
+            selected_ids = st.multiselect(
+                "대상 게시물",
+                options=list(post_labels.keys()),
+                format_func=lambda post_id: post_labels[post_id]
+            )
+            
+            bulk_action = st.radio(
+                "작업",
+                ["공연 취소 처리", "공연 날짜 지정", "삭제"],
+                horizontal=True
+            )
+            
+            col_bulk_date, col_bulk_time = st.columns(2)
+            with col_bulk_date:
+                bulk_date = st.date_input("공연 날짜", value=datetime.now().date())
+            with col_bulk_time:
+                bulk_time = st.time_input("공연 시간", value=None)
+            
+            confirm_delete = st.checkbox("삭제 확인 (이미지 포함, 되돌릴 수 없음)")
+            
+            bulk_submitted = st.form_submit_button("실행", type="primary")
+        
+        if bulk_submitted:
+            if not selected_ids:
+                st.error("대상 게시물을 선택하세요.")
+            elif bulk_action == "삭제" and not confirm_delete:
+                st.error("삭제 확인을 체크하세요.")
+            else:
+                if bulk_action == "공연 취소 처리":
+                    count = processor.set_cancelled_many(selected_ids, True)
+                elif bulk_action == "공연 날짜 지정":
+                    count = processor.set_perform_date_many(
+                        selected_ids,
+                        datetime.combine(bulk_date, bulk_time if bulk_time else datetime.min.time())
+                    )
                 else:
-                    st.warning("이미지 없음")
-                
-                st.markdown("### 📝 원본 데이터")
-                st.text_area(
-                    "캡션",
-                    value=post['description'] or '',
-                    height=150,
-                    disabled=True,
-                    key=f"caption_{post['id']}"
-                )
+                    count = processor.delete_performances(selected_ids)
                 
-                st.markdown(f"**Instagram URL:**")
-                st.markdown(f"[게시물 보기]({post['post_url']})")
+                if count is None:
+                    st.error(f"❌ {bulk_action} 실패")
+                else:
+                    st.success(f"✅ {bulk_action}: {count}개")
+                    st.rerun()
+    
+    # 페이지 범위 계산
+    total_pages = max(1, (len(posts) + page_size - 1) // page_size)
+    page = st.number_input("페이지", min_value=1, max_value=total_pages, value=1, step=1)
+    page_posts = posts[(page - 1) * page_size:page * page_size]
+    st.caption(f"{page}/{total_pages} 페이지")
+    
+    # 게시물 표시
+    if render_mode == "전체 펼침":
+        # 모든 게시물의 이미지/폼을 미리 구성 (접힌 expander 안에서도 실행됨)
+        for post in page_posts:
+            with st.expander(
+                f"🎪 {post['club_name']} | {post['created_at']} | {post['status_text']}",
+                expanded=False
+            ):
+                render_post_detail(post)
+    else:
+        # 연 게시물만 이미지 서명/폼 구성 - 렌더링 시간이 목록 길이와 무관
+        open_posts = st.session_state.setdefault('open_posts', set())
+        
+        for post in page_posts:
+            is_open = post['id'] in open_posts
+            col_label, col_toggle = st.columns([6, 1])
+            with col_label:
+                st.markdown(f"{'📂' if is_open else '📁'} **{post['club_name']}** | {post['created_at']} | {post['status_text']}")
+            with col_toggle:
+                if st.button("닫기" if is_open else "열기", key=f"toggle_{post['id']}", use_container_width=True):
+                    if is_open:
+                        open_posts.discard(post['id'])
+                    else:
+                        open_posts.add(post['id'])
+                    st.rerun()
             
-            with col_right:
-                st.markdown("### ✏️ 데이터 입력")
-                
-                with st.form(key=f"form_{post['id']}"):
-                    # 제목
-                    title = st.text_input(
-                        "공연 제목 *",
-                        value=post.get('title', ''),
-                        placeholder="예: 힙합 파티 나이트",
-                        key=f"title_{post['id']}"
-                    )
-                    
-                    # 날짜/시간
-                    col_date, col_time = st.columns(2)
-                    with col_date:
-                        perform_date = st.date_input(
-                            "공연 날짜 *",
-                            value=post.get('perform_date') or datetime.now().date(),
-                            key=f"date_{post['id']}"
-                        )
-                    
-                    with col_time:
-                        perform_time = st.time_input(
-                            "공연 시간",
-                            value=post.get('perform_time') or None,
-                            key=f"time_{post['id']}"
-                        )
-                    
-                    # 가격
-                    col_booking, col_onsite = st.columns(2)
-                    with col_booking:
-                        booking_price = st.number_input(
-                            "예매 가격 (원)",
-                            min_value=0,
-                            value=post.get('booking_price', 0),
-                            step=1000,
-                            key=f"booking_{post['id']}"
-                        )
-                    
-                    with col_onsite:
-                        onsite_price = st.number_input(
-                            "현장 가격 (원)",
-                            min_value=0,
-                            value=post.get('onsite_price', 0),
-                            step=1000,
-                            key=f"onsite_{post['id']}"
-                        )
-                    
-                    # 예매 URL
-                    booking_url = st.text_input(
-                        "예매 링크",
-                        value=post.get('booking_url', ''),
-                        placeholder="https://...",
-                        key=f"booking_url_{post['id']}"
-                    )
-                    
-                    # 아티스트
-                    artists = st.text_area(
-                        "아티스트 (쉼표로 구분)",
-                        value=', '.join(post.get('artists', [])) if post.get('artists') else '',
-                        placeholder="DJ A, MC B, 밴드 C",
-                        height=80,
-                        key=f"artists_{post['id']}"
-                    )
-                    
-                    # 취소 여부
-                    is_cancelled = st.checkbox(
-                        "공연 취소됨",
-                        value=post.get('is_cancelled', False),
-                        key=f"cancelled_{post['id']}"
-                    )
-                    
-                    # 버튼
-                    col_btn1, col_btn2 = st.columns(2)
-                    
-                    with col_btn1:
-                        submitted = st.form_submit_button(
-                            "✅ 저장",
-                            type="primary",
-                            use_container_width=True
-                        )
-                    
-                    with col_btn2:
-                        deleted = st.form_submit_button(
-                            "🗑️ 삭제",
-                            use_container_width=True
-                        )
-                    
-                    # 처리
-                    if submitted:
-                        if not title or not perform_date:
-                            st.error("제목과 날짜는 필수입니다!")
-                        else:
-                            # 날짜/시간 결합
-                            perform_datetime = datetime.combine(
-                                perform_date,
-                                perform_time if perform_time else datetime.min.time()
-                            )
-                            
-                            # 아티스트 파싱
-                            artist_list = [a.strip() for a in artists.split(',') if a.strip()]
-                            
-                            # 데이터 저장
-                            data = {
-                                'perform_id': post['id'],
-                                'title': title,
-                                'perform_date': perform_datetime,
-                                'booking_price': booking_price,
-                                'onsite_price': onsite_price,
-                                'booking_url': booking_url if booking_url else None,
-                                'artists': artist_list,
-                                'is_cancelled': is_cancelled
-                            }
-                            
-                            if processor.save_performance(data):
-                                st.success("✅ 저장되었습니다!")
-                                st.rerun()
-                            else:
-                                st.error("❌ 저장 실패")
-                    
-                    if deleted:
-                        if processor.delete_performance(post['id']):
-                            st.warning("🗑️ 삭제되었습니다.")
-                            st.rerun()
-                        else:
-                            st.error("삭제 실패")
+            if is_open:
+                with st.container(border=True):
+                    render_post_detail(post)
 
 # 하단 정보
 st.markdown("---")
@@ -0,0 +1,83 @@
+"""
+R2 고아 객체 정리 스크립트 (perform_img_tmp에서 참조하지 않는 perform_tmp/ 객체 삭제)
+"""
+import argparse
+import sys
+import os
+
+# 프로젝트 루트를 path에 추가 (admin 폴더에서 실행 시 대비)
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(current_dir)
+if parent_dir not in sys.path:
+    sys.path.insert(0, parent_dir)
+
+from database.db_manager import DatabaseManager
+from admin.processor import PerformanceProcessor
+from utils.logger import setup_logger
+
+logger = setup_logger('gc_storage')
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='R2 고아 객체 정리',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+사용 예시:
+  # 정리 대상만 확인
+  python admin/gc_storage.py
+
+  # 48시간 이상 지난 고아 객체 삭제
+  python admin/gc_storage.py --min-age-hours 48 --execute
+        """
+    )
+    parser.add_argument(
+        '--prefix',
+        type=str,
+        default='perform_tmp/',
+        help='검사할 R2 경로 접두사 (기본값: perform_tmp/)'
+    )
+    parser.add_argument(
+        '--min-age-hours',
+        type=int,
+        default=24,
+        help='이 시간보다 오래된 객체만 정리 (업로드 중인 객체 보호, 기본값: 24)'
+    )
+    parser.add_argument(
+        '--execute',
+        action='store_true',
+        help='실제로 삭제 (미지정 시 대상만 출력)'
+    )
+    args = parser.parse_args()
+
+    db_manager = None
+    try:
+        db_manager = DatabaseManager()
+        processor = PerformanceProcessor(db_manager)
+
+        result = processor.collect_orphan_objects(
+            prefix=args.prefix,
+            min_age_hours=args.min_age_hours,
+            dry_run=not args.execute
+        )
+
+        for file_path in result['orphans']:
+            logger.info(f"   - {file_path}")
+
+        if args.execute:
+            logger.info(f"🗑️ 삭제 완료: {result['deleted']}개 (실패 {result['errors']}개)")
+        else:
+            logger.info("ℹ️ 확인 모드 - 삭제하려면 --execute 지정")
+
+    except Exception as e:
+        logger.error(f"❌ R2 정리 중 오류: {e}")
+        import traceback
+        logger.error(traceback.format_exc())
+
+    finally:
+        if db_manager:
+            db_manager.close_all_connections()
+
+
+if __name__ == "__main__":
+    main()
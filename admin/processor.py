@@ -2,20 +2,76 @@
 공연 데이터 처리 로직
 """
 import json
-from datetime import datetime, timedelta
-from typing import List, Dict, Optional
+import time
+from datetime import date, datetime, timedelta, timezone, time as dt_time
+from typing import List, Dict, Optional, Callable, Any, Tuple
 from utils.logger import setup_logger
-from config.settings import R2_CONFIG
+from utils.caption_parser import SUGGESTION_FIELDS
+from config.settings import R2_CONFIG, ADMIN_CACHE_TTL
 
 logger = setup_logger('processor')
 
 class PerformanceProcessor:
-    def __init__(self, db_manager):
+    def __init__(self, db_manager, cache_ttl: int = ADMIN_CACHE_TTL):
+        """
+        Args:
+            db_manager: DatabaseManager 인스턴스
+            cache_ttl: 통계/클럽 목록 캐시 유지 시간 (초, 0이면 캐시 안 함)
+        """
         self.db = db_manager
         self.r2_base_url = f"{R2_CONFIG['endpoint_url']}/{R2_CONFIG['bucket_name']}"
+        self._storage = None
+        self.cache_ttl = cache_ttl
+        self._cache = {}  # key -> (만료 시각, 값)
+    
+    def _cached(self, key: str, loader: Callable[[], Any]) -> Any:
+        """TTL 캐시 조회, 만료 시 loader로 다시 조회 (예외 발생 시 캐시하지 않음)"""
+        entry = self._cache.get(key)
+        now = time.monotonic()
+        if entry and entry[0] > now:
+            return entry[1]
+        
+        value = loader()
+        if self.cache_ttl > 0:
+            self._cache[key] = (now + self.cache_ttl, value)
+        return value
+    
+    def invalidate_cache(self):
+        """통계/클럽 목록 캐시 초기화 (데이터 변경 시 호출)"""
+        self._cache.clear()
+    
+    def _get_storage(self):
+        """R2 스토리지 어댑터 (첫 사용 시 생성 후 재사용)"""
+        if self._storage is None:
+            from storage.r2_storage import R2StorageAdapter
+            self._storage = R2StorageAdapter(R2_CONFIG)
+        return self._storage
+    
+    def _signed_url(self, file_path: str) -> str:
+        """Signed URL 생성 (1시간 유효), 실패 시 기본 URL"""
+        try:
+            return self._get_storage().generate_presigned_url(file_path, expires_in=3600)
+        except Exception as e:
+            logger.error(f"Signed URL 생성 실패: {e}")
+            # 실패 시 기본 URL (작동 안 할 수 있음)
+            return f"{self.r2_base_url}/{file_path}"
     
     def get_statistics(self) -> Dict:
-        """통계 정보 조회 (title 유무로 완료/미완료 판단)"""
+        """통계 정보 조회 (title 유무로 완료/미완료 판단, TTL 캐시)"""
+        try:
+            return self._cached('statistics', self._load_statistics)
+        except Exception as e:
+            logger.error(f"통계 조회 오류: {e}")
+            return {
+                'total': 0,
+                'pending': 0,
+                'completed': 0,
+                'rejected': 0,
+                'pending_rate': 0,
+                'completed_rate': 0
+            }
+    
+    def _load_statistics(self) -> Dict:
         conn = None
         try:
             conn = self.db.get_connection()
@@ -42,24 +98,20 @@ class PerformanceProcessor:
                 'pending_rate': (pending / total * 100) if total > 0 else 0,
                 'completed_rate': (completed / total * 100) if total > 0 else 0
             }
-            
-        except Exception as e:
-            logger.error(f"통계 조회 오류: {e}")
-            return {
-                'total': 0,
-                'pending': 0,
-                'completed': 0,
-                'rejected': 0,
-                'pending_rate': 0,
-                'completed_rate': 0
-            }
         finally:
             if conn:
                 cursor.close()
                 self.db.return_connection(conn)
     
     def get_club_list(self) -> List[str]:
-        """클럽 목록 조회"""
+        """클럽 목록 조회 (TTL 캐시)"""
+        try:
+            return self._cached('club_list', self._load_club_list)
+        except Exception as e:
+            logger.error(f"클럽 목록 조회 오류: {e}")
+            return []
+    
+    def _load_club_list(self) -> List[str]:
         conn = None
         try:
             conn = self.db.get_connection()
@@ -76,10 +128,6 @@ class PerformanceProcessor:
             rows = cursor.fetchall()
             
             return [row[0] for row in rows]
-            
-        except Exception as e:
-            logger.error(f"클럽 목록 조회 오류: {e}")
-            return []
         finally:
             if conn:
                 cursor.close()
@@ -113,7 +161,8 @@ class PerformanceProcessor:
                     p.is_cancelled,
                     p.sns_links,
                     p.created_at,
-                    p.updated_at
+                    p.updated_at,
+                    p.suggestions
                 FROM perform_tmp p
                 INNER JOIN club_tb c ON c.id = p.club_id
                 WHERE p.created_at >= NOW() - INTERVAL '%s days'
@@ -174,7 +223,8 @@ class PerformanceProcessor:
                     'status': status_value,
                     'status_text': status_text,
                     'created_at': row[12].strftime('%Y-%m-%d %H:%M'),
-                    'updated_at': row[13].strftime('%Y-%m-%d %H:%M') if row[13] else ''
+                    'updated_at': row[13].strftime('%Y-%m-%d %H:%M') if row[13] else '',
+                    'suggestions': _load_suggestions(row[14])
                 })
             
             return posts
@@ -190,7 +240,12 @@ class PerformanceProcessor:
                 self.db.return_connection(conn)
     
     def get_post_images(self, perform_id: int) -> List[Dict]:
-        """게시물 이미지 조회 (Signed URL 생성)"""
+        """
+        게시물 이미지 조회 (Signed URL 생성)
+        
+        원본 이미지 기준으로 조회하며, 썸네일이 있으면 'url'은 썸네일,
+        'original_url'은 원본을 가리킨다.
+        """
         conn = None
         try:
             conn = self.db.get_connection()
@@ -198,13 +253,22 @@ class PerformanceProcessor:
             
             query = """
                 SELECT 
-                    id,
-                    file_path,
-                    is_main,
-                    original_name
-                FROM perform_img_tmp
-                WHERE perform_id = %s
-                ORDER BY is_main DESC, id ASC;
+                    i.id,
+                    i.file_path,
+                    i.is_main,
+                    i.original_name,
+                    (
+                        SELECT t.file_path
+                        FROM perform_img_tmp t
+                        WHERE t.parent_id = i.id
+                        AND t.variant = 'thumbnail'
+                        ORDER BY t.id
+                        LIMIT 1
+                    ) as thumbnail_path
+                FROM perform_img_tmp i
+                WHERE i.perform_id = %s
+                AND COALESCE(i.variant, 'original') = 'original'
+                ORDER BY i.is_main DESC, i.id ASC;
             """
             
             cursor.execute(query, (perform_id,))
@@ -213,20 +277,15 @@ class PerformanceProcessor:
             images = []
             for i, row in enumerate(rows):
                 file_path = row[1]
+                thumbnail_path = row[4]
                 
-                # Signed URL 생성 (1시간 유효)
-                try:
-                    from storage.r2_storage import R2StorageAdapter
-                    r2_storage = R2StorageAdapter(R2_CONFIG)
-                    image_url = r2_storage.generate_presigned_url(file_path, expires_in=3600)
-                except Exception as e:
-                    logger.error(f"Signed URL 생성 실패: {e}")
-                    # 실패 시 기본 URL (작동 안 할 수 있음)
-                    image_url = f"{self.r2_base_url}/{file_path}"
+                original_url = self._signed_url(file_path)
+                image_url = self._signed_url(thumbnail_path) if thumbnail_path else original_url
                 
                 images.append({
                     'id': row[0],
                     'url': image_url,
+                    'original_url': original_url,
                     'is_main': row[2],
                     'original_name': row[3],
                     'index': i
@@ -242,6 +301,111 @@ class PerformanceProcessor:
                 cursor.close()
                 self.db.return_connection(conn)
     
+    def get_posts_for_suggestions(
+        self,
+        after_id: int = 0,
+        limit: int = 500,
+        days: Optional[int] = None,
+        below_version: Optional[int] = None
+    ) -> List[Dict]:
+        """
+        캡션 추출 대상 미처리 게시물 조회 (id 순, after_id 이후)
+        
+        Args:
+            after_id: 이 ID 이후부터 조회 (배치 반복용)
+            limit: 최대 조회 수
+            days: 최근 N일 이내 등록분만 (None이면 전체)
+            below_version: 제안값이 없거나 이 버전보다 낮은 게시물만 (None이면 미처리 전체)
+            
+        Returns:
+            [{'id', 'description', 'created_at'}, ...]
+        """
+        conn = None
+        try:
+            conn = self.db.get_connection()
+            cursor = conn.cursor()
+            
+            query = """
+                SELECT id, description, created_at
+                FROM perform_tmp
+                WHERE id > %s
+                AND (title IS NULL OR title = '')
+            """
+            params = [after_id]
+            
+            if days:
+                query += " AND created_at >= NOW() - INTERVAL '%s days'"
+                params.append(days)
+            
+            if below_version is not None:
+                query += """
+                    AND (suggestions IS NULL OR COALESCE((suggestions->>'version')::int, 0) < %s)
+                """
+                params.append(below_version)
+            
+            query += " ORDER BY id LIMIT %s;"
+            params.append(limit)
+            
+            cursor.execute(query, params)
+            return [
+                {'id': row[0], 'description': row[1], 'created_at': row[2]}
+                for row in cursor.fetchall()
+            ]
+            
+        except Exception as e:
+            logger.error(f"캡션 추출 대상 조회 오류: {e}")
+            return []
+        finally:
+            if conn:
+                cursor.close()
+                self.db.return_connection(conn)
+    
+    def save_suggestions_many(self, suggestions: List[Tuple[int, Dict]]) -> Optional[int]:
+        """
+        캡션 추출 제안값 일괄 저장 (한 번의 UPDATE)
+        
+        캡션 추출 항목만 교체하고 분류 결과/이미지 보류/캡션 수정 시각 등 다른 키는 유지한다.
+        
+        Args:
+            suggestions: [(공연 ID, 제안값), ...]
+            
+        Returns:
+            변경된 공연 수, 실패 시 None
+        """
+        if not suggestions:
+            return 0
+        
+        conn = None
+        try:
+            conn = self.db.get_connection()
+            cursor = conn.cursor()
+            
+            query = """
+                UPDATE perform_tmp p
+                SET suggestions = (COALESCE(p.suggestions, '{}'::jsonb) - %s::text[]) || v.suggestions
+                FROM unnest(%s::int4[], %s::jsonb[]) AS v(id, suggestions)
+                WHERE p.id = v.id;
+            """
+            cursor.execute(query, (
+                list(SUGGESTION_FIELDS),
+                [perform_id for perform_id, _ in suggestions],
+                [json.dumps(value, ensure_ascii=False) for _, value in suggestions]
+            ))
+            updated_count = cursor.rowcount
+            
+            conn.commit()
+            return updated_count
+            
+        except Exception as e:
+            if conn:
+                conn.rollback()
+            logger.error(f"캡션 추출 제안값 저장 오류: {e}")
+            return None
+        finally:
+            if conn:
+                cursor.close()
+                self.db.return_connection(conn)
+    
     def save_performance(self, data: Dict) -> bool:
         """공연 데이터 저장 (perform_tmp 업데이트만)"""
         conn = None
@@ -278,6 +442,7 @@ class PerformanceProcessor:
             ))
             
             conn.commit()
+            self.invalidate_cache()
             logger.info(f"공연 데이터 저장 완료: {data['perform_id']}")
             return True
             
@@ -293,34 +458,202 @@ class PerformanceProcessor:
                 cursor.close()
                 self.db.return_connection(conn)
     
+    def set_cancelled_many(self, perform_ids: List[int], is_cancelled: bool = True) -> Optional[int]:
+        """
+        공연 취소 여부 일괄 변경
+        
+        Args:
+            perform_ids: 공연 ID 리스트
+            is_cancelled: 취소 여부
+            
+        Returns:
+            변경된 공연 수, 실패 시 None
+        """
+        return self._update_many("is_cancelled = %s", (is_cancelled,), perform_ids, "취소 여부")
+    
+    def set_perform_date_many(self, perform_ids: List[int], perform_date: datetime) -> Optional[int]:
+        """
+        공연 날짜 일괄 지정
+        
+        Args:
+            perform_ids: 공연 ID 리스트
+            perform_date: 공연 일시
+            
+        Returns:
+            변경된 공연 수, 실패 시 None
+        """
+        return self._update_many("perform_date = %s", (perform_date,), perform_ids, "공연 날짜")
+    
+    def _update_many(self, set_clause: str, params: tuple, perform_ids: List[int], label: str) -> Optional[int]:
+        """perform_tmp 여러 행을 한 번의 UPDATE로 변경"""
+        if not perform_ids:
+            return 0
+        
+        conn = None
+        try:
+            conn = self.db.get_connection()
+            cursor = conn.cursor()
+            
+            query = f"""
+                UPDATE perform_tmp
+                SET {set_clause}, updated_at = NOW()
+                WHERE id = ANY(%s);
+            """
+            cursor.execute(query, params + (list(perform_ids),))
+            updated_count = cursor.rowcount
+            
+            conn.commit()
+            self.invalidate_cache()
+            logger.info(f"{label} 일괄 변경: {updated_count}개")
+            return updated_count
+            
+        except Exception as e:
+            if conn:
+                conn.rollback()
+            logger.error(f"{label} 일괄 변경 오류: {e}")
+            return None
+        finally:
+            if conn:
+                cursor.close()
+                self.db.return_connection(conn)
+    
     def reject_performance(self, perform_id: int) -> bool:
         """공연 거부 처리 (삭제로 대체)"""
         return self.delete_performance(perform_id)
     
     def delete_performance(self, perform_id: int) -> bool:
-        """공연 삭제"""
+        """공연 삭제 (R2 이미지 포함)"""
+        return self.delete_performances([perform_id]) is not None
+    
+    def delete_performances(self, perform_ids: List[int]) -> Optional[int]:
+        """
+        공연 일괄 삭제 (R2 이미지 포함)
+        
+        DB 삭제를 커밋한 뒤 R2 객체를 DeleteObjects로 일괄 삭제한다.
+        R2 삭제에 실패한 객체는 collect_orphan_objects로 정리된다.
+        
+        Args:
+            perform_ids: 삭제할 공연 ID 리스트
+            
+        Returns:
+            삭제된 공연 수, 실패 시 None
+        """
+        if not perform_ids:
+            return 0
+        
         conn = None
         try:
             conn = self.db.get_connection()
             cursor = conn.cursor()
             
+            # 삭제할 이미지 경로 조회
+            cursor.execute(
+                "SELECT file_path FROM perform_img_tmp WHERE perform_id = ANY(%s);",
+                (list(perform_ids),)
+            )
+            file_paths = [row[0] for row in cursor.fetchall() if row[0]]
+            
             # 이미지 먼저 삭제 (FK 제약)
-            cursor.execute("DELETE FROM perform_img_tmp WHERE perform_id = %s;", (perform_id,))
+            cursor.execute("DELETE FROM perform_img_tmp WHERE perform_id = ANY(%s);", (list(perform_ids),))
             
             # 공연 삭제
-            cursor.execute("DELETE FROM perform_tmp WHERE id = %s;", (perform_id,))
+            cursor.execute("DELETE FROM perform_tmp WHERE id = ANY(%s);", (list(perform_ids),))
+            deleted_count = cursor.rowcount
             
             conn.commit()
+            self.invalidate_cache()
             
-            logger.info(f"공연 삭제: {perform_id}")
-            return True
+            logger.info(f"공연 삭제: {deleted_count}개 ({', '.join(map(str, perform_ids))})")
             
         except Exception as e:
             if conn:
                 conn.rollback()
             logger.error(f"공연 삭제 오류: {e}")
-            return False
+            return None
         finally:
             if conn:
                 cursor.close()
-                self.db.return_connection(conn)
\ No newline at end of file
+                self.db.return_connection(conn)
+        
+        # R2 이미지 일괄 삭제
+        if file_paths:
+            try:
+                self._get_storage().delete_many(file_paths)
+            except Exception as e:
+                logger.error(f"R2 이미지 삭제 오류: {e}")
+        
+        return deleted_count
+    
+    def collect_orphan_objects(
+        self,
+        prefix: str = 'perform_tmp/',
+        min_age_hours: int = 24,
+        dry_run: bool = True
+    ) -> Dict:
+        """
+        DB에서 참조하지 않는 R2 객체 정리
+        
+        업로드 직후 아직 DB에 기록되지 않은 객체를 지우지 않도록
+        min_age_hours보다 오래된 객체만 대상으로 한다.
+        
+        Args:
+            prefix: 검사할 R2 경로 접두사
+            min_age_hours: 정리 대상 최소 경과 시간
+            dry_run: True이면 대상만 집계하고 삭제하지 않음
+            
+        Returns:
+            {'scanned': int, 'orphans': [경로, ...], 'orphan_bytes': int, 'deleted': int, 'errors': int}
+        """
+        conn = None
+        try:
+            conn = self.db.get_connection()
+            cursor = conn.cursor()
+            cursor.execute("SELECT file_path FROM perform_img_tmp WHERE file_path IS NOT NULL;")
+            referenced = {row[0] for row in cursor.fetchall()}
+        finally:
+            if conn:
+                cursor.close()
+                self.db.return_connection(conn)
+        
+        cutoff = datetime.now(timezone.utc) - timedelta(hours=min_age_hours)
+        result = {'scanned': 0, 'orphans': [], 'orphan_bytes': 0, 'deleted': 0, 'errors': 0}
+        
+        storage = self._get_storage()
+        for obj in storage.list_objects(prefix):
+            result['scanned'] += 1
+            if obj['file_path'] in referenced or obj['last_modified'] > cutoff:
+                continue
+            result['orphans'].append(obj['file_path'])
+            result['orphan_bytes'] += obj['size']
+        
+        logger.info(
+            f"R2 정리 대상: {len(result['orphans'])}/{result['scanned']}개 "
+            f"({result['orphan_bytes'] / 1024 / 1024:.1f} MB)"
+        )
+        
+        if not dry_run and result['orphans']:
+            deleted = storage.delete_many(result['orphans'])
+            result['deleted'] = len(deleted['deleted'])
+            result['errors'] = len(deleted['errors'])
+        
+        return result
+
+
+def _load_suggestions(value) -> Dict:
+    """캡션 추출 제안값을 입력 폼 값 형식으로 변환 (날짜/시간은 date/time 객체)"""
+    if isinstance(value, str):
+        try:
+            value = json.loads(value)
+        except ValueError:
+            return {}
+    if not isinstance(value, dict):
+        return {}
+    
+    suggestions = dict(value)
+    for key, parse in (('perform_date', date.fromisoformat), ('perform_time', dt_time.fromisoformat)):
+        if key in suggestions:
+            try:
+                suggestions[key] = parse(suggestions[key])
+            except (TypeError, ValueError):
+                del suggestions[key]
+    return suggestions
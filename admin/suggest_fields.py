@@ -0,0 +1,122 @@
+"""
+미처리 게시물 캡션 일괄 추출 스크립트 (perform_tmp.suggestions 채우기)
+"""
+import argparse
+import sys
+import os
+import time
+from collections import Counter
+
+# 프로젝트 루트를 path에 추가 (admin 폴더에서 실행 시 대비)
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(current_dir)
+if parent_dir not in sys.path:
+    sys.path.insert(0, parent_dir)
+
+from database.db_manager import DatabaseManager
+from admin.processor import PerformanceProcessor
+from utils.caption_parser import PARSER_VERSION, parse_captions
+from utils.logger import setup_logger
+
+logger = setup_logger('suggest_fields')
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='미처리 게시물 캡션에서 공연 정보 제안값 일괄 추출',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+사용 예시:
+  # 제안값이 없거나 이전 버전인 미처리 게시물 추출
+  python admin/suggest_fields.py
+
+  # 최근 30일 미처리 게시물 전체 다시 추출
+  python admin/suggest_fields.py --days 30 --all
+
+  # 저장하지 않고 추출 결과만 확인
+  python admin/suggest_fields.py --dry-run
+        """
+    )
+    parser.add_argument(
+        '--days',
+        type=int,
+        default=None,
+        help='최근 N일 이내 등록된 게시물만 (기본값: 전체)'
+    )
+    parser.add_argument(
+        '--all',
+        action='store_true',
+        help='이미 현재 버전 제안값이 있는 게시물도 다시 추출'
+    )
+    parser.add_argument(
+        '--batch-size',
+        type=int,
+        default=500,
+        help='한 번에 조회/저장할 게시물 수 (기본값: 500)'
+    )
+    parser.add_argument(
+        '--dry-run',
+        action='store_true',
+        help='저장하지 않고 추출 결과만 출력'
+    )
+    args = parser.parse_args()
+
+    db_manager = None
+    try:
+        db_manager = DatabaseManager()
+        processor = PerformanceProcessor(db_manager)
+
+        started = time.perf_counter()
+        processed = saved = 0
+        filled = Counter()
+        after_id = 0
+
+        while True:
+            posts = processor.get_posts_for_suggestions(
+                after_id=after_id,
+                limit=args.batch_size,
+                days=args.days,
+                below_version=None if args.all else PARSER_VERSION
+            )
+            if not posts:
+                break
+            after_id = posts[-1]['id']
+
+            suggestions = list(parse_captions(
+                (post['id'], post['description'], post['created_at']) for post in posts
+            ))
+            processed += len(suggestions)
+            for perform_id, values in suggestions:
+                filled.update(key for key in values if key != 'version')
+                if args.dry_run:
+                    logger.info(f"   [{perform_id}] {values}")
+
+            if not args.dry_run:
+                count = processor.save_suggestions_many(suggestions)
+                if count is None:
+                    logger.error(f"❌ 저장 실패 (ID {posts[0]['id']}~{after_id}), 중단")
+                    break
+                saved += count
+
+            logger.info(f"📝 {processed}개 추출 (마지막 ID: {after_id})")
+
+        elapsed = time.perf_counter() - started
+        logger.info(f"✅ 캡션 추출 완료: {processed}개, 저장 {saved}개 ({elapsed:.1f}s)")
+        for key, count in filled.most_common():
+            rate = count / processed * 100 if processed else 0
+            logger.info(f"   {key}: {count}개 ({rate:.0f}%)")
+        if args.dry_run:
+            logger.info("ℹ️ 확인 모드 - 저장하려면 --dry-run 없이 실행")
+
+    except Exception as e:
+        logger.error(f"❌ 캡션 추출 중 오류: {e}")
+        import traceback
+        logger.error(traceback.format_exc())
+
+    finally:
+        if db_manager:
+            db_manager.close_all_connections()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,245 @@
+"""
+벤치마크용 가짜 외부 서비스 (Instagram API, 이미지 CDN, R2)
+"""
+import random
+import threading
+import time
+import zlib
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from io import BytesIO
+from types import SimpleNamespace
+from typing import Dict, List
+from PIL import Image
+
+
+def make_jpeg(width: int, height: int, quality: int = 85) -> bytes:
+    """
+    실제 게시물 이미지와 비슷한 크기의 JPEG 생성 (그라디언트 + 노이즈)
+
+    Args:
+        width: 가로 크기
+        height: 세로 크기
+        quality: JPEG 품질
+
+    Returns:
+        JPEG 바이너리
+    """
+    gradient = Image.linear_gradient('L').resize((width, height))
+    noise = Image.effect_noise((width, height), 48)
+    img = Image.merge('RGB', (gradient, noise, gradient.rotate(90).resize((width, height))))
+    buffer = BytesIO()
+    img.save(buffer, 'JPEG', quality=quality)
+    return buffer.getvalue()
+
+
+class FakeCDN:
+    def __init__(self, images: List[bytes], latency: float = 0.05, error_rate: float = 0.0):
+        """
+        로컬 HTTP 이미지 서버 (Instagram CDN 대체)
+
+        쿼리스트링을 제외한 요청 경로의 해시로 고른 이미지를 반환한다.
+
+        Args:
+            images: 반환할 이미지 바이너리 목록
+            latency: 응답 지연 (초)
+            error_rate: 503 응답 비율 (재시도 경로 측정용)
+        """
+        cdn = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def do_GET(self):
+                time.sleep(cdn.latency)
+                cdn.requests += 1
+                if cdn.error_rate and random.random() < cdn.error_rate:
+                    self.send_response(503)
+                    self.send_header('Content-Length', '0')
+                    self.end_headers()
+                    return
+                body = cdn.images[zlib.crc32(self.path.split('?')[0].encode()) % len(cdn.images)]
+                self.send_response(200)
+                self.send_header('Content-Type', 'image/jpeg')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        self.images = images
+        self.latency = latency
+        self.error_rate = error_rate
+        self.requests = 0
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self.server.daemon_threads = True
+        self.base_url = f"http://127.0.0.1:{self.server.server_port}"
+        self._thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+
+    def start(self) -> 'FakeCDN':
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+class FakeInstagramClient:
+    def __init__(
+        self,
+        cdn_base_url: str,
+        posts_per_club: int = 5,
+        carousel_ratio: float = 0.5,
+        max_carousel_images: int = 4,
+        video_ratio: float = 0.1,
+        latency: float = 0.2,
+        seed: int = 0
+    ):
+        """
+        instagrapi Client 대체 (수집에 사용하는 메서드만 구현)
+
+        사용자명마다 최근 게시물(단일 이미지/Carousel/영상)을 결정적으로 생성한다.
+
+        Args:
+            cdn_base_url: 이미지 URL 호스트 (FakeCDN.base_url)
+            posts_per_club: 클럽당 게시물 수
+            carousel_ratio: Carousel 게시물 비율
+            max_carousel_images: Carousel 최대 리소스 수
+            video_ratio: 영상 게시물/리소스 비율
+            latency: API 호출 지연 (초)
+            seed: 생성 시드
+        """
+        self.cdn_base_url = cdn_base_url
+        self.posts_per_club = posts_per_club
+        self.carousel_ratio = carousel_ratio
+        self.max_carousel_images = max_carousel_images
+        self.video_ratio = video_ratio
+        self.latency = latency
+        self.seed = seed
+        self.calls: Dict[str, int] = {}
+        self._medias: Dict[str, SimpleNamespace] = {}
+        self._lock = threading.Lock()
+
+    def _call(self, name: str):
+        with self._lock:
+            self.calls[name] = self.calls.get(name, 0) + 1
+        time.sleep(self.latency)
+
+    def user_info_by_username_v1(self, username: str):
+        self._call('user_info_by_username_v1')
+        return SimpleNamespace(pk=zlib.crc32(username.encode()), username=username)
+
+    def user_medias_v1(self, user_id: int, amount: int = 0):
+        self._call('user_medias_v1')
+        rng = random.Random(f"{self.seed}:{user_id}")
+        now = datetime.now(timezone.utc)
+        medias = []
+        for index in range(min(self.posts_per_club, amount or self.posts_per_club)):
+            media = self._make_media(rng, f"B{user_id}x{index}", now - timedelta(hours=6 * index + 1))
+            medias.append(media)
+            with self._lock:
+                self._medias[media.code] = media
+        return medias
+
+    def media_pk_from_code(self, code: str):
+        return code
+
+    def media_info(self, media_pk):
+        self._call('media_info')
+        media = self._medias.get(media_pk)
+        if media is None:
+            media = self._make_media(random.Random(f"{self.seed}:{media_pk}"), media_pk, datetime.now(timezone.utc))
+        return media
+
+    def _make_media(self, rng: random.Random, code: str, taken_at: datetime) -> SimpleNamespace:
+        caption = f"{taken_at:%m/%d} 공연 안내 #{code}\n예매 30,000원 / 현장 35,000원"
+        if rng.random() < self.carousel_ratio:
+            resources = [
+                self._make_resource(rng, code, i)
+                for i in range(rng.randint(2, self.max_carousel_images))
+            ]
+            return SimpleNamespace(
+                code=code, taken_at=taken_at, media_type=8, resources=resources,
+                image_versions2=None, thumbnail_url=None, caption_text=caption
+            )
+
+        media_type = 2 if rng.random() < self.video_ratio else 1
+        return SimpleNamespace(
+            code=code, taken_at=taken_at, media_type=media_type, resources=[],
+            image_versions2={'candidates': [{'url': self._image_url(code, 0)}]},
+            thumbnail_url=None, caption_text=caption
+        )
+
+    def _make_resource(self, rng: random.Random, code: str, index: int) -> SimpleNamespace:
+        media_type = 2 if rng.random() < self.video_ratio else 1
+        return SimpleNamespace(
+            media_type=media_type,
+            image_versions2={'candidates': [{'url': self._image_url(code, index)}]},
+            thumbnail_url=None
+        )
+
+    def _image_url(self, code: str, index: int) -> str:
+        return f"{self.cdn_base_url}/v/t51.2885-15/{code}_{index}_n.jpg?stp=dst-jpg&_nc_sig={random.random():.8f}"
+
+
+class FakeS3Client:
+    def __init__(self, latency: float = 0.03, bandwidth_mbps: float = 0):
+        """
+        boto3 S3 클라이언트 대체 (메모리 저장, R2StorageAdapter.client 교체용)
+
+        Args:
+            latency: 요청당 지연 (초)
+            bandwidth_mbps: 업로드 대역폭 (MB/s, 0이면 제한 없음)
+        """
+        self.latency = latency
+        self.bandwidth_mbps = bandwidth_mbps
+        self.objects: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def _transfer(self, size: int):
+        delay = self.latency
+        if self.bandwidth_mbps:
+            delay += size / (self.bandwidth_mbps * 1024 * 1024)
+        time.sleep(delay)
+
+    def put_object(self, Bucket, Key, Body, ContentType=None, **kwargs):
+        self._transfer(len(Body))
+        with self._lock:
+            self.objects[Key] = len(Body)
+        return {}
+
+    def upload_fileobj(self, Fileobj, Bucket, Key, ExtraArgs=None, Config=None, Callback=None, **kwargs):
+        size = 0
+        while True:
+            chunk = Fileobj.read(1024 * 1024)
+            if not chunk:
+                break
+            size += len(chunk)
+            if Callback:
+                Callback(len(chunk))
+        self._transfer(size)
+        with self._lock:
+            self.objects[Key] = size
+
+    def delete_object(self, Bucket, Key, **kwargs):
+        time.sleep(self.latency)
+        with self._lock:
+            self.objects.pop(Key, None)
+        return {}
+
+    def delete_objects(self, Bucket, Delete, **kwargs):
+        time.sleep(self.latency)
+        with self._lock:
+            for obj in Delete['Objects']:
+                self.objects.pop(obj['Key'], None)
+        return {}
+
+    def generate_presigned_url(self, ClientMethod, Params=None, ExpiresIn=3600, **kwargs):
+        return f"memory://{Params['Bucket']}/{Params['Key']}"
+
+    @property
+    def total_bytes(self) -> int:
+        with self._lock:
+            return sum(self.objects.values())
@@ -0,0 +1,84 @@
+"""
+녹화된 instagrapi 응답으로 게시물 추출 경로 반복 측정 (DB/R2/Instagram 접속 없음)
+
+main.py --record DIR 로 녹화한 디렉토리를 사용한다. 추출 결과의 digest를 함께 출력하므로
+코드 변경 전후 결과가 같은지(회귀 여부) 확인할 수 있다.
+"""
+import argparse
+import hashlib
+import json
+import os
+import sys
+import time
+
+# 파이프라인 로그는 기본적으로 숨김 (LOG_LEVEL=INFO로 확인 가능)
+os.environ.setdefault('LOG_LEVEL', 'WARNING')
+
+# 프로젝트 루트를 path에 추가 (bench 폴더에서 실행 시 대비)
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(current_dir)
+if parent_dir not in sys.path:
+    sys.path.insert(0, parent_dir)
+
+from scraper.instagram_scraper import InstagramScraper
+from scraper.replay import ReplayClient
+from utils.metrics import metrics
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='녹화된 응답으로 게시물 추출 경로 측정',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+사용 예시:
+  # 녹화된 모든 채널을 10회 반복 추출
+  python bench/replay_extract.py recordings/20240101 --repeat 10
+
+  # 특정 채널만
+  python bench/replay_extract.py recordings/20240101 --username hongdaeff --days 7
+        """
+    )
+    parser.add_argument('directory', help='녹화 디렉토리 (main.py --record)')
+    parser.add_argument('--username', action='append', help='대상 채널 (여러 번 지정 가능, 기본값: 녹화된 전체)')
+    parser.add_argument('--days', type=int, default=7, help='수집 기간 (기본값: 7)')
+    parser.add_argument('--repeat', type=int, default=5, help='반복 횟수 (기본값: 5)')
+    args = parser.parse_args()
+
+    client = ReplayClient(args.directory)
+    usernames = args.username or client.usernames()
+    if not usernames:
+        parser.error(f"녹화된 채널이 없습니다: {args.directory}")
+
+    scraper = InstagramScraper(days=args.days, client=client, throttle=False)
+
+    metrics.reset()
+    digest = None
+    durations = []
+    post_count = 0
+    for _ in range(args.repeat):
+        start = time.perf_counter()
+        posts = []
+        for username in usernames:
+            posts.extend(scraper.scrape_channel(username))
+        durations.append(time.perf_counter() - start)
+
+        # 재생 시각에 따라 바뀌는 게시 시각은 제외하고 비교
+        run_digest = hashlib.sha256(json.dumps(
+            [{key: value for key, value in post.items() if key != 'post_date'} for post in posts],
+            ensure_ascii=False, sort_keys=True
+        ).encode('utf-8')).hexdigest()[:16]
+        if digest is not None and run_digest != digest:
+            print(f"⚠️ 반복 간 추출 결과가 다릅니다: {digest} != {run_digest}")
+        digest = run_digest
+        post_count = len(posts)
+
+    durations.sort()
+    print(f"채널 {len(usernames)}개, 게시물 {post_count}개, {args.repeat}회 반복")
+    print(f"  min {durations[0] * 1000:.1f} ms | median {durations[len(durations) // 2] * 1000:.1f} ms "
+          f"| max {durations[-1] * 1000:.1f} ms")
+    print(f"  결과 digest: {digest}")
+    print(f"  posts.extracted: {metrics.snapshot()['counters'].get('posts.extracted', 0)}")
+
+
+if __name__ == "__main__":
+    main()
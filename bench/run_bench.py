@@ -0,0 +1,254 @@
+"""
+오프라인 수집 파이프라인 벤치마크
+
+가짜 Instagram API / 로컬 이미지 CDN / 메모리 R2 / 임시 Postgres 스키마로
+run_bulk_scraping을 실행하고 클럽 수, 동시성 설정별 처리량과 단계별 지연을 측정한다.
+Instagram/R2/운영 DB에는 접속하지 않는다 (Postgres는 벤치마크용 인스턴스 지정).
+"""
+import argparse
+import itertools
+import json
+import os
+import sys
+import time
+from datetime import datetime
+
+# 파이프라인 로그는 기본적으로 숨김 (LOG_LEVEL=INFO로 확인 가능)
+os.environ.setdefault('LOG_LEVEL', 'WARNING')
+
+# 프로젝트 루트를 path에 추가 (bench 폴더에서 실행 시 대비)
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(current_dir)
+if parent_dir not in sys.path:
+    sys.path.insert(0, parent_dir)
+
+import psycopg2
+from fakes import FakeCDN, FakeInstagramClient, FakeS3Client, make_jpeg
+from main import run_bulk_scraping
+from scraper.instagram_scraper import InstagramScraper
+from database.db_manager import DatabaseManager
+from storage.r2_storage import R2StorageAdapter
+from storage.image_manager import ImageManager
+from utils.metrics import metrics
+
+DDL_PATH = os.path.join(parent_dir, 'database', 'tmp_DDL.sql')
+
+# 리포트에 표시할 단계 (metrics 타이머 이름)
+REPORT_STAGES = (
+    'instagram.user_info',
+    'instagram.user_medias',
+    'post.process',
+    'db.check_duplicate_post',
+    'db.insert_performance',
+    'db.insert_performance_image',
+    'image.download',
+    'image.validate',
+    'image.derivatives',
+    'r2.upload',
+)
+
+
+def parse_int_list(value: str):
+    return [int(v) for v in value.split(',') if v.strip()]
+
+
+def create_schema(db_config: dict, schema: str):
+    """벤치마크용 스키마 생성 (club_tb/user_tb 최소 구성 + tmp_DDL.sql)"""
+    with open(DDL_PATH, encoding='utf-8') as f:
+        ddl = f.read().replace('public.', f'{schema}.')
+
+    conn = psycopg2.connect(**db_config)
+    try:
+        with conn, conn.cursor() as cursor:
+            cursor.execute(f'CREATE SCHEMA {schema}')
+            cursor.execute(f'SET search_path TO {schema}')
+            cursor.execute("""
+                CREATE TABLE user_tb (id serial4 PRIMARY KEY, name varchar(100));
+                INSERT INTO user_tb (id, name) VALUES (1, 'bench');
+                CREATE TABLE club_tb (id serial4 PRIMARY KEY, name varchar(100) NOT NULL, sns_links jsonb);
+            """)
+            cursor.execute(ddl)
+    finally:
+        conn.close()
+
+
+def drop_schema(db_config: dict, schema: str):
+    conn = psycopg2.connect(**db_config)
+    try:
+        with conn, conn.cursor() as cursor:
+            cursor.execute(f'DROP SCHEMA IF EXISTS {schema} CASCADE')
+    finally:
+        conn.close()
+
+
+def seed_clubs(db_manager: DatabaseManager, club_count: int):
+    """이전 시나리오 데이터 삭제 후 클럽 club_count개 생성"""
+    conn = db_manager.get_connection()
+    try:
+        with conn.cursor() as cursor:
+            cursor.execute('TRUNCATE perform_img_tmp, perform_tmp, club_tb RESTART IDENTITY CASCADE')
+            for i in range(1, club_count + 1):
+                cursor.execute(
+                    'INSERT INTO club_tb (name, sns_links) VALUES (%s, %s::jsonb)',
+                    (f'bench_club_{i}', json.dumps([{'instagram': f'https://www.instagram.com/bench_club_{i}/'}]))
+                )
+        conn.commit()
+    finally:
+        db_manager.return_connection(conn)
+
+
+def run_scenario(args, db_manager, client, club_count, download_workers, upload_workers) -> dict:
+    seed_clubs(db_manager, club_count)
+
+    s3 = FakeS3Client(latency=args.r2_latency, bandwidth_mbps=args.r2_bandwidth)
+    storage = R2StorageAdapter({
+        'bucket_name': 'bench',
+        'endpoint_url': 'http://127.0.0.1:9',
+        'access_key_id': 'bench',
+        'secret_access_key': 'bench',
+        'upload_workers': upload_workers,
+    })
+    storage.client = s3
+
+    image_manager = ImageManager(
+        storage,
+        config={
+            'download_workers': download_workers,
+            'cache_dir': '',
+            'thumbnail_width': 0 if args.no_derivatives else 480,
+            'webp_enabled': False,
+        },
+        http_config={'pool_maxsize': max(download_workers, 1)}
+    )
+    scraper = InstagramScraper(days=args.days, client=client, throttle=False)
+
+    metrics.reset()
+    start = time.perf_counter()
+    try:
+        collected, stats = run_bulk_scraping(db_manager, scraper, image_manager, club_delay=0)
+    finally:
+        image_manager.close()
+    elapsed = time.perf_counter() - start
+
+    snapshot = metrics.snapshot()
+    timers = snapshot['timers']
+    return {
+        'clubs': club_count,
+        'download_workers': download_workers,
+        'upload_workers': upload_workers,
+        'elapsed_seconds': round(elapsed, 3),
+        'collected': collected,
+        'stats': stats,
+        'posts_per_sec': round(stats['success'] / elapsed, 3) if elapsed else 0,
+        'images_per_sec': round(stats['images_uploaded'] / elapsed, 3) if elapsed else 0,
+        'uploaded_mb': round(s3.total_bytes / 1024 / 1024, 2),
+        # 실제 실행 시 발생했을 Rate limit 대기 (벤치마크에서는 대기하지 않음)
+        'skipped_sleep_seconds': round(sum(
+            timer['sum'] for name, timer in timers.items() if name.startswith('sleep.')
+        ), 1),
+        'stages': {
+            name: {key: timers[name][key] for key in ('count', 'mean', 'max', 'sum')}
+            for name in REPORT_STAGES if name in timers
+        },
+    }
+
+
+def print_result(result: dict):
+    print(f"\n▶ clubs={result['clubs']} download_workers={result['download_workers']} "
+          f"upload_workers={result['upload_workers']}")
+    print(f"  {result['elapsed_seconds']:.2f}s | posts {result['stats']['success']} "
+          f"({result['posts_per_sec']:.2f}/s) | images {result['stats']['images_uploaded']} "
+          f"({result['images_per_sec']:.2f}/s) | failed {result['stats']['failed']}/{result['stats']['images_failed']} "
+          f"| {result['uploaded_mb']} MB")
+    print(f"  운영 환경 대기 시간(생략됨): {result['skipped_sleep_seconds']}s")
+    print(f"  {'stage':<30}{'count':>7}{'mean ms':>10}{'max ms':>10}{'total s':>10}")
+    for name, stage in result['stages'].items():
+        print(f"  {name:<30}{stage['count']:>7}{stage['mean'] * 1000:>10.1f}"
+              f"{stage['max'] * 1000:>10.1f}{stage['sum']:>10.2f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='오프라인 수집 파이프라인 벤치마크',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+사용 예시:
+  # 로컬 Postgres에 임시 스키마를 만들어 실행
+  python bench/run_bench.py --db-host localhost --db-user postgres --db-password postgres
+
+  # 클럽 수 / 다운로드 동시성 조합 측정
+  python bench/run_bench.py --clubs 5,20,50 --download-workers 1,4,8 --output logs/bench.json
+        """
+    )
+    parser.add_argument('--clubs', type=parse_int_list, default=[5, 20], help='클럽 수 목록 (기본값: 5,20)')
+    parser.add_argument('--download-workers', type=parse_int_list, default=[1, 4], help='이미지 다운로드 동시성 목록 (기본값: 1,4)')
+    parser.add_argument('--upload-workers', type=parse_int_list, default=[8], help='R2 업로드 동시성 목록 (기본값: 8)')
+    parser.add_argument('--posts-per-club', type=int, default=5, help='클럽당 게시물 수 (기본값: 5)')
+    parser.add_argument('--days', type=int, default=7, help='수집 기간 (기본값: 7)')
+    parser.add_argument('--api-latency', type=float, default=0.2, help='Instagram API 지연 초 (기본값: 0.2)')
+    parser.add_argument('--cdn-latency', type=float, default=0.05, help='이미지 CDN 지연 초 (기본값: 0.05)')
+    parser.add_argument('--cdn-error-rate', type=float, default=0.0, help='CDN 503 응답 비율 (기본값: 0)')
+    parser.add_argument('--r2-latency', type=float, default=0.03, help='R2 요청 지연 초 (기본값: 0.03)')
+    parser.add_argument('--r2-bandwidth', type=float, default=0, help='R2 업로드 대역폭 MB/s (기본값: 제한 없음)')
+    parser.add_argument('--image-size', type=str, default='1080x1350', help='가짜 이미지 크기 (기본값: 1080x1350)')
+    parser.add_argument('--no-derivatives', action='store_true', help='썸네일 생성 생략')
+    parser.add_argument('--db-host', default=os.getenv('BENCH_DB_HOST', 'localhost'))
+    parser.add_argument('--db-port', default=os.getenv('BENCH_DB_PORT', '5432'))
+    parser.add_argument('--db-name', default=os.getenv('BENCH_DB_NAME', 'postgres'))
+    parser.add_argument('--db-user', default=os.getenv('BENCH_DB_USER', 'postgres'))
+    parser.add_argument('--db-password', default=os.getenv('BENCH_DB_PASSWORD', ''))
+    parser.add_argument('--keep-schema', action='store_true', help='종료 후 임시 스키마 유지')
+    parser.add_argument('--output', type=str, help='결과 JSON 저장 경로')
+    args = parser.parse_args()
+
+    schema = f"bench_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+    db_config = {
+        'host': args.db_host,
+        'port': args.db_port,
+        'database': args.db_name,
+        'user': args.db_user,
+        'password': args.db_password,
+    }
+
+    width, height = (int(v) for v in args.image_size.lower().split('x'))
+    images = [make_jpeg(width, height, quality) for quality in (80, 85, 90)]
+    cdn = FakeCDN(images, latency=args.cdn_latency, error_rate=args.cdn_error_rate).start()
+    client = FakeInstagramClient(
+        cdn.base_url,
+        posts_per_club=args.posts_per_club,
+        latency=args.api_latency
+    )
+
+    create_schema(db_config, schema)
+    db_manager = None
+    results = []
+    try:
+        db_manager = DatabaseManager({**db_config, 'options': f'-c search_path={schema}'})
+
+        scenarios = itertools.product(args.clubs, args.download_workers, args.upload_workers)
+        for club_count, download_workers, upload_workers in scenarios:
+            result = run_scenario(args, db_manager, client, club_count, download_workers, upload_workers)
+            print_result(result)
+            results.append(result)
+    finally:
+        if db_manager:
+            db_manager.close_all_connections()
+        cdn.stop()
+        if args.keep_schema:
+            print(f"\n임시 스키마 유지: {schema}")
+        else:
+            drop_schema(db_config, schema)
+
+    if args.output:
+        os.makedirs(os.path.dirname(args.output) or '.', exist_ok=True)
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump({
+                'schema': schema,
+                'parameters': {key: value for key, value in vars(args).items() if key != 'db_password'},
+                'results': results,
+            }, f, ensure_ascii=False, indent=2)
+        print(f"\n📈 결과 저장: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -10,6 +10,10 @@ INSTAGRAM_PASSWORD = os.getenv('INSTAGRAM_PASSWORD', '')
 # 로그 설정
 LOG_LEVEL = os.getenv('LOG_LEVEL', 'INFO')
 LOG_FILE = 'logs/scraper.log'
+# 로그 형식 (text: 사람이 읽는 형식, json: 한 줄당 JSON 객체)
+LOG_FORMAT = os.getenv('LOG_FORMAT', 'text')
+# 큐 기반 비동기 로깅 (파일/콘솔 쓰기를 별도 스레드에서 처리)
+LOG_ASYNC = os.getenv('LOG_ASYNC', 'true').lower() == 'true'
 
 # 데이터베이스 설정
 DB_CONFIG = {
@@ -20,12 +24,95 @@ DB_CONFIG = {
     'password': os.getenv('DB_PASSWORD', 'litup')
 }
 
+# 관리자 대시보드 통계/클럽 목록 캐시 유지 시간 (초)
+ADMIN_CACHE_TTL = int(os.getenv('ADMIN_CACHE_TTL', '60'))
+
+# 클럽 레지스트리 설정 (Instagram 연동 클럽 메모리 캐시)
+CLUB_REGISTRY_CONFIG = {
+    # 클럽 목록 재조회 주기 (초)
+    'ttl': int(os.getenv('CLUB_REGISTRY_TTL', '300')),
+    # 사용자명 -> Instagram user_id 캐시 파일 (빈 값이면 저장 안 함)
+    'user_id_cache': os.getenv('CLUB_USER_ID_CACHE', 'instagram_user_ids.json')
+}
+
+# 공연 게시물 분류기 설정 (공연 공지가 아닌 게시물 이미지 수집 생략)
+CLASSIFIER_CONFIG = {
+    # off: 분류 안 함 / skip: 낮은 점수 게시물은 저장 안 함 / defer: 저장하되 이미지 수집 보류
+    'mode': os.getenv('POST_CLASSIFIER_MODE', 'off'),
+    # 이 점수(0~1) 미만이면 공연 공지가 아닌 것으로 판단
+    'threshold': float(os.getenv('POST_CLASSIFIER_THRESHOLD', '0.35')),
+    # 'rules' (기본 규칙 기반) 또는 'package.module:ClassName' (PostClassifier 구현체)
+    'classifier': os.getenv('POST_CLASSIFIER', 'rules')
+}
+
 # R2 스토리지 설정
 R2_CONFIG = {
     'bucket_name': os.getenv('R2_BUCKET_NAME', 'litup'),
     'access_key_id': os.getenv('R2_ACCESS_KEY_ID', ''),
     'secret_access_key': os.getenv('R2_SECRET_ACCESS_KEY', ''),
     'endpoint_url': os.getenv('R2_ENDPOINT_URL', ''),
-    'region': os.getenv('R2_REGION', 'auto')
+    'region': os.getenv('R2_REGION', 'auto'),
+    # 업로드 설정 (멀티파트 기준/파트 크기 MB, 파일당 동시 파트 수, 일괄 업로드 동시 수)
+    'multipart_threshold_mb': int(os.getenv('R2_MULTIPART_THRESHOLD_MB', '8')),
+    'multipart_chunksize_mb': int(os.getenv('R2_MULTIPART_CHUNKSIZE_MB', '8')),
+    'max_concurrency': int(os.getenv('R2_MAX_CONCURRENCY', '4')),
+    'upload_workers': int(os.getenv('R2_UPLOAD_WORKERS', '8')),
+    # 클라이언트 전송 설정 (README 'R2 전송 설정' 참고)
+    'max_pool_connections': int(os.getenv('R2_MAX_POOL_CONNECTIONS', '32')),
+    'retry_mode': os.getenv('R2_RETRY_MODE', 'adaptive'),
+    'max_attempts': int(os.getenv('R2_MAX_ATTEMPTS', '5')),
+    'connect_timeout': float(os.getenv('R2_CONNECT_TIMEOUT', '5')),
+    'read_timeout': float(os.getenv('R2_READ_TIMEOUT', '60')),
+    'tcp_keepalive': os.getenv('R2_TCP_KEEPALIVE', 'true').lower() == 'true'
 }
 
+
+# 이미지 처리 설정
+IMAGE_CONFIG = {
+    # 이미지 검증 방식 (header: 헤더 검사 후 판단 불가 시 PIL, pil: 항상 PIL verify)
+    'validation_mode': os.getenv('IMAGE_VALIDATION_MODE', 'header'),
+    # 썸네일 가로 크기(px), 0이면 썸네일 생성 안 함
+    'thumbnail_width': int(os.getenv('IMAGE_THUMBNAIL_WIDTH', '480')),
+    'thumbnail_quality': int(os.getenv('IMAGE_THUMBNAIL_QUALITY', '80')),
+    # 원본 크기 WebP 재인코딩 여부
+    'webp_enabled': os.getenv('IMAGE_WEBP_ENABLED', 'false').lower() == 'true',
+    'webp_quality': int(os.getenv('IMAGE_WEBP_QUALITY', '80')),
+    # 파생 이미지 생성 프로세스 수 (0이면 현재 프로세스에서 처리)
+    'derivative_workers': int(os.getenv('IMAGE_DERIVATIVE_WORKERS', '2')),
+    # 다운로드 이미지 디스크 캐시 (경로 미지정 시 사용 안 함)
+    'cache_dir': os.getenv('IMAGE_CACHE_DIR', ''),
+    'cache_max_mb': int(os.getenv('IMAGE_CACHE_MAX_MB', '1024')),
+    # 게시물 내 이미지 동시 다운로드/업로드 수
+    'download_workers': int(os.getenv('IMAGE_DOWNLOAD_WORKERS', '4'))
+}
+
+# 이미지 다운로드 HTTP 설정
+HTTP_CONFIG = {
+    # 호스트별 커넥션 풀 수 / 풀당 최대 연결 수 (download_workers 이상 권장)
+    'pool_connections': int(os.getenv('HTTP_POOL_CONNECTIONS', '10')),
+    'pool_maxsize': int(os.getenv('HTTP_POOL_MAXSIZE', '16')),
+    # 연결/읽기 타임아웃 (초)
+    'connect_timeout': float(os.getenv('HTTP_CONNECT_TIMEOUT', '5')),
+    'read_timeout': float(os.getenv('HTTP_READ_TIMEOUT', '30')),
+    # 429/5xx 및 연결 오류 재시도 (backoff_factor * 2^n 초 대기)
+    'max_retries': int(os.getenv('HTTP_MAX_RETRIES', '3')),
+    'backoff_factor': float(os.getenv('HTTP_BACKOFF_FACTOR', '0.5')),
+    # HTTP/2 사용 (httpx[http2] 설치 필요)
+    'http2': os.getenv('HTTP_HTTP2', 'false').lower() == 'true'
+}
+
+# 실행 메트릭 리포트 설정
+METRICS_CONFIG = {
+    # 실행별 JSON 리포트 저장 디렉토리 (빈 값이면 저장 안 함)
+    'report_dir': os.getenv('METRICS_REPORT_DIR', 'logs/metrics'),
+    # Prometheus textfile collector 경로 (예: /var/lib/node_exporter/litup_scraper.prom)
+    'prometheus_textfile': os.getenv('METRICS_PROMETHEUS_TEXTFILE', '')
+}
+
+# 프로파일링 설정 (main.py --profile)
+PROFILE_CONFIG = {
+    # 리포트 저장 디렉토리 (pstats, collapsed stacks, 요약 JSON)
+    'output_dir': os.getenv('PROFILE_OUTPUT_DIR', 'logs/profile'),
+    # 샘플링 간격 (초)
+    'sample_interval': float(os.getenv('PROFILE_SAMPLE_INTERVAL', '0.005'))
+}
@@ -0,0 +1,23 @@
+-- club_tb.sns_links의 Instagram 사용자명 추출 함수 + 표현식 인덱스
+-- (DatabaseManager.get_club_by_instagram_handle 인덱스 조회용, PostgreSQL 12+)
+--
+-- sns_links 형식: [{"instagram": "https://www.instagram.com/<username>/"}, ...] 또는 {"instagram": "..."}
+-- lax 모드 JSONPath는 배열을 자동으로 펼치므로 두 형식 모두 첫 번째 instagram 링크를 사용한다.
+-- 반환값은 utils/instagram_url.extract_username과 같은 소문자 사용자명.
+
+CREATE OR REPLACE FUNCTION public.instagram_handle(links jsonb)
+RETURNS text
+LANGUAGE sql
+IMMUTABLE
+PARALLEL SAFE
+AS $$
+    SELECT lower(substring(
+        jsonb_path_query_first(links, 'lax $.instagram') #>> '{}'
+        FROM '(?i)(?:instagram\.com|instagr\.am)/([a-z0-9_.]+)'
+    ))
+$$;
+
+CREATE INDEX IF NOT EXISTS club_tb_instagram_handle_idx ON public.club_tb (public.instagram_handle(sns_links));
+
+-- 확인
+-- EXPLAIN SELECT id FROM public.club_tb WHERE public.instagram_handle(sns_links) = 'hongdaeff';
@@ -0,0 +1,254 @@
+"""
+Instagram 연동 클럽 레지스트리 (실행당 한 번 조회, 메모리에서 조회)
+"""
+import json
+import os
+import tempfile
+import threading
+import time
+from typing import Dict, List, Optional
+from utils.logger import setup_logger
+from utils.instagram_url import extract_username, canonical_profile_url
+from config.settings import CLUB_REGISTRY_CONFIG
+
+logger = setup_logger('club_registry')
+
+
+class ClubRegistry:
+    def __init__(self, db_manager, config: Optional[dict] = None):
+        """
+        클럽 목록을 한 번 조회해 id/이름/Instagram 사용자명 인덱스로 보관
+
+        - 전체 목록(clubs)은 처음 조회할 때 한 번 읽고, 이후 ttl이 지난 뒤 조회하면 그 사이 추가된 클럽(ID 기준)만 읽어 병합한다.
+        - 이름/사용자명 조회는 메모리 인덱스에 없으면 DB 단건 조회(사용자명은 표현식 인덱스)로 찾아 추가한다.
+          이름/URL이 바뀐 기존 클럽도 이 단건 조회로 반영된다.
+        - 사용자명 -> user_id 캐시(user_ids)는 스크래퍼와 공유하며 파일에 저장해 다음 실행에서도 사용한다.
+
+        Args:
+            db_manager: DatabaseManager 인스턴스
+            config: 레지스트리 설정 (기본값: CLUB_REGISTRY_CONFIG)
+        """
+        self.db = db_manager
+        self.config = {**CLUB_REGISTRY_CONFIG, **(config or {})}
+        self.ttl = self.config['ttl']
+
+        self._lock = threading.RLock()
+        self._by_id: Dict[int, Dict] = {}
+        self._by_name: Dict[str, int] = {}
+        self._by_handle: Dict[str, int] = {}
+        self._loaded_at: Optional[float] = None
+
+        self.user_ids: Dict[str, int] = self._load_user_ids()
+
+    # 조회
+
+    def clubs(self) -> List[Dict]:
+        """
+        전체 클럽 목록 (id 순)
+
+        Returns:
+            [{'club_id', 'name', 'instagram_url', 'handle', 'last_post_url'}, ...]
+        """
+        self._refresh_if_stale()
+        with self._lock:
+            return [dict(club) for _, club in sorted(self._by_id.items())]
+
+    def get(self, club_id: int) -> Optional[Dict]:
+        """클럽 ID로 조회"""
+        self._refresh_if_stale()
+        with self._lock:
+            club = self._by_id.get(club_id)
+        return dict(club) if club else None
+
+    def get_by_name(self, name: str) -> Optional[Dict]:
+        """클럽명으로 조회 (앞뒤 공백 무시)"""
+        name = name.strip()
+        return self._lookup(
+            lambda: self._by_id.get(self._by_name.get(name)),
+            lambda: self.db.get_club_by_name(name)
+        )
+
+    def get_by_handle(self, handle: str) -> Optional[Dict]:
+        """Instagram 사용자명으로 조회 (대소문자 무시)"""
+        handle = handle.lower()
+        return self._lookup(
+            lambda: self._by_id.get(self._by_handle.get(handle)),
+            lambda: self.db.get_club_by_instagram_handle(handle)
+        )
+
+    def get_by_url(self, instagram_url: str) -> Optional[Dict]:
+        """Instagram 프로필 URL로 조회"""
+        handle = extract_username(instagram_url)
+        if not handle:
+            logger.error(f"❌ 유효하지 않은 Instagram 프로필 URL: {instagram_url}")
+            return None
+        return self.get_by_handle(handle)
+
+    def resolve(self, target: str) -> Optional[Dict]:
+        """
+        클럽명 또는 Instagram URL로 조회
+
+        Args:
+            target: 클럽명 또는 Instagram URL ('http'로 시작)
+
+        Returns:
+            클럽 정보 또는 None
+        """
+        if target.startswith('http'):
+            return self.get_by_url(target)
+        return self.get_by_name(target)
+
+    def _lookup(self, find, probe) -> Optional[Dict]:
+        """
+        인덱스 조회, 없으면 DB 단건 조회(인덱스 사용) 결과를 인덱스에 추가
+
+        전체 목록을 읽지 않으므로 single/post 모드는 클럽 하나만 조회하고,
+        목록 로드 이후 추가된 클럽도 전체 재조회 없이 찾는다.
+        """
+        if self._loaded_at is not None:
+            self._refresh_if_stale()
+        with self._lock:
+            club = find()
+        if club is None:
+            row = probe()
+            if row is None:
+                return None
+            club = self._add(row)
+        return dict(club)
+
+    # 갱신
+
+    def update_cursor(self, club_id: int, last_post_url: str):
+        """수집 커서(마지막 저장 게시물) 갱신 - 같은 실행의 다음 작업에서 바로 반영"""
+        with self._lock:
+            club = self._by_id.get(club_id)
+            if club:
+                club['last_post_url'] = last_post_url
+
+    def refresh(self):
+        """
+        클럽 목록 전체 재조회 후 병합
+
+        새 클럽은 추가, 사라진 클럽은 제거, 이름/URL 변경은 반영한다.
+        수집 커서는 DB 값(가장 최근 저장 게시물)을 쓰고, DB 값이 없을 때만 메모리 값을 유지한다
+        (dry-run 등 DB에 저장하지 않은 경우).
+        """
+        rows = self.db.get_clubs_with_instagram()
+
+        with self._lock:
+            previous = self._by_id
+            by_id, by_name, by_handle = {}, {}, {}
+            added = changed = 0
+
+            for row in rows:
+                club = _make_club(row)
+
+                old = previous.get(club['club_id'])
+                if old is None:
+                    added += 1
+                else:
+                    if not club['last_post_url']:
+                        club['last_post_url'] = old['last_post_url']
+                    if club != old:
+                        changed += 1
+
+                by_id[club['club_id']] = club
+                by_name.setdefault(club['name'].strip(), club['club_id'])
+                if club['handle']:
+                    by_handle.setdefault(club['handle'], club['club_id'])
+
+            removed = len(set(previous) - set(by_id))
+            self._by_id, self._by_name, self._by_handle = by_id, by_name, by_handle
+            self._loaded_at = time.monotonic()
+
+        if previous:
+            logger.info(f"🔄 클럽 레지스트리 갱신: {len(by_id)}개 (추가 {added}, 변경 {changed}, 제거 {removed})")
+        else:
+            logger.info(f"✅ 클럽 레지스트리 로드: {len(by_id)}개")
+
+    def refresh_new(self):
+        """
+        마지막 조회 이후 추가된 클럽(현재 최대 ID보다 큰 ID)만 조회해 인덱스에 추가
+
+        기존 클럽의 마지막 게시물 서브쿼리를 다시 실행하지 않는다.
+        """
+        with self._lock:
+            last_id = max(self._by_id, default=0)
+
+        rows = self.db.get_clubs_with_instagram(after_id=last_id)
+        for row in rows:
+            self._add(row)
+
+        with self._lock:
+            self._loaded_at = time.monotonic()
+        if rows:
+            logger.info(f"🔄 클럽 레지스트리 갱신: 신규 {len(rows)}개 추가 (총 {len(self._by_id)}개)")
+
+    def _add(self, row: Dict) -> Dict:
+        """
+        DB 조회 결과를 인덱스에 추가
+
+        이미 있으면 이름/URL을 갱신하고(이전 이름/사용자명 키는 제거) 수집 커서는 유지한다.
+        """
+        club = _make_club(row)
+        with self._lock:
+            old = self._by_id.get(club['club_id'])
+            if old:
+                if old['last_post_url']:
+                    club['last_post_url'] = old['last_post_url']
+                old_name = old['name'].strip()
+                if old_name != club['name'].strip() and self._by_name.get(old_name) == club['club_id']:
+                    del self._by_name[old_name]
+                if old['handle'] != club['handle'] and self._by_handle.get(old['handle']) == club['club_id']:
+                    del self._by_handle[old['handle']]
+            self._by_id[club['club_id']] = club
+            self._by_name.setdefault(club['name'].strip(), club['club_id'])
+            if club['handle']:
+                self._by_handle.setdefault(club['handle'], club['club_id'])
+        return club
+
+    def _refresh_if_stale(self):
+        if self._loaded_at is None:
+            self.refresh()
+        elif time.monotonic() - self._loaded_at >= self.ttl:
+            self.refresh_new()
+
+    # user_id 캐시
+
+    def _load_user_ids(self) -> Dict[str, int]:
+        path = self.config['user_id_cache']
+        if not path or not os.path.exists(path):
+            return {}
+        try:
+            with open(path, encoding='utf-8') as f:
+                return {str(handle): int(user_id) for handle, user_id in json.load(f).items()}
+        except (OSError, ValueError, AttributeError) as e:
+            logger.warning(f"⚠️ user_id 캐시 로드 실패 ({path}): {e}")
+            return {}
+
+    def save_user_ids(self):
+        """사용자명 -> user_id 캐시 저장 (임시 파일에 쓴 뒤 교체)"""
+        path = self.config['user_id_cache']
+        if not path:
+            return
+        try:
+            directory = os.path.dirname(path) or '.'
+            os.makedirs(directory, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(dict(sorted(self.user_ids.items())), f, indent=2)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f"⚠️ user_id 캐시 저장 실패 ({path}): {e}")
+
+
+def _make_club(row: Dict) -> Dict:
+    """DB 조회 결과를 레지스트리 항목으로 변환 (URL은 정규화, 사용자명 포함)"""
+    handle = extract_username(row['instagram_url'])
+    return {
+        'club_id': row['club_id'],
+        'name': row['name'],
+        'instagram_url': canonical_profile_url(row['instagram_url']) or row['instagram_url'],
+        'handle': handle,
+        'last_post_url': row['last_post_url'],
+    }
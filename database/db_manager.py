@@ -2,28 +2,42 @@
 PostgreSQL 데이터베이스 관리자
 """
 import psycopg2
+import psycopg2.errors
 from typing import List, Dict, Optional
 import json
+from datetime import datetime
 from psycopg2 import pool
 from utils.logger import setup_logger
+from utils.metrics import metrics
+from utils.instagram_url import extract_username, canonical_post_url, canonical_profile_url
+from utils.caption_parser import parse_caption, caption_hash, SUGGESTION_FIELDS
 from config.settings import DB_CONFIG
 
 logger = setup_logger('db_manager')
 
 
 class DatabaseManager:
-    def __init__(self):
-        """데이터베이스 연결 풀 초기화"""
+    def __init__(self, config: Optional[dict] = None):
+        """
+        데이터베이스 연결 풀 초기화
+        
+        Args:
+            config: DB 접속 정보 (기본값: DB_CONFIG, 'options'로 libpq 옵션 지정 가능)
+        """
+        config = config or DB_CONFIG
+        # public.instagram_handle 함수/인덱스 사용 가능 여부 (첫 조회 실패 시 False)
+        self._handle_index_available = True
         try:
             # 연결 풀 설정 개선
             self.connection_pool = psycopg2.pool.SimpleConnectionPool(
                 minconn=1,
                 maxconn=10,
-                host=DB_CONFIG['host'],
-                port=int(DB_CONFIG['port']),  # 포트를 정수로 변환
-                database=DB_CONFIG['database'],
-                user=DB_CONFIG['user'],
-                password=DB_CONFIG['password'],
+                host=config['host'],
+                port=int(config['port']),  # 포트를 정수로 변환
+                database=config['database'],
+                user=config['user'],
+                password=config['password'],
+                options=config.get('options'),  # 예: '-c search_path=bench'
                 connect_timeout=10,  # 연결 타임아웃 10초
                 keepalives=1,  # TCP keepalive 활성화
                 keepalives_idle=30,  # 30초마다 keepalive 패킷 전송
@@ -31,17 +45,17 @@ class DatabaseManager:
                 keepalives_count=5  # keepalive 재시도 횟수
             )
             logger.info("✅ 데이터베이스 연결 풀 초기화 완료")
-            logger.info(f"   연결 정보: {DB_CONFIG['host']}:{DB_CONFIG['port']}/{DB_CONFIG['database']}")
+            logger.info(f"   연결 정보: {config['host']}:{config['port']}/{config['database']}")
             
             # 연결 테스트
             self._test_connection()
             
         except psycopg2.OperationalError as e:
             logger.error(f"❌ 데이터베이스 연결 실패 (연결 불가)")
-            logger.error(f"   Host: {DB_CONFIG['host']}")
-            logger.error(f"   Port: {DB_CONFIG['port']}")
-            logger.error(f"   Database: {DB_CONFIG['database']}")
-            logger.error(f"   User: {DB_CONFIG['user']}")
+            logger.error(f"   Host: {config['host']}")
+            logger.error(f"   Port: {config['port']}")
+            logger.error(f"   Database: {config['database']}")
+            logger.error(f"   User: {config['user']}")
             logger.error(f"   Error: {e}")
             raise
         except Exception as e:
@@ -78,10 +92,14 @@ class DatabaseManager:
         self.connection_pool.closeall()
         logger.info("✅ 모든 데이터베이스 연결 종료")
 
-    def get_clubs_with_instagram(self) -> List[Dict]:
+    @metrics.timed('db.get_clubs_with_instagram')
+    def get_clubs_with_instagram(self, after_id: int = 0) -> List[Dict]:
         """
         Instagram SNS 링크가 있는 클럽 정보 조회
         
+        Args:
+            after_id: 이 ID보다 큰 클럽만 조회 (기본값: 전체, 레지스트리 증분 갱신용)
+            
         Returns:
             클럽 정보 리스트 [{'club_id': int, 'name': str, 'instagram_url': str, 'last_post_url': str or None}, ...]
         """
@@ -113,11 +131,12 @@ class DatabaseManager:
                     ) as last_post_url
                 FROM club_tb c
                 WHERE c.sns_links IS NOT NULL
-                AND c.sns_links::text LIKE '%instagram%'
+                AND c.sns_links::text LIKE '%%instagram%%'
+                AND c.id > %s
                 order by ID ASC;
             """
             
-            cursor.execute(query)
+            cursor.execute(query, (after_id,))
             rows = cursor.fetchall()
             
             clubs = []
@@ -165,6 +184,7 @@ class DatabaseManager:
             if conn:
                 self.return_connection(conn)
 
+    @metrics.timed('db.get_club_by_name')
     def get_club_by_name(self, name: str) -> Optional[Dict]:
         """
         클럽명으로 클럽 정보 조회
@@ -227,7 +247,7 @@ class DatabaseManager:
             return {
                 'club_id': club_id,
                 'name': name,
-                'instagram_url': instagram_url,
+                'instagram_url': canonical_profile_url(instagram_url) or instagram_url,
                 'last_post_url': last_post_url
             }
             
@@ -240,47 +260,96 @@ class DatabaseManager:
                 cursor.close()
                 self.return_connection(conn)
 
+    @metrics.timed('db.get_club_by_instagram_url')
     def get_club_by_instagram_url(self, instagram_url: str) -> Optional[Dict]:
         """
         Instagram URL로 클럽 정보 조회
         
+        URL을 사용자명으로 정규화한 뒤 get_club_by_instagram_handle로 조회한다
+        (쿼리스트링/대소문자/www 유무와 무관, 다른 계정명의 일부와 일치하지 않음).
+        
         Args:
             instagram_url: Instagram URL
             
         Returns:
             클럽 정보 또는 None
         """
+        username = extract_username(instagram_url)
+        if not username:
+            logger.error(f"❌ 유효하지 않은 Instagram 프로필 URL: {instagram_url}")
+            return None
+        
+        return self.get_club_by_instagram_handle(username)
+
+    @metrics.timed('db.get_club_by_instagram_handle')
+    def get_club_by_instagram_handle(self, username: str) -> Optional[Dict]:
+        """
+        Instagram 사용자명으로 클럽 정보 조회
+        
+        public.instagram_handle(sns_links) 표현식 인덱스로 조회하고
+        (database/club_instagram_handle.sql), 함수가 설치되지 않은 DB에서는
+        sns_links 항목을 순회하는 전체 스캔으로 대신한다.
+        
+        Args:
+            username: Instagram 사용자명 (소문자)
+            
+        Returns:
+            클럽 정보 또는 None
+        """
+        query_template = """
+            SELECT 
+                c.id,
+                c.name,
+                c.sns_links,
+                (
+                    SELECT 
+                        CASE 
+                            WHEN jsonb_typeof(p.sns_links) = 'array' THEN p.sns_links->0->>'instagram'
+                            ELSE p.sns_links->>'instagram'
+                        END
+                    FROM perform_tmp p
+                    WHERE p.club_id = c.id
+                    AND (
+                        (jsonb_typeof(p.sns_links) = 'array' AND p.sns_links->0->>'instagram' IS NOT NULL)
+                        OR (jsonb_typeof(p.sns_links) = 'object' AND p.sns_links->>'instagram' IS NOT NULL)
+                    )
+                    ORDER BY p.created_at DESC
+                    LIMIT 1
+                ) as last_post_url
+            FROM club_tb c
+            WHERE {condition}
+            ORDER BY c.id
+            LIMIT 1;
+        """
+        # 인덱스 조회 (club_tb_instagram_handle_idx)
+        indexed_condition = "public.instagram_handle(c.sns_links) = %s"
+        # 함수 미설치 시 전체 스캔
+        scan_condition = """EXISTS (
+                SELECT 1
+                FROM jsonb_array_elements(
+                    CASE WHEN jsonb_typeof(c.sns_links) = 'array' THEN c.sns_links ELSE jsonb_build_array(c.sns_links) END
+                ) AS link
+                WHERE lower(substring(link->>'instagram' FROM '(?i)(?:instagram\\.com|instagr\\.am)/([a-z0-9_.]+)')) = %s
+            )"""
+        
         conn = None
         try:
             conn = self.get_connection()
             cursor = conn.cursor()
             
-            query = """
-                SELECT 
-                    c.id,
-                    c.name,
-                    c.sns_links,
-                    (
-                        SELECT 
-                            CASE 
-                                WHEN jsonb_typeof(p.sns_links) = 'array' THEN p.sns_links->0->>'instagram'
-                                ELSE p.sns_links->>'instagram'
-                            END
-                        FROM perform_tmp p
-                        WHERE p.club_id = c.id
-                        AND (
-                            (jsonb_typeof(p.sns_links) = 'array' AND p.sns_links->0->>'instagram' IS NOT NULL)
-                            OR (jsonb_typeof(p.sns_links) = 'object' AND p.sns_links->>'instagram' IS NOT NULL)
-                        )
-                        ORDER BY p.created_at DESC
-                        LIMIT 1
-                    ) as last_post_url
-                FROM club_tb c
-                WHERE c.sns_links::text LIKE %s;
-            """
+            row = None
+            if self._handle_index_available:
+                try:
+                    cursor.execute(query_template.format(condition=indexed_condition), (username,))
+                    row = cursor.fetchone()
+                except psycopg2.errors.UndefinedFunction:
+                    conn.rollback()
+                    self._handle_index_available = False
+                    logger.warning("⚠️ public.instagram_handle 함수 없음 - 전체 스캔으로 조회 (database/club_instagram_handle.sql 적용 필요)")
             
-            cursor.execute(query, (f'%{instagram_url}%',))
-            row = cursor.fetchone()
+            if not self._handle_index_available:
+                cursor.execute(query_template.format(condition=scan_condition), (username,))
+                row = cursor.fetchone()
             
             if not row:
                 return None
@@ -290,7 +359,7 @@ class DatabaseManager:
             return {
                 'club_id': club_id,
                 'name': name,
-                'instagram_url': instagram_url,
+                'instagram_url': canonical_profile_url(username),
                 'last_post_url': last_post_url
             }
             
@@ -303,6 +372,7 @@ class DatabaseManager:
                 cursor.close()
                 self.return_connection(conn)
 
+    @metrics.timed('db.insert_performance')
     def insert_performance(self, post_data: Dict) -> Optional[int]:
         """
         공연 정보 삽입
@@ -318,8 +388,9 @@ class DatabaseManager:
             conn = self.get_connection()
             cursor = conn.cursor()
             
-            # sns_links 데이터 준비 (배열 형태로 저장)
+            # sns_links 데이터 준비 (배열 형태로 저장, 중복 확인 키와 같도록 정규화)
             post_url = post_data.get('post_url', '')
+            post_url = canonical_post_url(post_url) or post_url
             sns_links = [
                 {
                     'instagram': post_url
@@ -327,6 +398,22 @@ class DatabaseManager:
             ]
             sns_links_json = json.dumps(sns_links, ensure_ascii=False)
 
+            # 캡션 추출 제안값 (관리자 입력 폼 미리 채우기용, 실패해도 저장은 계속)
+            # 분류기를 거친 게시물은 이미 추출한 값과 분류 결과를 함께 저장
+            suggestions_json = None
+            try:
+                suggestions = post_data.get('suggestions')
+                if suggestions is None:
+                    with metrics.timer('caption.parse'):
+                        suggestions = parse_caption(post_data.get('caption'), post_data.get('post_date'))
+                if post_data.get('classification'):
+                    suggestions = {**suggestions, 'classification': post_data['classification']}
+                if post_data.get('images_deferred'):
+                    suggestions = {**suggestions, 'images_deferred': True}
+                suggestions_json = json.dumps(suggestions, ensure_ascii=False)
+            except Exception as e:
+                logger.warning(f"⚠️ 캡션 추출 실패: {e}")
+
             # INSERT 쿼리
             insert_query = """
                 INSERT INTO perform_tmp (
@@ -334,9 +421,11 @@ class DatabaseManager:
                     user_id, 
                     sns_links, 
                     is_cancelled, 
-                    description
+                    description,
+                    suggestions,
+                    caption_hash
                 ) VALUES (
-                    %s, %s, %s::jsonb, %s, %s
+                    %s, %s, %s::jsonb, %s, %s, %s::jsonb, %s
                 )
                 RETURNING id;
             """
@@ -346,7 +435,9 @@ class DatabaseManager:
                 1,  # user_id는 임시로 1로 고정
                 sns_links_json,
                 False,
-                post_data.get('caption', '')
+                post_data.get('caption', ''),
+                suggestions_json,
+                caption_hash(post_data.get('caption', ''))
             ))
 
             # 삽입된 ID 가져오기
@@ -375,6 +466,7 @@ class DatabaseManager:
                 cursor.close()
                 self.return_connection(conn)
 
+    @metrics.timed('db.check_duplicate_post')
     def check_duplicate_post(self, instagram_url: str, club_id: int) -> bool:
         """
         중복 게시물 확인
@@ -386,29 +478,35 @@ class DatabaseManager:
         Returns:
             중복이면 True, 아니면 False
         """
+        # 저장 시와 같은 형태로 정규화 (/reel/, 쿼리스트링 등)
+        instagram_url = canonical_post_url(instagram_url) or instagram_url
+        
         conn = None
         try:
             conn = self.get_connection()
             cursor = conn.cursor()
 
             # sns_links가 배열 또는 객체 형식 모두 지원
+            # (배열에 ->>'instagram', 객체에 ->0 은 NULL이므로 타입 검사 없이 두 표현식 인덱스 사용 가능)
             query = """
-                SELECT COUNT(*) 
-                FROM perform_tmp
-                WHERE club_id = %s
-                AND (
-                    (jsonb_typeof(sns_links) = 'array' AND sns_links->0->>'instagram' = %s)
-                    OR (jsonb_typeof(sns_links) = 'object' AND sns_links->>'instagram' = %s)
+                SELECT EXISTS (
+                    SELECT 1
+                    FROM perform_tmp
+                    WHERE club_id = %s
+                    AND (
+                        sns_links->0->>'instagram' = %s
+                        OR sns_links->>'instagram' = %s
+                    )
                 );
             """
 
             cursor.execute(query, (club_id, instagram_url, instagram_url))
-            count = cursor.fetchone()[0]
+            exists = cursor.fetchone()[0]
 
-            if count > 0:
+            if exists:
                 logger.info(f"   🔍 중복 확인: 이미 존재함 ({instagram_url})")
             
-            return count > 0
+            return exists
 
         except Exception as e:
             logger.error(f"❌ 중복 확인 오류: {e}")
@@ -419,12 +517,204 @@ class DatabaseManager:
                 cursor.close()
                 self.return_connection(conn)
 
+    @metrics.timed('db.get_caption_hashes')
+    def get_caption_hashes(self, club_id: int, post_urls: List[str]) -> Optional[Dict[str, Dict]]:
+        """
+        저장된 게시물의 캡션 해시 일괄 조회 (캡션 변경 감지용)
+        
+        caption_hash가 없는 기존 행은 md5(description)으로 대신한다.
+        
+        Args:
+            club_id: 클럽 ID
+            post_urls: 게시물 URL 리스트
+            
+        Returns:
+            {정규화된 게시물 URL: {'perform_id', 'caption_hash'}} (저장되지 않은 게시물은 없음), 실패 시 None
+        """
+        urls = list(dict.fromkeys(canonical_post_url(url) or url for url in post_urls))
+        if not urls:
+            return {}
+        
+        conn = None
+        try:
+            conn = self.get_connection()
+            cursor = conn.cursor()
+            
+            # check_duplicate_post와 같은 표현식 인덱스 사용
+            query = """
+                SELECT
+                    id,
+                    COALESCE(sns_links->0->>'instagram', sns_links->>'instagram') AS post_url,
+                    COALESCE(caption_hash, md5(COALESCE(description, ''))) AS caption_hash
+                FROM perform_tmp
+                WHERE club_id = %s
+                AND (
+                    sns_links->0->>'instagram' = ANY(%s)
+                    OR sns_links->>'instagram' = ANY(%s)
+                )
+                ORDER BY id;
+            """
+            cursor.execute(query, (club_id, urls, urls))
+            
+            return {
+                post_url: {'perform_id': perform_id, 'caption_hash': stored_hash}
+                for perform_id, post_url, stored_hash in cursor.fetchall()
+            }
+            
+        except Exception as e:
+            logger.error(f"❌ 캡션 해시 조회 오류: {e}")
+            return None
+            
+        finally:
+            if conn:
+                cursor.close()
+                self.return_connection(conn)
+
+    @metrics.timed('db.update_captions')
+    def update_captions(self, updates: List[Dict]) -> Optional[int]:
+        """
+        변경된 캡션 일괄 갱신 (description, caption_hash, 캡션 추출 제안값)
+        
+        관리자가 입력한 값(title 등)과 이미지는 그대로 두고, 제안값은 캡션 추출 항목만 교체한 뒤
+        caption_updated_at을 기록해 대시보드에서 확인할 수 있게 한다.
+        
+        Args:
+            updates: [{'perform_id', 'caption', 'post_date'}, ...]
+            
+        Returns:
+            갱신된 행 수, 실패 시 None
+        """
+        if not updates:
+            return 0
+        
+        ids, captions, hashes, suggestions = [], [], [], []
+        updated_at = datetime.now().isoformat(timespec='seconds')
+        for update in updates:
+            caption = update.get('caption') or ''
+            ids.append(update['perform_id'])
+            captions.append(caption)
+            hashes.append(caption_hash(caption))
+            suggestions.append(json.dumps(
+                {**parse_caption(caption, update.get('post_date')), 'caption_updated_at': updated_at},
+                ensure_ascii=False
+            ))
+        
+        conn = None
+        try:
+            conn = self.get_connection()
+            cursor = conn.cursor()
+            
+            query = """
+                UPDATE perform_tmp p
+                SET
+                    description = v.description,
+                    caption_hash = v.caption_hash,
+                    suggestions = (COALESCE(p.suggestions, '{}'::jsonb) - %s::text[]) || v.suggestions,
+                    updated_at = NOW()
+                FROM unnest(%s::int4[], %s::text[], %s::text[], %s::jsonb[])
+                    AS v(id, description, caption_hash, suggestions)
+                WHERE p.id = v.id;
+            """
+            cursor.execute(query, (list(SUGGESTION_FIELDS), ids, captions, hashes, suggestions))
+            updated_count = cursor.rowcount
+            conn.commit()
+            
+            logger.info(f"✏️ 캡션 갱신 완료: {updated_count}개")
+            return updated_count
+            
+        except Exception as e:
+            if conn:
+                conn.rollback()
+            logger.error(f"❌ 캡션 갱신 오류: {e}")
+            return None
+            
+        finally:
+            if conn:
+                cursor.close()
+                self.return_connection(conn)
+
+    @metrics.timed('db.get_deferred_posts')
+    def get_deferred_posts(self, club_id: Optional[int] = None, days: Optional[int] = None) -> Optional[List[Dict]]:
+        """
+        이미지 수집을 보류한 게시물 조회 (분류기 defer 모드로 저장된 게시물)
+        
+        Args:
+            club_id: 클럽 ID (기본값: 전체)
+            days: 최근 N일 이내 저장된 게시물만 (기본값: 전체)
+            
+        Returns:
+            [{'perform_id', 'club_id', 'post_url'}, ...] (ID 순), 실패 시 None
+        """
+        conn = None
+        try:
+            conn = self.get_connection()
+            cursor = conn.cursor()
+            
+            query = """
+                SELECT
+                    id,
+                    club_id,
+                    COALESCE(sns_links->0->>'instagram', sns_links->>'instagram') AS post_url
+                FROM perform_tmp
+                WHERE suggestions @> '{"images_deferred": true}'::jsonb
+                AND (%s::int4 IS NULL OR club_id = %s::int4)
+                AND (%s::int4 IS NULL OR created_at >= NOW() - make_interval(days => %s::int4))
+                ORDER BY id;
+            """
+            cursor.execute(query, (club_id, club_id, days, days))
+            
+            return [
+                {'perform_id': perform_id, 'club_id': row_club_id, 'post_url': post_url}
+                for perform_id, row_club_id, post_url in cursor.fetchall()
+            ]
+            
+        except Exception as e:
+            logger.error(f"❌ 이미지 보류 게시물 조회 오류: {e}")
+            return None
+            
+        finally:
+            if conn:
+                cursor.close()
+                self.return_connection(conn)
+
+    @metrics.timed('db.clear_images_deferred')
+    def clear_images_deferred(self, perform_id: int) -> bool:
+        """
+        이미지 보류 표시 해제 (보류했던 이미지를 수집한 뒤 호출, 분류 결과는 유지)
+        
+        Returns:
+            성공 여부
+        """
+        conn = None
+        try:
+            conn = self.get_connection()
+            cursor = conn.cursor()
+            
+            cursor.execute(
+                "UPDATE perform_tmp SET suggestions = suggestions - 'images_deferred' WHERE id = %s;",
+                (perform_id,)
+            )
+            conn.commit()
+            return True
+            
+        except Exception as e:
+            if conn:
+                conn.rollback()
+            logger.error(f"❌ 이미지 보류 해제 오류 (ID: {perform_id}): {e}")
+            return False
+            
+        finally:
+            if conn:
+                cursor.close()
+                self.return_connection(conn)
+
+    @metrics.timed('db.insert_performance_image')
     def insert_performance_image(self, image_data: Dict) -> Optional[int]:
         """
         공연 이미지 정보 삽입
         
         Args:
-            image_data: 이미지 데이터
+            image_data: 이미지 데이터 (파생 이미지는 variant, parent_id 포함)
             
         Returns:
             삽입된 이미지 ID 또는 None
@@ -441,9 +731,11 @@ class DatabaseManager:
                     file_size,
                     original_name,
                     is_main,
+                    variant,
+                    parent_id,
                     created_at
                 ) VALUES (
-                    %s, %s, %s, %s, %s, NOW()
+                    %s, %s, %s, %s, %s, %s, %s, NOW()
                 )
                 RETURNING id;
             """
@@ -453,7 +745,9 @@ class DatabaseManager:
                 image_data['file_path'],
                 image_data['file_size'],
                 image_data['original_name'],
-                image_data.get('is_main', True)
+                image_data.get('is_main', True),
+                image_data.get('variant', 'original'),
+                image_data.get('parent_id')
             ))
 
             image_id = cursor.fetchone()[0]
@@ -0,0 +1,61 @@
+"""
+DB 쓰기를 하지 않는 데이터베이스 관리자 (--dry-run)
+"""
+import itertools
+import threading
+from typing import Dict, List, Optional
+from utils.logger import setup_logger
+from utils.metrics import metrics
+from database.db_manager import DatabaseManager
+
+logger = setup_logger('db_dry_run')
+
+
+class DryRunDatabaseManager(DatabaseManager):
+    def __init__(self, config: Optional[dict] = None):
+        """
+        조회(클럽 목록, 중복 확인)는 실제 DB에서 하고 INSERT는 생략하는 관리자
+
+        INSERT 메서드는 같은 메트릭 이름으로 시간을 기록하고 가짜 ID를 반환한다.
+        실행 중 '저장한' 게시물은 기억해 두었다가 중복 확인에 반영한다.
+
+        Args:
+            config: DB 접속 정보 (기본값: DB_CONFIG)
+        """
+        super().__init__(config)
+        self._ids = itertools.count(1)
+        self._inserted_posts = set()
+        self._lock = threading.Lock()
+        logger.info("🧪 DRY-RUN: DB 쓰기 비활성화 (조회만 수행)")
+
+    def check_duplicate_post(self, instagram_url: str, club_id: int) -> bool:
+        with self._lock:
+            if (club_id, instagram_url) in self._inserted_posts:
+                return True
+        return super().check_duplicate_post(instagram_url, club_id)
+
+    @metrics.timed('db.insert_performance')
+    def insert_performance(self, post_data: Dict) -> Optional[int]:
+        with self._lock:
+            self._inserted_posts.add((post_data.get('club_id'), post_data.get('post_url')))
+            perform_id = next(self._ids)
+        logger.info(f"🧪 DRY-RUN 공연 정보 저장 생략 (가짜 ID: {perform_id})")
+        return perform_id
+
+    @metrics.timed('db.insert_performance_image')
+    def insert_performance_image(self, image_data: Dict) -> Optional[int]:
+        with self._lock:
+            image_id = next(self._ids)
+        logger.debug("🧪 DRY-RUN 이미지 정보 저장 생략: %s", image_data.get('file_path'))
+        return image_id
+
+    @metrics.timed('db.update_captions')
+    def update_captions(self, updates: List[Dict]) -> Optional[int]:
+        for update in updates:
+            logger.info(f"🧪 DRY-RUN 캡션 갱신 생략 (ID: {update['perform_id']})")
+        return len(updates)
+
+    @metrics.timed('db.clear_images_deferred')
+    def clear_images_deferred(self, perform_id: int) -> bool:
+        logger.info(f"🧪 DRY-RUN 이미지 보류 해제 생략 (ID: {perform_id})")
+        return True
@@ -0,0 +1,22 @@
+-- 파생 이미지(thumbnail / webp) 컬럼 추가 (storage/image_manager.py, DatabaseManager.insert_performance_image)
+-- 기존 DB에서 수집 실행 전 한 번 실행 (여러 번 실행해도 안전)
+--
+--   psql -h <host> -U <user> -d <db> -f database/migrations/001_perform_img_tmp_variants.sql
+
+ALTER TABLE public.perform_img_tmp ADD COLUMN IF NOT EXISTS variant varchar(20) DEFAULT 'original' NULL;
+ALTER TABLE public.perform_img_tmp ADD COLUMN IF NOT EXISTS parent_id int4 NULL;
+
+DO $$
+BEGIN
+    IF NOT EXISTS (
+        SELECT 1 FROM pg_constraint
+        WHERE conname = 'perform_img_tmp_parent_id_fkey'
+          AND conrelid = 'public.perform_img_tmp'::regclass
+    ) THEN
+        ALTER TABLE public.perform_img_tmp ADD CONSTRAINT perform_img_tmp_parent_id_fkey
+            FOREIGN KEY (parent_id) REFERENCES public.perform_img_tmp(id) ON DELETE CASCADE;
+    END IF;
+END
+$$;
+
+CREATE INDEX IF NOT EXISTS perform_img_tmp_parent_id_idx ON public.perform_img_tmp (parent_id);
@@ -0,0 +1,6 @@
+-- 캡션 추출 제안값 컬럼 추가 (utils/caption_parser.py, DatabaseManager.insert_performance, 대시보드 get_posts)
+-- 기존 DB에서 수집/대시보드 실행 전 한 번 실행 (여러 번 실행해도 안전)
+--
+--   psql -h <host> -U <user> -d <db> -f database/migrations/002_perform_tmp_suggestions.sql
+
+ALTER TABLE public.perform_tmp ADD COLUMN IF NOT EXISTS suggestions jsonb NULL;
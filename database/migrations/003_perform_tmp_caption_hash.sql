@@ -0,0 +1,7 @@
+-- 캡션 변경 감지용 해시 컬럼 추가 (DatabaseManager.insert_performance, main.py --mode refresh)
+-- 기존 DB에서 수집 실행 전 한 번 실행 (여러 번 실행해도 안전)
+-- 기존 행은 비워 두며, refresh 모드는 caption_hash가 없으면 md5(description)으로 비교한다.
+--
+--   psql -h <host> -U <user> -d <db> -f database/migrations/003_perform_tmp_caption_hash.sql
+
+ALTER TABLE public.perform_tmp ADD COLUMN IF NOT EXISTS caption_hash bpchar(32) NULL;
@@ -0,0 +1,7 @@
+-- 중복 확인/캡션 해시 조회용 표현식 인덱스 (DatabaseManager.check_duplicate_post, get_caption_hashes)
+-- 기존 DB에서 한 번 실행 (여러 번 실행해도 안전, 없어도 동작하지만 게시물마다 순차 검색)
+--
+--   psql -h <host> -U <user> -d <db> -f database/migrations/004_perform_tmp_duplicate_indexes.sql
+
+CREATE INDEX IF NOT EXISTS perform_tmp_club_instagram_idx ON public.perform_tmp (club_id, ((sns_links->0->>'instagram')));
+CREATE INDEX IF NOT EXISTS perform_tmp_club_instagram_obj_idx ON public.perform_tmp (club_id, ((sns_links->>'instagram')));
@@ -13,11 +13,16 @@ CREATE TABLE public.perform_tmp (
 	sns_links jsonb NULL,
 	onsite_price int4 DEFAULT 0 NULL,
 	booking_url varchar(255) NULL,
+	suggestions jsonb NULL,
+	caption_hash bpchar(32) NULL,
 	CONSTRAINT perform_tmp_pkey PRIMARY KEY (id)
 );
 
 ALTER TABLE public.perform_tmp ADD CONSTRAINT perform_tmp_club_id_fkey FOREIGN KEY (club_id) REFERENCES public.club_tb(id);
 ALTER TABLE public.perform_tmp ADD CONSTRAINT perform_tmp_user_id_fkey FOREIGN KEY (user_id) REFERENCES public.user_tb(id);
+-- 중복 확인 (club_id + 정규화된 게시물 URL, sns_links 배열/객체 형식 각각)
+CREATE INDEX perform_tmp_club_instagram_idx ON public.perform_tmp (club_id, ((sns_links->0->>'instagram')));
+CREATE INDEX perform_tmp_club_instagram_obj_idx ON public.perform_tmp (club_id, ((sns_links->>'instagram')));
 
 
 CREATE TABLE public.perform_img_tmp (
@@ -29,7 +34,14 @@ CREATE TABLE public.perform_img_tmp (
 	is_main bool NULL,
 	original_name varchar(255) NULL,
 	file_size int8 NULL,
+	variant varchar(20) DEFAULT 'original' NULL,
+	parent_id int4 NULL,
 	CONSTRAINT perform_img_tmp_pkey PRIMARY KEY (id)
 );
 
-ALTER TABLE public.perform_img_tmp ADD CONSTRAINT perform_img_tmp_perform_id_fkey FOREIGN KEY (perform_id) REFERENCES public.perform_tmp(id);
\ No newline at end of file
+ALTER TABLE public.perform_img_tmp ADD CONSTRAINT perform_img_tmp_perform_id_fkey FOREIGN KEY (perform_id) REFERENCES public.perform_tmp(id);
+ALTER TABLE public.perform_img_tmp ADD CONSTRAINT perform_img_tmp_parent_id_fkey FOREIGN KEY (parent_id) REFERENCES public.perform_img_tmp(id) ON DELETE CASCADE;
+CREATE INDEX perform_img_tmp_parent_id_idx ON public.perform_img_tmp (parent_id);
+
+
+-- 기존 DB 마이그레이션은 database/migrations/ 참고 (README '업그레이드')
@@ -1,41 +1,66 @@
 """
 Instagram 공연 정보 수집 메인 스크립트
 """
+import os
 import time
 import argparse
 from datetime import datetime
 from scraper.instagram_scraper import InstagramScraper
+from scraper.replay import ReplayClient
+from scraper.post_classifier import PostFilter, CLASSIFIER_MODES
 from database.db_manager import DatabaseManager
+from database.dry_run import DryRunDatabaseManager
+from database.club_registry import ClubRegistry
 from storage.r2_storage import R2StorageAdapter
+from storage.null_storage import NullStorageAdapter
 from storage.image_manager import ImageManager
-from config.settings import R2_CONFIG
+from config.settings import R2_CONFIG, METRICS_CONFIG, CLASSIFIER_CONFIG
 from utils.logger import setup_logger
+from utils.metrics import metrics
+from utils.profiling import RunProfiler, PROFILE_KINDS
+from utils.instagram_url import canonical_post_url
+from utils.caption_parser import caption_hash
 
 logger = setup_logger('main')
 
 
-def process_single_post(post, db_manager, image_manager, club_id):
+@metrics.timed('post.process')
+def process_single_post(post, db_manager, image_manager, club_id, post_filter=None):
     """
     단일 게시물 처리 (DB 저장 + 여러 이미지 업로드)
     
+    Args:
+        post_filter: PostFilter (지정 시 공연 공지가 아닌 게시물은 저장 생략 또는 이미지 수집 보류)
+    
     Returns:
         처리 결과 딕셔너리
     """
     result = {
         'success': False,
         'skipped': False,
+        'filtered': False,
         'images_uploaded': 0,
         'images_failed': 0,
         'error': None
     }
     
     try:
-        # 중복 확인
+        # 중복 확인 (이미 저장된 게시물은 분류하지 않음)
         if db_manager.check_duplicate_post(post.get('post_url'), club_id):
             logger.info(f"⚠️ 중복 게시물 건너뛰기: {post.get('post_url')}")
             result['skipped'] = True
             return result
         
+        # 공연 공지 분류
+        action = post_filter.apply(post) if post_filter else None
+        if action == 'skip':
+            result['filtered'] = True
+            return result
+        
+        if action == 'defer':
+            result['filtered'] = True
+            post['images_deferred'] = True
+        
         # 공연 정보 저장
         perform_id = db_manager.insert_performance(post)
         
@@ -45,33 +70,10 @@ def process_single_post(post, db_manager, image_manager, club_id):
             # 여러 이미지 다운로드 및 업로드
             image_urls = post.get('image_urls', [])  # 복수형으로 변경
             
-            if image_urls:
-                logger.info(f"\n🖼️ 이미지 처리 시작 (총 {len(image_urls)}개)...")
-                
-                # download_and_upload_multiple_images 사용
-                image_results = image_manager.download_and_upload_multiple_images(
-                    image_urls=image_urls,
-                    perform_id=perform_id
-                )
-                
-                # 각 이미지 결과를 DB에 저장
-                for img_result in image_results:
-                    image_id = db_manager.insert_performance_image(img_result)
-                    
-                    if image_id:
-                        result['images_uploaded'] += 1
-                    else:
-                        result['images_failed'] += 1
-                
-                # 실패한 이미지 수 계산
-                result['images_failed'] += (len(image_urls) - len(image_results))
-                
-                logger.info(f"✅ 이미지 업로드 완료: {result['images_uploaded']}/{len(image_urls)}개")
-                
-                if result['images_failed'] > 0:
-                    logger.warning(f"⚠️ 이미지 업로드 실패: {result['images_failed']}개")
+            if post.get('images_deferred'):
+                logger.info(f"⏸️ 이미지 수집 보류 ({len(image_urls)}개) - --mode deferred로 나중에 수집")
             else:
-                logger.info("ℹ️ 이미지 URL 없음")
+                upload_post_images(image_urls, perform_id, db_manager, image_manager, result)
         else:
             result['error'] = "공연 정보 저장 실패"
             logger.warning(f"⚠️ 공연 정보 저장 실패")
@@ -83,32 +85,139 @@ def process_single_post(post, db_manager, image_manager, club_id):
     return result
 
 
-def run_bulk_scraping(db_manager, scraper, image_manager):
-    """일괄 스크래핑 모드"""
+def upload_post_images(image_urls, perform_id, db_manager, image_manager, result):
+    """
+    게시물 이미지 다운로드/업로드 후 DB 저장 (result의 images_uploaded/images_failed에 누적)
+    """
+    if not image_urls:
+        logger.info("ℹ️ 이미지 URL 없음")
+        return
+    
+    logger.info(f"\n🖼️ 이미지 처리 시작 (총 {len(image_urls)}개)...")
+    
+    # download_and_upload_multiple_images 사용
+    image_results = image_manager.download_and_upload_multiple_images(
+        image_urls=image_urls,
+        perform_id=perform_id
+    )
+    
+    uploaded = failed = 0
+    
+    # 각 이미지 결과를 DB에 저장
+    for img_result in image_results:
+        image_id = db_manager.insert_performance_image(img_result)
+        
+        if image_id:
+            uploaded += 1
+            
+            # 파생 이미지 (썸네일/WebP)는 원본 이미지에 연결
+            for derivative in img_result.get('derivatives', []):
+                derivative['parent_id'] = image_id
+                db_manager.insert_performance_image(derivative)
+        else:
+            failed += 1
+    
+    # 실패한 이미지 수 계산
+    failed += (len(image_urls) - len(image_results))
+    
+    result['images_uploaded'] += uploaded
+    result['images_failed'] += failed
+    
+    logger.info(f"✅ 이미지 업로드 완료: {uploaded}/{len(image_urls)}개")
+    
+    if failed > 0:
+        logger.warning(f"⚠️ 이미지 업로드 실패: {failed}개")
+
+
+def new_stats() -> dict:
+    """집계용 빈 통계 딕셔너리"""
+    return {
+        'success': 0,
+        'skipped': 0,
+        'filtered': 0,
+        'failed': 0,
+        'images_uploaded': 0,
+        'images_failed': 0
+    }
+
+
+def accumulate_stats(total_stats: dict, result: dict):
+    """process_single_post 결과를 통계에 누적 (이미지 보류 게시물은 filtered와 success에 모두 집계)"""
+    if result['filtered']:
+        total_stats['filtered'] += 1
+    
+    if result['skipped']:
+        total_stats['skipped'] += 1
+    elif result['success']:
+        total_stats['success'] += 1
+        total_stats['images_uploaded'] += result['images_uploaded']
+        total_stats['images_failed'] += result['images_failed']
+    elif not result['filtered']:
+        total_stats['failed'] += 1
+
+
+def collect_club_posts(club, db_manager, scraper, image_manager, total_stats, club_registry=None, post_filter=None):
+    """
+    클럽의 새 게시물을 추출되는 즉시 처리하고 통계에 누적
+    
+    저장에 성공한 가장 최신 게시물(첫 번째)로 레지스트리의 수집 커서를 갱신한다.
+    
+    Returns:
+        수집된 게시물 수
+    """
+    collected = 0
+    newest_post_url = None
+    
+    # 게시물 수집 (마지막 저장 게시물 이후 + 날짜 범위 내) - 추출되는 즉시 처리
+    for post in scraper.iter_channel_posts_by_url(
+        instagram_url=club['instagram_url'],
+        last_post_url=club['last_post_url']
+    ):
+        # club_id 추가
+        post['club_id'] = club['club_id']
+        collected += 1
+        
+        result = process_single_post(post, db_manager, image_manager, club['club_id'], post_filter)
+        accumulate_stats(total_stats, result)
+        
+        if result['success'] and newest_post_url is None:
+            newest_post_url = post['post_url']
+    
+    if club_registry and newest_post_url:
+        club_registry.update_cursor(club['club_id'], newest_post_url)
+    
+    return collected
+
+
+def run_bulk_scraping(db_manager, scraper, image_manager, club_delay=5, club_registry=None, post_filter=None):
+    """
+    일괄 스크래핑 모드
+    
+    Args:
+        club_delay: 클럽 간 대기 시간 (초)
+        club_registry: ClubRegistry (기본값: db_manager로 새로 생성)
+        post_filter: PostFilter (공연 공지 분류, 기본값: 분류 안 함)
+    """
     logger.info(f"{'='*60}")
     logger.info("🔄 일괄 스크래핑 모드")
     logger.info(f"{'='*60}\n")
     
-    # DB에서 Instagram 연동 클럽 목록 가져오기
-    clubs = db_manager.get_clubs_with_instagram()
+    club_registry = club_registry or ClubRegistry(db_manager)
+    
+    # Instagram 연동 클럽 목록 (레지스트리 - 실행당 한 번 DB 조회)
+    clubs = club_registry.clubs()
     
     if not clubs:
         logger.error("❌ Instagram 연동 클럽이 없습니다")
-        return [], {'success': 0, 'skipped': 0, 'failed': 0, 'images_uploaded': 0, 'images_failed': 0}
+        return 0, new_stats()
     
     logger.info(f"📊 총 {len(clubs)}개 클럽 발견")
     for club in clubs:
         last_post_info = f" (마지막 저장: {club['last_post_url']})" if club['last_post_url'] else " (신규 클럽)"
         logger.info(f"   - {club['name']} (ID: {club['club_id']}){last_post_info}")
     
-    all_posts = []
-    total_stats = {
-        'success': 0,
-        'skipped': 0,
-        'failed': 0,
-        'images_uploaded': 0,
-        'images_failed': 0
-    }
+    total_collected = 0
+    total_stats = new_stats()
     
     for i, club in enumerate(clubs, 1):
         try:
@@ -122,67 +231,47 @@ def run_bulk_scraping(db_manager, scraper, image_manager):
             
             logger.info("-" * 60)
             
-            # 게시물 수집 (마지막 저장 게시물 이후 + 날짜 범위 내)
-            posts = scraper.scrape_channel_by_url(
-                instagram_url=club['instagram_url'],
-                last_post_url=club['last_post_url']
+            collected = collect_club_posts(
+                club, db_manager, scraper, image_manager, total_stats, club_registry, post_filter
             )
+            total_collected += collected
             
-            # club_id 추가
-            for post in posts:
-                post['club_id'] = club['club_id']
-            
-            logger.info(f"📊 {club['name']} 수집 완료: {len(posts)}개 새 게시물")
-            
-            # 게시물 처리
-            if posts:
-                for post in posts:
-                    result = process_single_post(post, db_manager, image_manager, club['club_id'])
-                    
-                    if result['skipped']:
-                        total_stats['skipped'] += 1
-                    elif result['success']:
-                        total_stats['success'] += 1
-                        total_stats['images_uploaded'] += result['images_uploaded']
-                        total_stats['images_failed'] += result['images_failed']
-                    else:
-                        total_stats['failed'] += 1
+            if collected:
+                logger.info(f"📊 {club['name']} 수집 완료: {collected}개 새 게시물")
             else:
                 logger.info(f"ℹ️ {club['name']}: 새로운 게시물 없음")
             
-            all_posts.extend(posts)
-            
             # 클럽 간 딜레이
             if i < len(clubs):
-                logger.info("⏸️  다음 클럽까지 5초 대기...")
-                time.sleep(5)
+                logger.info(f"⏸️  다음 클럽까지 {club_delay}초 대기...")
+                metrics.observe('sleep.club_delay', club_delay)
+                time.sleep(club_delay)
         
         except Exception as e:
             logger.error(f"❌ 클럽 {club['name']} 처리 중 오류: {str(e)}")
             continue
     
-    return all_posts, total_stats
+    return total_collected, total_stats
 
 
-def run_single_scraping(db_manager, scraper, image_manager, target):
+def run_single_scraping(db_manager, scraper, image_manager, target, club_registry=None, post_filter=None):
     """단건 스크래핑 모드"""
     logger.info(f"{'='*60}")
     logger.info("🎯 단건 스크래핑 모드")
     logger.info(f"{'='*60}\n")
     
-    club = None
+    club_registry = club_registry or ClubRegistry(db_manager)
     
     # URL인지 클럽명인지 판단
     if target.startswith('http'):
         logger.info(f"📝 Instagram URL로 조회: {target}")
-        club = db_manager.get_club_by_instagram_url(target)
     else:
         logger.info(f"📝 클럽명으로 조회: {target}")
-        club = db_manager.get_club_by_name(target)
+    club = club_registry.resolve(target)
     
     if not club:
         logger.error(f"❌ 클럽을 찾을 수 없습니다: {target}")
-        return [], {'success': 0, 'skipped': 0, 'failed': 0, 'images_uploaded': 0, 'images_failed': 0}
+        return 0, new_stats()
     
     logger.info(f"✅ 클럽 발견: {club['name']} (ID: {club['club_id']})")
     logger.info(f"   Instagram: {club['instagram_url']}")
@@ -193,46 +282,128 @@ def run_single_scraping(db_manager, scraper, image_manager, target):
     else:
         logger.info(f"   🆕 신규 클럽 - 전체 게시물 수집\n")
     
-    # 게시물 수집
-    posts = scraper.scrape_channel_by_url(
-        instagram_url=club['instagram_url'],
-        last_post_url=club['last_post_url']
-    )
+    total_stats = new_stats()
+    collected = collect_club_posts(club, db_manager, scraper, image_manager, total_stats, club_registry, post_filter)
     
-    # club_id 추가
+    if collected:
+        logger.info(f"📊 수집 완료: {collected}개 새 게시물")
+    else:
+        logger.info(f"ℹ️ 새로운 게시물이 없습니다")
+    
+    return collected, total_stats
+
+
+def new_refresh_stats() -> dict:
+    """캡션 갱신 모드 집계용 빈 통계 딕셔너리"""
+    return {
+        'checked': 0,
+        'changed': 0,
+        'unchanged': 0,
+        'not_stored': 0,
+        'failed': 0
+    }
+
+
+def refresh_club_captions(club, db_manager, scraper, total_stats):
+    """
+    클럽의 최근 게시물 캡션을 저장된 해시와 비교해 바뀐 게시물만 갱신
+    
+    게시물 목록 한 번 조회 + 해시 일괄 조회 + 일괄 UPDATE 한 번으로 끝나며 이미지는 다시 받지 않는다.
+    
+    Returns:
+        확인한 게시물 수
+    """
+    # 이미지를 받지 않으므로 게시물 간 대기 없이 전체 목록 확인 (수집 커서 무시)
+    posts = list(scraper.iter_channel_posts_by_url(
+        instagram_url=club['instagram_url'],
+        post_delay=0
+    ))
+    if not posts:
+        return 0
+    
+    stored = db_manager.get_caption_hashes(club['club_id'], [post['post_url'] for post in posts])
+    if stored is None:
+        logger.warning(f"⚠️ 저장된 캡션 해시를 조회하지 못해 {club['name']} 건너뜀 ({len(posts)}개 실패 처리)")
+        total_stats['checked'] += len(posts)
+        total_stats['failed'] += len(posts)
+        return len(posts)
+    
+    updates = []
     for post in posts:
-        post['club_id'] = club['club_id']
+        row = stored.get(canonical_post_url(post['post_url']) or post['post_url'])
+        if row is None:
+            total_stats['not_stored'] += 1
+        elif row['caption_hash'] == caption_hash(post.get('caption')):
+            total_stats['unchanged'] += 1
+        else:
+            logger.info(f"✏️ 캡션 변경 감지 (ID: {row['perform_id']}): {post['post_url']}")
+            updates.append({
+                'perform_id': row['perform_id'],
+                'caption': post.get('caption'),
+                'post_date': post.get('post_date')
+            })
+    
+    total_stats['checked'] += len(posts)
+    if updates:
+        updated = db_manager.update_captions(updates)
+        if updated is None:
+            total_stats['failed'] += len(updates)
+        else:
+            total_stats['changed'] += len(updates)
     
-    logger.info(f"📊 수집 완료: {len(posts)}개 새 게시물")
+    return len(posts)
+
+
+def run_refresh_scraping(db_manager, scraper, club_delay=5, club_registry=None, target=None):
+    """
+    캡션 갱신 모드 (이미 저장된 최근 게시물의 수정된 캡션 반영)
     
-    total_stats = {
-        'success': 0,
-        'skipped': 0,
-        'failed': 0,
-        'images_uploaded': 0,
-        'images_failed': 0
-    }
+    Args:
+        club_delay: 클럽 간 대기 시간 (초)
+        club_registry: ClubRegistry (기본값: db_manager로 새로 생성)
+        target: 클럽명 또는 Instagram URL (기본값: 전체 클럽)
+    """
+    logger.info(f"{'='*60}")
+    logger.info("✏️ 캡션 갱신 모드")
+    logger.info(f"{'='*60}\n")
     
-    # 게시물 처리
-    if posts:
-        for post in posts:
-            result = process_single_post(post, db_manager, image_manager, club['club_id'])
-            
-            if result['skipped']:
-                total_stats['skipped'] += 1
-            elif result['success']:
-                total_stats['success'] += 1
-                total_stats['images_uploaded'] += result['images_uploaded']
-                total_stats['images_failed'] += result['images_failed']
-            else:
-                total_stats['failed'] += 1
+    club_registry = club_registry or ClubRegistry(db_manager)
+    
+    if target:
+        club = club_registry.resolve(target)
+        if not club:
+            logger.error(f"❌ 클럽을 찾을 수 없습니다: {target}")
+            return 0, new_refresh_stats()
+        clubs = [club]
     else:
-        logger.info(f"ℹ️ 새로운 게시물이 없습니다")
+        clubs = club_registry.clubs()
+    
+    if not clubs:
+        logger.error("❌ Instagram 연동 클럽이 없습니다")
+        return 0, new_refresh_stats()
+    
+    total_checked = 0
+    total_stats = new_refresh_stats()
     
-    return posts, total_stats
+    for i, club in enumerate(clubs, 1):
+        try:
+            logger.info(f"\n[{i}/{len(clubs)}] 📱 클럽: {club['name']}")
+            total_checked += refresh_club_captions(club, db_manager, scraper, total_stats)
+            
+            # 클럽 간 딜레이
+            if i < len(clubs):
+                logger.info(f"⏸️  다음 클럽까지 {club_delay}초 대기...")
+                metrics.observe('sleep.club_delay', club_delay)
+                time.sleep(club_delay)
+        
+        except Exception as e:
+            logger.error(f"❌ 클럽 {club['name']} 처리 중 오류: {str(e)}")
+            continue
+    
+    return total_checked, total_stats
 
 
-def run_post_url_scraping(db_manager, scraper, image_manager, post_url, club_target):
+def run_post_url_scraping(db_manager, scraper, image_manager, post_url, club_target, club_registry=None):
     """게시물 URL로 직접 스크래핑 모드"""
     logger.info(f"{'='*60}")
     logger.info("🔗 게시물 URL 스크래핑 모드")
@@ -241,16 +412,16 @@ def run_post_url_scraping(db_manager, scraper, image_manager, post_url, club_tar
     # 클럽 정보 조회
     club = None
     if club_target:
+        club_registry = club_registry or ClubRegistry(db_manager)
         if club_target.startswith('http'):
             logger.info(f"📝 Instagram URL로 클럽 조회: {club_target}")
-            club = db_manager.get_club_by_instagram_url(club_target)
         else:
             logger.info(f"📝 클럽명으로 조회: {club_target}")
-            club = db_manager.get_club_by_name(club_target)
+        club = club_registry.resolve(club_target)
     
     if not club:
         logger.error(f"❌ 클럽을 찾을 수 없습니다: {club_target}")
-        return [], {'success': 0, 'skipped': 0, 'failed': 0, 'images_uploaded': 0, 'images_failed': 0}
+        return 0, new_stats()
     
     logger.info(f"✅ 클럽 발견: {club['name']} (ID: {club['club_id']})")
     logger.info(f"📌 게시물 URL: {post_url}\n")
@@ -261,57 +432,161 @@ def run_post_url_scraping(db_manager, scraper, image_manager, post_url, club_tar
         
         if not post_data:
             logger.error("❌ 게시물 정보를 가져올 수 없습니다")
-            return [], {'success': 0, 'skipped': 0, 'failed': 0, 'images_uploaded': 0, 'images_failed': 0}
+            return 0, new_stats()
         
         # club_id 추가
         post_data['club_id'] = club['club_id']
         
         logger.info(f"✅ 게시물 정보 수집 완료")
         
-        total_stats = {
-            'success': 0,
-            'skipped': 0,
-            'failed': 0,
-            'images_uploaded': 0,
-            'images_failed': 0
-        }
+        total_stats = new_stats()
         
         # 게시물 처리
         result = process_single_post(post_data, db_manager, image_manager, club['club_id'])
+        accumulate_stats(total_stats, result)
         
-        if result['skipped']:
-            total_stats['skipped'] += 1
-        elif result['success']:
-            total_stats['success'] += 1
-            total_stats['images_uploaded'] += result['images_uploaded']
-            total_stats['images_failed'] += result['images_failed']
-        else:
-            total_stats['failed'] += 1
-        
-        return [post_data], total_stats
+        return 1, total_stats
         
     except Exception as e:
         logger.error(f"❌ 게시물 처리 오류: {e}")
         import traceback
         logger.error(traceback.format_exc())
-        return [], {'success': 0, 'skipped': 0, 'failed': 0, 'images_uploaded': 0, 'images_failed': 0}
+        return 0, new_stats()
+
+
+def run_deferred_images(db_manager, scraper, image_manager, days=None, target=None, club_registry=None, post_delay=None):
+    """
+    보류 이미지 수집 모드 (분류기 defer 모드에서 이미지 없이 저장한 게시물)
+    
+    저장 시점의 CDN 이미지 URL은 만료되므로 게시물을 다시 조회해 새 URL로 받는다.
+    이미지를 하나 이상 저장했거나 게시물에 이미지가 없으면 보류 표시를 해제하고,
+    모두 실패하면 다음 실행에서 다시 시도한다.
+    
+    Args:
+        days: 최근 N일 이내 저장된 게시물만 (기본값: 전체)
+        target: 클럽명 또는 Instagram URL (기본값: 전체 클럽)
+        club_registry: ClubRegistry (기본값: db_manager로 새로 생성)
+        post_delay: 게시물 간 대기 시간 (초, 기본값: InstagramScraper.POST_DELAY)
+    """
+    logger.info(f"{'='*60}")
+    logger.info("⏸️ 보류 이미지 수집 모드")
+    logger.info(f"{'='*60}\n")
+    
+    post_delay = InstagramScraper.POST_DELAY if post_delay is None else post_delay
+    
+    club_id = None
+    if target:
+        club_registry = club_registry or ClubRegistry(db_manager)
+        club = club_registry.resolve(target)
+        if not club:
+            logger.error(f"❌ 클럽을 찾을 수 없습니다: {target}")
+            return 0, new_stats()
+        club_id = club['club_id']
+        logger.info(f"✅ 클럽 발견: {club['name']} (ID: {club_id})")
+    
+    posts = db_manager.get_deferred_posts(club_id=club_id, days=days)
+    if not posts:
+        if posts is not None:
+            logger.info("ℹ️ 이미지 수집을 보류한 게시물이 없습니다")
+        return 0, new_stats()
+    
+    logger.info(f"📊 이미지 보류 게시물 {len(posts)}개")
+    total_stats = new_stats()
+    
+    for i, row in enumerate(posts, 1):
+        result = {
+            'success': False,
+            'skipped': False,
+            'filtered': False,
+            'images_uploaded': 0,
+            'images_failed': 0,
+            'error': None
+        }
+        
+        try:
+            logger.info(f"\n[{i}/{len(posts)}] 📌 ID {row['perform_id']}: {row['post_url']}")
+            
+            post = scraper.scrape_post_by_url(row['post_url']) if row['post_url'] else None
+            if post is None:
+                result['error'] = "게시물 조회 실패"
+                logger.warning(f"⚠️ 게시물을 다시 조회하지 못해 보류 유지 (ID: {row['perform_id']})")
+            else:
+                image_urls = post.get('image_urls', [])
+                upload_post_images(image_urls, row['perform_id'], db_manager, image_manager, result)
+                
+                if result['images_uploaded'] or not image_urls:
+                    result['success'] = db_manager.clear_images_deferred(row['perform_id'])
+                else:
+                    result['error'] = "이미지 업로드 실패"
+        
+        except Exception as e:
+            result['error'] = str(e)
+            logger.error(f"❌ 게시물 처리 오류: {e}")
+        
+        accumulate_stats(total_stats, result)
+        
+        # 게시물 간 딜레이 (게시물마다 Instagram API 호출)
+        if i < len(posts) and post_delay > 0:
+            metrics.observe('sleep.post_delay', post_delay)
+            time.sleep(post_delay)
+    
+    return len(posts), total_stats
+
+def write_metrics_report(mode, collected, stats, dry_run=False):
+    """
+    실행 단계별 메트릭 리포트 저장 (JSON, Prometheus textfile)
+    
+    dry-run 실행은 JSON 파일명에 표시하고, 운영 지표를 덮어쓰지 않도록 Prometheus textfile은 갱신하지 않는다.
+    """
+    metrics.incr('posts.collected', collected)
+    for key, value in stats.items():
+        metrics.incr(f'posts.{key}', value)
+    
+    try:
+        if METRICS_CONFIG['report_dir']:
+            report_path = os.path.join(
+                METRICS_CONFIG['report_dir'],
+                f"metrics_{metrics.started_at.strftime('%Y%m%d_%H%M%S')}_{mode}{'_dryrun' if dry_run else ''}.json"
+            )
+            metrics.write_json(report_path, extra={'mode': mode, 'dry_run': dry_run})
+            logger.info(f"📈 메트릭 리포트 저장: {report_path}")
+        
+        if METRICS_CONFIG['prometheus_textfile'] and not dry_run:
+            metrics.write_prometheus(METRICS_CONFIG['prometheus_textfile'])
+    except Exception as e:
+        logger.warning(f"⚠️ 메트릭 리포트 저장 실패: {e}")
 
 
-def print_summary(posts, stats, days=None):
+def print_summary(collected, stats, days=None):
     """최종 결과 출력"""
     logger.info(f"{'='*60}")
     logger.info(f"🎉 스크래핑 작업 완료")
     if days:
         logger.info(f"📅 수집 기간: 최근 {days}일")
-    logger.info(f"📊 총 수집: {len(posts)}개")
+    logger.info(f"📊 총 수집: {collected}개")
     logger.info(f"✅ 공연 정보 저장 성공: {stats['success']}개")
     logger.info(f"🖼️ 이미지 업로드 성공: {stats['images_uploaded']}개")
     logger.info(f"⏭️  중복 건너뛰기: {stats['skipped']}개")
+    logger.info(f"🚫 공연 공지 아님 (저장 생략/이미지 보류): {stats['filtered']}개")
     logger.info(f"❌ 공연 정보 저장 실패: {stats['failed']}개")
     logger.info(f"❌ 이미지 업로드 실패: {stats['images_failed']}개")
     logger.info(f"{'='*60}\n")
 
 
+def print_refresh_summary(checked, stats, days=None):
+    """캡션 갱신 결과 출력"""
+    logger.info(f"{'='*60}")
+    logger.info(f"🎉 캡션 갱신 완료")
+    if days:
+        logger.info(f"📅 확인 기간: 최근 {days}일")
+    logger.info(f"📊 확인한 게시물: {checked}개")
+    logger.info(f"✏️ 캡션 변경 반영: {stats['changed']}개")
+    logger.info(f"✅ 변경 없음: {stats['unchanged']}개")
+    logger.info(f"ℹ️ 저장되지 않은 게시물: {stats['not_stored']}개")
+    logger.info(f"❌ 갱신 실패: {stats['failed']}개")
+    logger.info(f"{'='*60}\n")
+
+
 def main():
     parser = argparse.ArgumentParser(
         description='Instagram 공연 정보 수집 시스템',
@@ -332,21 +607,39 @@ def main():
   
   # 게시물 URL로 직접 수집 (클럽 Instagram URL 지정)
   python main.py --mode post --post-url "https://www.instagram.com/p/ABC123/" --club "https://www.instagram.com/hongdaeff/"
+  
+  # 최근 7일 저장 게시물의 수정된 캡션 반영 (이미지는 다시 받지 않음, --club으로 클럽 지정 가능)
+  python main.py --mode refresh --days 7
+  
+  # 분류기 defer 모드로 보류한 이미지 수집 (최근 30일 저장 게시물, --club으로 클럽 지정 가능)
+  python main.py --mode deferred --days 30
+  
+  # Instagram API 응답 녹화 후 재생 (재생 시 로그인/API 호출/대기 없음)
+  python main.py --mode bulk --days 7 --record recordings/20240101
+  python main.py --mode bulk --days 7 --replay recordings/20240101
+  
+  # DB 저장/R2 업로드 없이 처리량 측정 (조회, 중복 확인, 이미지 다운로드/검증은 수행)
+  python main.py --mode bulk --days 7 --dry-run
+  
+  # 프로파일링 (sample: 전체 스레드 샘플링 / cprofile: 메인 스레드 pstats) - 리포트는 logs/profile/
+  python main.py --mode bulk --days 7 --dry-run --profile
+  python main.py --mode single --club "홍대앞FF" --profile cprofile
         """
     )
     
     parser.add_argument(
         '--mode',
         type=str,
-        choices=['bulk', 'single', 'post'],
+        choices=['bulk', 'single', 'post', 'refresh', 'deferred'],
         default='bulk',
-        help='스크래핑 모드 (bulk: 일괄 수집, single: 단건 수집, post: 게시물 URL 직접 수집)'
+        help='스크래핑 모드 (bulk: 일괄 수집, single: 단건 수집, post: 게시물 URL 직접 수집, '
+             'refresh: 저장된 최근 게시물 캡션 변경 반영, deferred: 이미지 수집을 보류한 게시물의 이미지 수집)'
     )
     
     parser.add_argument(
         '--club',
         type=str,
-        help='클럽 지정 (클럽명 또는 Instagram URL) - single/post 모드에서 필수'
+        help='클럽 지정 (클럽명 또는 Instagram URL) - single/post 모드에서 필수, refresh/deferred 모드에서는 선택'
     )
     
     parser.add_argument(
@@ -359,7 +652,43 @@ def main():
         '--days',
         type=int,
         default=1,
-        help='수집 기간: 최근 며칠 이내 게시물 (기본값: 1일, post 모드에서는 무시됨)'
+        help='수집 기간: 최근 며칠 이내 게시물 (기본값: 1일, deferred 모드는 저장일 기준, post 모드에서는 무시됨)'
+    )
+    
+    replay_group = parser.add_mutually_exclusive_group()
+    replay_group.add_argument(
+        '--record',
+        type=str,
+        metavar='DIR',
+        help='Instagram API 응답(사용자 정보, 게시물 목록, 게시물 상세)을 DIR에 녹화'
+    )
+    replay_group.add_argument(
+        '--replay',
+        type=str,
+        metavar='DIR',
+        help='DIR에 녹화된 응답으로 실행 (Instagram 접속 없음, DB/R2 저장은 그대로 수행)'
+    )
+    
+    parser.add_argument(
+        '--dry-run',
+        action='store_true',
+        help='DB 저장과 R2 업로드를 생략 (수집/중복 확인/이미지 다운로드·검증은 수행, 소요 시간은 메트릭에 기록)'
+    )
+    
+    parser.add_argument(
+        '--classifier',
+        choices=CLASSIFIER_MODES,
+        default=CLASSIFIER_CONFIG['mode'],
+        help=f"공연 공지가 아닌 게시물 처리 (off: 분류 안 함, skip: 저장 생략, defer: 저장하되 이미지 수집 보류 - --mode deferred로 나중에 수집, "
+             f"기본값: {CLASSIFIER_CONFIG['mode']}) - post 모드에서는 무시됨"
+    )
+    
+    parser.add_argument(
+        '--profile',
+        nargs='?',
+        const='sample',
+        choices=PROFILE_KINDS,
+        help='프로파일링 실행 (기본값: sample) - CPU/sleep/기타 대기 시간 분리 요약, collapsed stacks 또는 pstats 저장'
     )
     
     args = parser.parse_args()
@@ -386,36 +715,91 @@ def main():
         logger.info(f"클럽: {args.club}")
     else:
         logger.info(f"수집 기간: 최근 {args.days}일")
-        if args.mode == 'single':
+        if args.mode in ('single', 'refresh', 'deferred') and args.club:
             logger.info(f"클럽: {args.club}")
+    if args.record:
+        logger.info(f"API 응답 녹화: {args.record}")
+    if args.replay:
+        logger.info(f"API 응답 재생: {args.replay}")
+    if args.dry_run:
+        logger.info("🧪 DRY-RUN: DB 저장/R2 업로드 생략")
+    if args.classifier != 'off' and args.mode in ('bulk', 'single'):
+        logger.info(f"🚫 공연 공지 분류: {args.classifier} (기준 점수 {CLASSIFIER_CONFIG['threshold']})")
     
     db_manager = None
+    image_manager = None
+    club_registry = None
+    collected, stats = 0, new_stats()
+    metrics.reset()
+    
+    profiler = RunProfiler(args.profile) if args.profile else None
+    if profiler:
+        profiler.start()
     
     try:
         # DB 연결
         logger.info("\n데이터베이스 연결 중...")
-        db_manager = DatabaseManager()
+        db_manager = DryRunDatabaseManager() if args.dry_run else DatabaseManager()
+        club_registry = ClubRegistry(db_manager)
         
         # R2 스토리지 초기화
         logger.info("R2 스토리지 연결 중...")
-        r2_storage = R2StorageAdapter(R2_CONFIG)
+        r2_storage = NullStorageAdapter(R2_CONFIG) if args.dry_run else R2StorageAdapter(R2_CONFIG)
         
         # 이미지 매니저 초기화
         image_manager = ImageManager(r2_storage)
         
         # 스크래퍼 초기화 (일수 전달, post 모드는 무시됨)
-        scraper = InstagramScraper(days=args.days if args.mode != 'post' else 1)
+        days = args.days if args.mode != 'post' else 1
+        with metrics.timer('instagram.init'):
+            if args.replay:
+                scraper = InstagramScraper(days=days, client=ReplayClient(args.replay), throttle=False)
+            else:
+                # 녹화 시에는 user_info 응답도 남기도록 user_id 캐시를 사용하지 않음
+                scraper = InstagramScraper(
+                    days=days, record_dir=args.record,
+                    user_ids=None if args.record else club_registry.user_ids
+                )
+        
+        # 공연 공지 분류기 (post 모드는 직접 지정한 게시물이므로 분류하지 않음, refresh/deferred 모드는 새로 저장하지 않음)
+        post_filter = PostFilter({'mode': args.classifier}) if args.classifier != 'off' else None
         
         # 모드에 따라 실행
         if args.mode == 'bulk':
-            posts, stats = run_bulk_scraping(db_manager, scraper, image_manager)
-            print_summary(posts, stats, args.days)
+            collected, stats = run_bulk_scraping(
+                db_manager, scraper, image_manager,
+                club_delay=0 if args.replay else 5,
+                club_registry=club_registry,
+                post_filter=post_filter
+            )
+            print_summary(collected, stats, args.days)
         elif args.mode == 'single':
-            posts, stats = run_single_scraping(db_manager, scraper, image_manager, args.club)
-            print_summary(posts, stats, args.days)
+            collected, stats = run_single_scraping(
+                db_manager, scraper, image_manager, args.club, club_registry, post_filter
+            )
+            print_summary(collected, stats, args.days)
+        elif args.mode == 'refresh':
+            collected, stats = run_refresh_scraping(
+                db_manager, scraper,
+                club_delay=0 if args.replay else 5,
+                club_registry=club_registry,
+                target=args.club
+            )
+            print_refresh_summary(collected, stats, args.days)
+        elif args.mode == 'deferred':
+            collected, stats = run_deferred_images(
+                db_manager, scraper, image_manager,
+                days=args.days,
+                target=args.club,
+                club_registry=club_registry,
+                post_delay=0 if args.replay else None
+            )
+            print_summary(collected, stats, args.days)
         elif args.mode == 'post':
-            posts, stats = run_post_url_scraping(db_manager, scraper, image_manager, args.post_url, args.club)
-            print_summary(posts, stats)
+            collected, stats = run_post_url_scraping(
+                db_manager, scraper, image_manager, args.post_url, args.club, club_registry
+            )
+            print_summary(collected, stats)
         
     except Exception as e:
         logger.error(f"❌ 실행 중 오류: {str(e)}")
@@ -423,6 +807,25 @@ def main():
         logger.error(traceback.format_exc())
     
     finally:
+        # 프로파일 리포트 저장
+        if profiler:
+            profiler.stop()
+            try:
+                profiler.write_report(args.mode)
+            except Exception as e:
+                logger.warning(f"⚠️ 프로파일 리포트 저장 실패: {e}")
+        
+        # 실행 메트릭 리포트 저장
+        write_metrics_report(args.mode, collected, stats, dry_run=args.dry_run)
+        
+        # Instagram user_id 캐시 저장 (재생 실행은 캐시를 갱신하지 않음)
+        if club_registry and not args.replay:
+            club_registry.save_user_ids()
+        
+        # 파생 이미지 프로세스 풀 종료
+        if image_manager:
+            image_manager.close()
+        
         # DB 연결 종료
         if db_manager:
             db_manager.close_all_connections()
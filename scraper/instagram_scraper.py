@@ -4,24 +4,49 @@ Instagram 스크래퍼 (instagrapi 사용 - Private API)
 from instagrapi import Client
 from instagrapi.exceptions import (LoginRequired, PleaseWaitFewMinutes, ClientError, ChallengeRequired, UserNotFound)
 from datetime import datetime, timedelta
-from typing import List, Dict, Optional
-import time, os, re, json
+from typing import List, Dict, Optional, Iterator
+import time, os, json, logging
 from utils.logger import setup_logger
+from scraper.post_record import PostRecord
+from scraper.replay import RecordingClient
+from utils.instagram_url import extract_username, extract_shortcode
+from utils.metrics import metrics
 from config.settings import INSTAGRAM_USERNAME, INSTAGRAM_PASSWORD
 
 logger = setup_logger('instagram_scraper')
 
 class InstagramScraper:
-    def __init__(self, days: int = 7):
+    # 게시물 간 최소 간격 (초)
+    POST_DELAY = 7
+    
+    def __init__(
+        self,
+        days: int = 7,
+        client=None,
+        throttle: bool = True,
+        record_dir: Optional[str] = None,
+        user_ids: Optional[Dict[str, int]] = None
+    ):
         """
         Args:
             days: 최근 며칠 이내 게시물 수집 (기본값 7일)
+            client: 이미 준비된 instagrapi Client 호환 객체 (지정 시 로그인 생략, 예: ReplayClient)
+            throttle: False이면 Rate limit 대기를 실제로 하지 않음 (대기 시간은 메트릭에만 기록)
+            record_dir: 지정 시 로그인 후 API 응답을 이 디렉토리에 녹화 (scraper/replay.py)
+            user_ids: 사용자명 -> user_id 캐시 (ClubRegistry.user_ids 공유 시 사용자 정보 조회 생략)
         """
         self.days = days
+        self.throttle = throttle
+        self.session_file = 'instagram_session.json'
+        self.user_ids = user_ids if user_ids is not None else {}
+        
+        if client is not None:
+            self.client = client
+            return
+        
         self.client = Client()
         self.client.request_timeout = 30
         self.client.delay_range = [3, 7]
-        self.session_file = 'instagram_session.json'
         
         # 디바이스 설정 추가
         self.client.set_device({
@@ -38,6 +63,9 @@ class InstagramScraper:
         })
         
         self._login()
+        
+        if record_dir:
+            self.client = RecordingClient(self.client, record_dir)
     
     def _login(self):
         """Instagram 로그인"""
@@ -53,9 +81,10 @@ class InstagramScraper:
                     self.client.load_settings(self.session_file)
                     
                     # 세션 유효성 확인
-                    self.client.account_info()
+                    with metrics.timer('instagram.session_check'):
+                        self.client.account_info()
                     logger.info("✅ 저장된 세션 로드 성공\n")
-                    time.sleep(2)
+                    self._sleep(2, 'login')
                     return
                 except Exception as e:
                     logger.warning(f"⚠️ 세션 로드 실패: {e}")
@@ -70,9 +99,10 @@ class InstagramScraper:
             logger.info(f"🔐 Instagram 로그인 시도: {INSTAGRAM_USERNAME}")
             
             # 로그인 전 잠깐 대기 (Rate Limit 방지)
-            time.sleep(3)
+            self._sleep(3, 'login')
             
-            login_result = self.client.login(INSTAGRAM_USERNAME, INSTAGRAM_PASSWORD)
+            with metrics.timer('instagram.login'):
+                login_result = self.client.login(INSTAGRAM_USERNAME, INSTAGRAM_PASSWORD)
             
             if not login_result:
                 raise Exception("로그인 실패")
@@ -93,7 +123,7 @@ class InstagramScraper:
             logger.info(f"💾 세션 저장: {self.session_file}\n")
             
             # 로그인 직후 대기
-            time.sleep(5)
+            self._sleep(5, 'login')
             
         except ChallengeRequired:
             logger.error("❌ Instagram 보안 인증 필요")
@@ -110,6 +140,12 @@ class InstagramScraper:
             logger.error("   3. test/login.py로 수동 로그인 테스트")
             raise
     
+    def _sleep(self, seconds: float, reason: str):
+        """Rate limit 대기 (사유별 대기 시간 집계)"""
+        metrics.observe(f'sleep.{reason}', seconds)
+        if self.throttle:
+            time.sleep(seconds)
+    
     def extract_username_from_url(self, instagram_url: str) -> str:
         """
         Instagram URL에서 username 추출
@@ -118,11 +154,15 @@ class InstagramScraper:
             instagram_url: Instagram 프로필 URL (예: https://www.instagram.com/username/)
             
         Returns:
-            추출된 username
+            추출된 username (소문자)
+            
+        Raises:
+            ValueError: 프로필 URL이 아닌 경우
         """
-        # URL에서 username 추출 (마지막 슬래시 제거)
-        instagram_url = instagram_url.rstrip('/')
-        username = instagram_url.split('/')[-1]
+        # 쿼리스트링/서브경로/대소문자 차이를 정규화해서 추출
+        username = extract_username(instagram_url)
+        if not username:
+            raise ValueError(f"유효하지 않은 Instagram 프로필 URL: {instagram_url}")
         
         logger.info(f"📝 URL에서 추출된 username: {username}")
         return username
@@ -147,6 +187,26 @@ class InstagramScraper:
         username = self.extract_username_from_url(instagram_url)
         return self.scrape_channel(username, last_post_url, retry_count)
     
+    def iter_channel_posts_by_url(
+        self,
+        instagram_url: str,
+        last_post_url: Optional[str] = None,
+        post_delay: Optional[float] = None
+    ) -> Iterator[Dict]:
+        """
+        Instagram URL로 채널 게시물을 하나씩 수집 (스트리밍)
+        
+        Args:
+            instagram_url: Instagram 프로필 URL
+            last_post_url: 마지막으로 저장된 게시물 URL (이 이후 게시물만 수집)
+            post_delay: 게시물 간 대기 시간 (초, 기본값: POST_DELAY)
+            
+        Yields:
+            게시물 데이터
+        """
+        username = self.extract_username_from_url(instagram_url)
+        return self.iter_channel_posts(username, last_post_url, post_delay=post_delay)
+    
     def scrape_channel(
         self, 
         username: str, 
@@ -154,77 +214,69 @@ class InstagramScraper:
         retry_count: int = 0
     ) -> List[Dict]:
         """
-        특정 채널의 최근 게시물 수집
+        특정 채널의 최근 게시물 수집 (전체 리스트 반환)
+        
+        게시물을 수집하는 즉시 처리하려면 iter_channel_posts 사용
         
         Args:
             username: Instagram 사용자명
             last_post_url: 마지막으로 저장된 게시물 URL (이 이후 게시물만 수집)
             retry_count: 재시도 횟수
         """
-        MAX_RETRIES = 2
-        # 날짜 범위 내에서 충분한 게시물을 가져오기 위해 넉넉하게 설정
-        # (대부분의 클럽은 하루에 1-2개 게시물 정도)
-        FETCH_AMOUNT = self.days * 5  # 예: 7일이면 35개 가져오기
+        return list(self.iter_channel_posts(username, last_post_url, retry_count))
+    
+    def iter_channel_posts(
+        self,
+        username: str,
+        last_post_url: Optional[str] = None,
+        retry_count: int = 0,
+        post_delay: Optional[float] = None
+    ) -> Iterator[Dict]:
+        """
+        특정 채널의 최근 게시물을 추출되는 대로 하나씩 반환
         
-        try:
-            logger.info(f"📥 {username} 채널 스크래핑 시작...")
-            logger.info(f"📅 최근 {self.days}일 이내 게시물 수집")
-            
-            if last_post_url:
-                logger.info(f"📌 마지막 저장 게시물: {last_post_url}")
-                logger.info(f"   → 이후의 최신 게시물만 수집합니다")
-            
-            # 사용자 정보 가져오기
-            try:
-                logger.info("👤 채널 사용자 정보 조회 중...")
-                user_info = self.client.user_info_by_username_v1(username)
-                user_id = user_info.pk
-            except UserNotFound:
-                logger.error(f"❌ {username}: 존재하지 않는 사용자")
-                return []
-            except Exception as e:
-                logger.error(f"❌ 사용자 정보 조회 실패: {e}")
-                raise
-            
-            # 게시물 가져오기
-            logger.info(f"📋 게시물 가져오는 중... (최대 {FETCH_AMOUNT}개)")
-            
-            # Rate Limit 방지를 위한 딜레이
-            time.sleep(3)
-            
-            medias = self.client.user_medias_v1(user_id, FETCH_AMOUNT)
-            logger.info(f"✅ 가져온 게시물 수: {len(medias)}개")
-            
-            if not medias:
-                logger.warning("⚠️ 게시물이 없습니다")
-                return []
-
-            posts = []
-            
-            # 최신순 정렬
-            medias = sorted(medias, key=lambda x: x.taken_at, reverse=True)
+        호출 측이 게시물을 처리하는 동안 다음 게시물 추출은 대기하며,
+        처리에 걸린 시간은 게시물 간 Rate limit 딜레이에서 차감된다.
+        
+        Args:
+            username: Instagram 사용자명
+            last_post_url: 마지막으로 저장된 게시물 URL (이 이후 게시물만 수집)
+            retry_count: 재시도 횟수
+            post_delay: 게시물 간 대기 시간 (초, 기본값: POST_DELAY - 게시물 목록은 한 번에 조회하므로
+                        호출 측이 이미지를 받지 않는 경우 0으로 지정 가능)
             
+        Yields:
+            게시물 데이터
+        """
+        logger.info(f"📥 {username} 채널 스크래핑 시작...")
+        logger.info(f"📅 최근 {self.days}일 이내 게시물 수집")
+        
+        if last_post_url:
+            logger.info(f"📌 마지막 저장 게시물: {last_post_url}")
+            logger.info(f"   → 이후의 최신 게시물만 수집합니다")
+        
+        records = self._fetch_post_records(username, retry_count)
+        if not records:
+            return
+        
+        try:
             # 날짜 기준 계산
-            cutoff_date = datetime.now(medias[0].taken_at.tzinfo) - timedelta(days=self.days)
+            cutoff_date = datetime.now(records[0].taken_at.tzinfo) - timedelta(days=self.days)
             logger.info(f"📅 기준 날짜: {cutoff_date.strftime('%Y-%m-%d %H:%M:%S')} 이후")
 
-            # 마지막 저장 게시물의 shortcode 추출
-            last_post_code = None
-            if last_post_url:
-                # URL에서 shortcode 추출: https://www.instagram.com/p/SHORTCODE/
-                match = re.search(r'/p/([^/]+)/', last_post_url)
-                if match:
-                    last_post_code = match.group(1)
-                    logger.info(f"📌 마지막 게시물 코드: {last_post_code}")
+            # 마지막 저장 게시물의 shortcode 추출 (/p/, /reel/ 등)
+            last_post_code = extract_shortcode(last_post_url)
+            if last_post_code:
+                logger.info(f"📌 마지막 게시물 코드: {last_post_code}")
 
             found_last_post = False if last_post_code else True
             collected_count = 0
             skipped_old = 0
             
-            for i, media in enumerate(medias, 1):
+            for i, record in enumerate(records, 1):
                 try:
-                    current_post_code = str(media.code)
-                    post_date = media.taken_at
+                    current_post_code = record.code
+                    post_date = record.taken_at
                     
                     # 마지막 저장 게시물을 만나면 중단
                     if last_post_code and current_post_code == last_post_code:
@@ -235,7 +287,7 @@ class InstagramScraper:
                     # 날짜 범위 확인
                     if post_date < cutoff_date:
                         skipped_old += 1
-                        logger.info(f"⏰ [{i}/{len(medias)}] 기준 날짜 이전 게시물, 건너뛰기 ({post_date.strftime('%Y-%m-%d')})")
+                        logger.info(f"⏰ [{i}/{len(records)}] 기준 날짜 이전 게시물, 건너뛰기 ({post_date.strftime('%Y-%m-%d')})")
                         
                         # 오래된 게시물이 연속으로 나오면 중단
                         if skipped_old >= 3:
@@ -243,34 +295,104 @@ class InstagramScraper:
                             break
                         continue
                     
+                    tick = time.monotonic()
+                    
                     # 게시물 데이터 추출
-                    post_data = self._extract_post_data(media)
+                    post_data = self._extract_post_data(record)
                     if post_data:
-                        posts.append(post_data)
                         collected_count += 1
-                        logger.info(f"✅ [{i}/{len(medias)}] 게시물 수집 완료 ({post_date.strftime('%Y-%m-%d %H:%M')})")
+                        metrics.incr('posts.extracted')
+                        logger.info(f"✅ [{i}/{len(records)}] 게시물 수집 완료 ({post_date.strftime('%Y-%m-%d %H:%M')})")
                         
                         # 파싱 정보 로깅
-                        logger.info("\n" + "✨ 게시글 정보 ✨".center(80, "="))
-                        logger.info(json.dumps({
-                            'post_url': post_data.get('post_url'),
-                            'post_date': post_data.get('post_date'),
-                            '원본 데이터': (media.caption_text or '')[:200] + '...' if len(media.caption_text or '') > 200 else (media.caption_text or '')
-                        }, ensure_ascii=False, indent=2))
-                        logger.info("=" * 80 + "\n")
+                        self._log_post_detail(post_data)
+                        
+                        yield post_data
                     
-                    # Rate limit 방지
-                    time.sleep(7)
+                    # Rate limit 방지 (호출 측 처리 시간만큼은 이미 경과했으므로 남은 시간만 대기)
+                    remaining = (self.POST_DELAY if post_delay is None else post_delay) - (time.monotonic() - tick)
+                    if remaining > 0:
+                        self._sleep(remaining, 'post_delay')
                     
                 except Exception as e:
                     logger.error(f"❌ 게시물 {i} 처리 오류: {e}")
                     continue
             
             if last_post_code and not found_last_post:
-                logger.warning(f"⚠️ 마지막 저장 게시물을 찾지 못했습니다. 날짜 기준으로 {len(posts)}개 수집")
+                logger.warning(f"⚠️ 마지막 저장 게시물을 찾지 못했습니다. 날짜 기준으로 {collected_count}개 수집")
+            
+            logger.info(f"\n📊 총 {collected_count}개의 새로운 게시물 수집 완료 (최근 {self.days}일)")
+            
+        except Exception as e:
+            logger.error(f"❌ {username} 오류: {e}")
+            import traceback
+            logger.error(traceback.format_exc())
+    
+    def _fetch_post_records(self, username: str, retry_count: int = 0) -> List[PostRecord]:
+        """
+        채널의 최근 게시물을 조회해 최신순 PostRecord 리스트로 반환
+        
+        Args:
+            username: Instagram 사용자명
+            retry_count: 재시도 횟수
+        """
+        MAX_RETRIES = 2
+        # 날짜 범위 내에서 충분한 게시물을 가져오기 위해 넉넉하게 설정
+        # (대부분의 클럽은 하루에 1-2개 게시물 정도)
+        FETCH_AMOUNT = self.days * 5  # 예: 7일이면 35개 가져오기
+        
+        try:
+            # 사용자 정보 가져오기 (캐시된 user_id가 있으면 생략)
+            user_id = self.user_ids.get(username)
+            cached_user_id = user_id is not None
+            if cached_user_id:
+                logger.info(f"👤 캐시된 user_id 사용: {user_id}")
+                metrics.incr('instagram.user_id_cache_hit')
+            else:
+                try:
+                    logger.info("👤 채널 사용자 정보 조회 중...")
+                    with metrics.timer('instagram.user_info'):
+                        user_info = self.client.user_info_by_username_v1(username)
+                    user_id = user_info.pk
+                    self.user_ids[username] = user_id
+                except UserNotFound:
+                    logger.error(f"❌ {username}: 존재하지 않는 사용자")
+                    return []
+                except Exception as e:
+                    logger.error(f"❌ 사용자 정보 조회 실패: {e}")
+                    raise
+            
+            # 게시물 가져오기
+            logger.info(f"📋 게시물 가져오는 중... (최대 {FETCH_AMOUNT}개)")
+            
+            # Rate Limit 방지를 위한 딜레이
+            self._sleep(3, 'rate_limit')
             
-            logger.info(f"\n📊 총 {len(posts)}개의 새로운 게시물 수집 완료 (최근 {self.days}일)")
-            return posts
+            try:
+                with metrics.timer('instagram.user_medias'):
+                    medias = self.client.user_medias_v1(user_id, FETCH_AMOUNT)
+            except (LoginRequired, PleaseWaitFewMinutes):
+                raise
+            except Exception as e:
+                if not cached_user_id:
+                    raise
+                # 계정 삭제/변경 등으로 캐시된 user_id가 유효하지 않을 수 있으므로 다시 조회
+                logger.warning(f"⚠️ 캐시된 user_id로 조회 실패 ({e}) - 사용자 정보 재조회")
+                self.user_ids.pop(username, None)
+                return self._fetch_post_records(username, retry_count)
+            logger.info(f"✅ 가져온 게시물 수: {len(medias)}개")
+            
+            if not medias:
+                logger.warning("⚠️ 게시물이 없습니다")
+                return []
+
+            # 필요한 필드만 담은 경량 레코드로 즉시 변환 후 Media 객체 해제
+            records = [PostRecord.from_media(media) for media in medias]
+            del medias
+            
+            # 최신순 정렬
+            records.sort(key=lambda x: x.taken_at, reverse=True)
+            return records
             
         except LoginRequired as e:
             logger.error(f"❌ {username}: 로그인 필요 - 세션이 만료되었습니다")
@@ -286,13 +408,13 @@ class InstagramScraper:
                     logger.info("🗑️  기존 세션 파일 삭제")
                 
                 # 대기 후 재로그인
-                time.sleep(wait_time)
+                self._sleep(wait_time, 'relogin_backoff')
                 
                 try:
                     self._login()
                     logger.info("✅ 재로그인 성공, 수집 재개...")
-                    time.sleep(5)
-                    return self.scrape_channel(username, last_post_url, retry_count + 1)
+                    self._sleep(5, 'login')
+                    return self._fetch_post_records(username, retry_count + 1)
                 except Exception as login_error:
                     logger.error(f"❌ 재로그인 실패: {login_error}")
                     return []
@@ -304,8 +426,8 @@ class InstagramScraper:
             logger.error(f"❌ Rate limit 도달")
             if retry_count < MAX_RETRIES:
                 logger.info("⏸️  5분 대기...")
-                time.sleep(300)
-                return self.scrape_channel(username, last_post_url, retry_count + 1)
+                self._sleep(300, 'rate_limit_backoff')
+                return self._fetch_post_records(username, retry_count + 1)
             return []
         
         except Exception as e:
@@ -327,14 +449,12 @@ class InstagramScraper:
         try:
             logger.info(f"📥 게시물 URL 스크래핑 시작: {post_url}")
             
-            # URL에서 shortcode 추출
-            import re
-            match = re.search(r'/p/([^/]+)/', post_url)
-            if not match:
+            # URL에서 shortcode 추출 (/p/, /reel/, /tv/)
+            shortcode = extract_shortcode(post_url)
+            if not shortcode:
                 logger.error(f"❌ 유효하지 않은 게시물 URL: {post_url}")
                 return None
             
-            shortcode = match.group(1)
             logger.info(f"📌 Shortcode: {shortcode}")
             
             # 게시물 정보 가져오기
@@ -343,7 +463,8 @@ class InstagramScraper:
             logger.info(f"📌 Media PK: {media_pk}")
             
             # media_pk로 정보 조회
-            media = self.client.media_info(media_pk)
+            with metrics.timer('instagram.media_info'):
+                media = self.client.media_info(media_pk)
             
             if not media:
                 logger.error(f"❌ 게시물을 찾을 수 없습니다: {shortcode}")
@@ -352,20 +473,15 @@ class InstagramScraper:
             logger.info(f"✅ 게시물 정보 조회 완료")
             
             # 데이터 추출
-            post_data = self._extract_post_data(media)
+            record = PostRecord.from_media(media)
+            del media
+            post_data = self._extract_post_data(record)
             
             if post_data:
                 logger.info(f"✅ 게시물 데이터 추출 완료")
                 
                 # 파싱 정보 로깅
-                logger.info("\n" + "✨ 게시글 정보 ✨".center(80, "="))
-                logger.info(json.dumps({
-                    'post_url': post_data.get('post_url'),
-                    'post_date': post_data.get('post_date'),
-                    'image_count': len(post_data.get('image_urls', [])),
-                    '원본 데이터': (media.caption_text or '')[:200] + '...' if len(media.caption_text or '') > 200 else (media.caption_text or '')
-                }, ensure_ascii=False, indent=2))
-                logger.info("=" * 80 + "\n")
+                self._log_post_detail(post_data)
             
             return post_data
             
@@ -375,115 +491,59 @@ class InstagramScraper:
             logger.error(traceback.format_exc())
             return None
 
-    def _extract_post_data(self, media) -> Dict:
-        """게시물에서 데이터 추출 - 이미지 게시물만 수집"""
+    def _log_post_detail(self, post_data: Dict):
+        """파싱된 게시글 정보 로깅 (DEBUG 레벨일 때만 직렬화)"""
+        if not logger.isEnabledFor(logging.DEBUG):
+            return
+        
+        caption = post_data.get('caption', '')
+        logger.debug("\n" + "✨ 게시글 정보 ✨".center(80, "="))
+        logger.debug(json.dumps({
+            'post_url': post_data.get('post_url'),
+            'post_date': post_data.get('post_date'),
+            'image_count': len(post_data.get('image_urls', [])),
+            '원본 데이터': caption[:200] + '...' if len(caption) > 200 else caption
+        }, ensure_ascii=False, indent=2))
+        logger.debug("=" * 80 + "\n")
+    
+    def _extract_post_data(self, record: PostRecord) -> Optional[Dict]:
+        """게시물 레코드에서 데이터 추출 - 이미지 게시물만 수집"""
         try:
-            # media_type 확인 (1=Image, 2=Video, 8=Carousel)
-            media_type = getattr(media, 'media_type', 0)
-            
-            # 단일 영상 게시물은 제외
-            if media_type == 2:
+            # 단일 영상 게시물은 제외 (media_type: 1=Image, 2=Video, 8=Carousel)
+            if record.media_type == 2:
                 logger.info(f"🎬 영상 게시물 감지 → 건너뛰기")
                 return None
             
-            image_urls = []
-        
             # 1. Carousel (다중 이미지/비디오)
-            if hasattr(media, 'resources') and media.resources:
-                logger.info(f"📸 Carousel 게시물 감지 (리소스 {len(media.resources)}개)")
-                
-                # Carousel 내 영상 개수 체크
-                video_count = 0
-                for resource in media.resources:
-                    resource_type = getattr(resource, 'media_type', 0)
-                    if resource_type == 2:
-                        video_count += 1
+            if record.is_carousel:
+                logger.info(f"📸 Carousel 게시물 감지 (리소스 {record.resource_count}개)")
                 
                 # 영상만 있는 Carousel은 제외
-                if video_count == len(media.resources):
+                if record.video_count == record.resource_count:
                     logger.info(f"🎬 영상만 있는 Carousel → 건너뛰기")
                     return None
                 
-                if video_count > 0:
-                    logger.info(f"ℹ️  Carousel 내 영상 {video_count}개는 제외하고 이미지만 수집")
-                
-                for idx, resource in enumerate(media.resources):
-                    resource_type = getattr(resource, 'media_type', 0)
-                    
-                    # 영상인 경우 건너뛰기
-                    if resource_type == 2:
-                        logger.info(f"   [{idx+1}] 🎬 영상 리소스 → 건너뛰기")
-                        continue
-                
-                    # 고화질 이미지/썸네일 우선
-                    if hasattr(resource, 'image_versions2') and resource.image_versions2:
-                        candidates = resource.image_versions2.get('candidates', [])
-                        if candidates and len(candidates) > 0:
-                            img_url = candidates[0].get('url')
-                            if img_url:
-                                image_urls.append(str(img_url))
-                                logger.info(f"   [{idx+1}] 고화질 이미지: {img_url[:80]}...")
-                                continue
-                    
-                    # 대체: thumbnail_url
-                    if hasattr(resource, 'thumbnail_url') and resource.thumbnail_url:
-                        image_urls.append(str(resource.thumbnail_url))
-                        logger.info(f"   [{idx+1}] 썸네일 이미지: {str(resource.thumbnail_url)[:80]}...")
+                if record.video_count > 0:
+                    logger.info(f"ℹ️  Carousel 내 영상 {record.video_count}개는 제외하고 이미지만 수집")
             
             # 2. 단일 게시물
             else:
                 logger.info(f"📷 단일 이미지 게시물 감지")
-                
-                # 고화질 이미지/썸네일 우선
-                if hasattr(media, 'image_versions2') and media.image_versions2:
-                    candidates = media.image_versions2.get('candidates', [])
-                    if candidates and len(candidates) > 0:
-                        img_url = candidates[0].get('url')
-                        if img_url:
-                            image_urls.append(str(img_url))
-                            logger.info(f"   고화질 이미지: {img_url[:80]}...")
-                
-                # 대체 1: thumbnail_url
-                elif hasattr(media, 'thumbnail_url') and media.thumbnail_url:
-                    image_urls.append(str(media.thumbnail_url))
-                    logger.info(f"   썸네일 이미지: {str(media.thumbnail_url)[:80]}...")
-                
-                # 대체 2: display_url (최후의 수단)
-                elif hasattr(media, 'display_url') and media.display_url:
-                    image_urls.append(str(media.display_url))
-                    logger.info(f"   디스플레이 이미지: {str(media.display_url)[:80]}...")
-            
-            # 중복 제거 (순서 유지)
-            seen = set()
-            unique_urls = []
-            for url in image_urls:
-                if url not in seen:
-                    seen.add(url)
-                    unique_urls.append(url)
-            
-            image_urls = unique_urls
-            
-            if not image_urls:
-                logger.warning(f"⚠️ 이미지 URL을 찾을 수 없습니다")
-                logger.warning(f"   media 속성: {dir(media)}")
-            else:
-                logger.info(f"✅ 총 {len(image_urls)}개 이미지 URL 추출 완료")
             
-            caption = media.caption_text or ''
-            post_url = f"https://www.instagram.com/p/{media.code}/"
+            if logger.isEnabledFor(logging.DEBUG):
+                for idx, img_url in enumerate(record.image_urls):
+                    logger.debug("   [%d] 이미지: %.80s...", idx + 1, img_url)
+            
+            if not record.image_urls:
+                logger.warning(f"⚠️ 이미지 URL을 찾을 수 없습니다 (code: {record.code}, media_type: {record.media_type})")
+            else:
+                logger.info(f"✅ 총 {len(record.image_urls)}개 이미지 URL 추출 완료")
             
             # 최종 데이터
-            post_data = {
-                'post_id': str(media.code),
-                'image_urls': image_urls,
-                'caption': caption,
-                'post_date': getattr(media.taken_at, 'strftime', lambda fmt: None)('%Y-%m-%d %H:%M:%S'),
-                'post_url': post_url,
-            }
-            return post_data
+            return record.to_post_data()
             
         except Exception as e:
             logger.error(f"❌ 데이터 추출 오류: {e}")
             import traceback
             logger.error(traceback.format_exc())
-            return None
\ No newline at end of file
+            return None
@@ -0,0 +1,190 @@
+"""
+공연 공지 게시물 분류기 (굿즈/후기/휴무 공지 등 공연과 무관한 게시물 걸러내기)
+
+기본 분류기는 캡션 추출 결과(utils/caption_parser)와 키워드 규칙의 가중치 합을
+로지스틱 함수로 0~1 점수로 바꾼다. 다른 분류기는 PostClassifier를 구현하고
+CLASSIFIER_CONFIG['classifier']에 'package.module:ClassName'으로 지정한다.
+"""
+import importlib
+import math
+import re
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Optional, Sequence, Tuple
+from utils.logger import setup_logger
+from utils.metrics import metrics
+from utils.caption_parser import parse_caption
+from config.settings import CLASSIFIER_CONFIG
+
+logger = setup_logger('post_classifier')
+
+CLASSIFIER_MODES = ('off', 'skip', 'defer')
+
+_FLAGS = re.IGNORECASE
+
+_EVENT_RE = re.compile(
+    r'공연|라이브|live|파티|party|gig|concert|콘서트|festival|페스티벌|페스타|showcase|쇼케이스'
+    r'|line\s*-?\s*up|라인업|\bdj\b|예매|티켓|ticket|tour|투어|release|발매|단독|night|나잇|나이트',
+    _FLAGS
+)
+_MERCH_RE = re.compile(r'굿즈|merch|재입고|restock|티셔츠|t-?shirts?|hoodie|후드티|스토어|store', _FLAGS)
+_RECAP_RE = re.compile(
+    r'감사했습니다|고마웠|와\s*주신|thank\s*you\s*for\s*(?:coming|joining)|recap|후기|지난\s*주|어제|last\s*night'
+    r'|사진\s*(?:더|모음)|photos?\s*by',
+    _FLAGS
+)
+_NOTICE_RE = re.compile(r'휴무|휴업|closed|영업\s*(?:시간|안내)|대관|rental|구인|채용|모집|hiring|staff\s*wanted', _FLAGS)
+
+_SHORT_CAPTION = 15
+
+
+@dataclass
+class Classification:
+    """분류 결과"""
+    score: float                                # 공연 공지일 가능성 (0~1)
+    reasons: Tuple[str, ...] = ()               # 점수에 반영된 규칙 이름
+    suggestions: Optional[Dict] = None          # 캡션 추출 결과 (저장 시 재사용)
+
+    def to_dict(self) -> Dict:
+        return {'score': round(self.score, 3), 'reasons': list(self.reasons)}
+
+
+@dataclass(frozen=True)
+class Rule:
+    """
+    분류 규칙
+
+    test(post, suggestions)가 참이면 weight를 점수(로짓)에 더한다.
+    """
+    name: str
+    weight: float
+    test: Callable[[Dict, Dict], bool] = field(repr=False)
+
+
+def _caption(post: Dict) -> str:
+    return post.get('caption') or ''
+
+
+DEFAULT_RULES: Tuple[Rule, ...] = (
+    Rule('date', 1.5, lambda post, found: 'perform_date' in found),
+    Rule('time', 1.0, lambda post, found: 'perform_time' in found),
+    Rule('price', 1.0, lambda post, found: 'booking_price' in found or 'onsite_price' in found),
+    Rule('booking_url', 0.8, lambda post, found: 'booking_url' in found),
+    Rule('lineup', 1.0, lambda post, found: bool(found.get('artists'))),
+    Rule('event_keyword', 1.2, lambda post, found: bool(_EVENT_RE.search(_caption(post)))),
+    Rule('merch_keyword', -1.5, lambda post, found: bool(_MERCH_RE.search(_caption(post)))),
+    Rule('recap_keyword', -1.5, lambda post, found: bool(_RECAP_RE.search(_caption(post)))),
+    Rule('notice_keyword', -1.0, lambda post, found: bool(_NOTICE_RE.search(_caption(post)))),
+    Rule('short_caption', -1.0, lambda post, found: len(_caption(post).strip()) < _SHORT_CAPTION and 'perform_date' not in found),
+)
+
+
+class PostClassifier:
+    """분류기 인터페이스"""
+
+    def classify(self, post: Dict) -> Classification:
+        """
+        게시물 분류
+
+        Args:
+            post: 게시물 데이터 ({'caption', 'image_urls', 'post_date', 'post_url', ...})
+
+        Returns:
+            Classification
+        """
+        raise NotImplementedError
+
+
+class RuleBasedClassifier(PostClassifier):
+    def __init__(self, rules: Sequence[Rule] = DEFAULT_RULES, bias: float = -1.5):
+        """
+        규칙 가중치 합 기반 분류기
+
+        Args:
+            rules: 분류 규칙 목록
+            bias: 규칙이 하나도 맞지 않을 때의 점수(로짓) - 기본값은 약 0.18
+        """
+        self.rules = tuple(rules)
+        self.bias = bias
+
+    def classify(self, post: Dict) -> Classification:
+        suggestions = post.get('suggestions')
+        if suggestions is None:
+            suggestions = parse_caption(post.get('caption'), post.get('post_date'))
+
+        logit = self.bias
+        reasons = []
+        for rule in self.rules:
+            if rule.test(post, suggestions):
+                logit += rule.weight
+                reasons.append(rule.name)
+
+        return Classification(
+            score=1 / (1 + math.exp(-logit)),
+            reasons=tuple(reasons),
+            suggestions=suggestions
+        )
+
+
+def load_classifier(spec: Optional[str] = None) -> PostClassifier:
+    """
+    분류기 생성
+
+    Args:
+        spec: 'rules' 또는 'package.module:ClassName' (기본값: CLASSIFIER_CONFIG['classifier'])
+
+    Returns:
+        PostClassifier 인스턴스
+    """
+    spec = spec or CLASSIFIER_CONFIG['classifier']
+    if spec == 'rules':
+        return RuleBasedClassifier()
+
+    module_name, _, class_name = spec.partition(':')
+    if not class_name:
+        raise ValueError(f"분류기 지정 형식 오류: {spec} ('rules' 또는 'package.module:ClassName')")
+    classifier = getattr(importlib.import_module(module_name), class_name)()
+    if not isinstance(classifier, PostClassifier):
+        raise TypeError(f"{spec}는 PostClassifier 구현체가 아닙니다")
+    return classifier
+
+
+class PostFilter:
+    def __init__(self, config: Optional[dict] = None, classifier: Optional[PostClassifier] = None):
+        """
+        분류 점수로 게시물 처리 방식 결정
+
+        Args:
+            config: 분류기 설정 (기본값: CLASSIFIER_CONFIG)
+            classifier: 분류기 (기본값: config['classifier']로 생성)
+        """
+        config = {**CLASSIFIER_CONFIG, **(config or {})}
+        if config['mode'] not in CLASSIFIER_MODES:
+            raise ValueError(f"지원하지 않는 분류 모드: {config['mode']} ({', '.join(CLASSIFIER_MODES)})")
+        self.mode = config['mode']
+        self.threshold = config['threshold']
+        self.classifier = classifier or load_classifier(config['classifier'])
+
+    def apply(self, post: Dict) -> Optional[str]:
+        """
+        게시물 분류 후 처리 방식 반환
+
+        분류 결과는 post['classification'], 캡션 추출 결과는 post['suggestions']에 기록한다.
+
+        Returns:
+            None (정상 처리), 'skip' (저장 안 함) 또는 'defer' (저장하되 이미지 수집 보류)
+        """
+        with metrics.timer('classifier.classify'):
+            result = self.classifier.classify(post)
+
+        post['classification'] = result.to_dict()
+        if result.suggestions is not None:
+            post['suggestions'] = result.suggestions
+
+        if result.score >= self.threshold or self.mode == 'off':
+            return None
+
+        logger.info(
+            f"🚫 공연 공지 아님 ({result.score:.2f} < {self.threshold}, {', '.join(result.reasons) or '규칙 없음'}): "
+            f"{post.get('post_url')}"
+        )
+        return self.mode
@@ -0,0 +1,122 @@
+"""
+게시물 경량 레코드 (instagrapi Media 객체 대신 필요한 필드만 보관)
+"""
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Dict, Optional, Tuple
+from utils.instagram_url import POST_URL_FORMAT
+
+
+@dataclass
+class PostRecord:
+    """
+    수집에 필요한 필드만 담은 게시물 레코드
+
+    instagrapi의 Media(pydantic) 객체는 리소스/유저/위치 등 사용하지 않는
+    필드를 많이 들고 있으므로, 조회 직후 이 레코드로 변환하고 원본은 버린다.
+    """
+    __slots__ = (
+        'code', 'taken_at', 'media_type', 'image_urls', 'caption',
+        'resource_count', 'video_count'
+    )
+
+    code: str
+    taken_at: Optional[datetime]
+    media_type: int                 # 1=Image, 2=Video, 8=Carousel
+    image_urls: Tuple[str, ...]     # 영상 리소스를 제외한 이미지 URL (중복 제거, 순서 유지)
+    caption: str
+    resource_count: int             # Carousel 리소스 수 (단일 게시물은 0)
+    video_count: int                # Carousel 내 영상 리소스 수
+
+    @classmethod
+    def from_media(cls, media) -> 'PostRecord':
+        """
+        instagrapi Media 객체에서 레코드 생성
+
+        Args:
+            media: instagrapi Media 객체
+
+        Returns:
+            PostRecord
+        """
+        image_urls = []
+        resources = getattr(media, 'resources', None) or []
+        video_count = 0
+
+        # 1. Carousel (다중 이미지/비디오)
+        if resources:
+            for resource in resources:
+                if getattr(resource, 'media_type', 0) == 2:
+                    video_count += 1
+                    continue
+
+                # 고화질 이미지 우선, 대체: thumbnail_url
+                url = _best_candidate_url(resource)
+                if not url and getattr(resource, 'thumbnail_url', None):
+                    url = str(resource.thumbnail_url)
+                if url:
+                    image_urls.append(url)
+
+        # 2. 단일 게시물
+        else:
+            if getattr(media, 'image_versions2', None):
+                url = _best_candidate_url(media)
+                if url:
+                    image_urls.append(url)
+            elif getattr(media, 'thumbnail_url', None):
+                image_urls.append(str(media.thumbnail_url))
+            elif getattr(media, 'display_url', None):
+                image_urls.append(str(media.display_url))
+
+        return cls(
+            code=str(media.code),
+            taken_at=getattr(media, 'taken_at', None),
+            media_type=getattr(media, 'media_type', 0),
+            # 중복 제거 (순서 유지)
+            image_urls=tuple(dict.fromkeys(image_urls)),
+            caption=getattr(media, 'caption_text', None) or '',
+            resource_count=len(resources),
+            video_count=video_count
+        )
+
+    @property
+    def is_carousel(self) -> bool:
+        return self.resource_count > 0
+
+    @property
+    def post_url(self) -> str:
+        return POST_URL_FORMAT.format(self.code)
+
+    @property
+    def post_date(self) -> Optional[str]:
+        if self.taken_at is None:
+            return None
+        return self.taken_at.strftime('%Y-%m-%d %H:%M:%S')
+
+    def to_post_data(self) -> Dict:
+        """
+        DB 저장/이미지 처리에 사용하는 게시물 딕셔너리로 변환
+
+        Returns:
+            {'post_id', 'image_urls', 'caption', 'post_date', 'post_url'}
+        """
+        return {
+            'post_id': self.code,
+            'image_urls': list(self.image_urls),
+            'caption': self.caption,
+            'post_date': self.post_date,
+            'post_url': self.post_url,
+        }
+
+
+def _best_candidate_url(item) -> Optional[str]:
+    """image_versions2 후보 중 첫 번째(고화질) URL"""
+    versions = getattr(item, 'image_versions2', None)
+    if not versions:
+        return None
+    candidates = versions.get('candidates', [])
+    if candidates:
+        url = candidates[0].get('url')
+        if url:
+            return str(url)
+    return None
@@ -0,0 +1,195 @@
+"""
+instagrapi 응답 녹화/재생 (Rate limit 소모 없이 추출 경로를 반복 측정/프로파일링)
+
+녹화 파일 구조:
+    <dir>/user_info_by_username_v1/<username>.json.gz
+    <dir>/user_medias_v1/<user_id>.json.gz
+    <dir>/media_pk_from_code/<code>.json.gz
+    <dir>/media_info/<media_pk>.json.gz
+"""
+import gzip
+import json
+import os
+import re
+import tempfile
+import threading
+from datetime import datetime, timezone
+from typing import Dict, List
+from instagrapi import exceptions as ig_exceptions
+from instagrapi.exceptions import UserNotFound, MediaNotFound
+from instagrapi.types import Media, User
+from utils.logger import setup_logger
+
+logger = setup_logger('replay')
+
+# 녹화/재생 대상 메서드 -> 응답 모델 (None이면 원시 값)
+RECORDED_METHODS = {
+    'user_info_by_username_v1': User,
+    'user_medias_v1': Media,
+    'media_pk_from_code': None,
+    'media_info': Media,
+}
+
+# 재생 시 그대로 다시 발생시킬 영구 오류 (로그인/Rate limit 오류는 녹화하지 않음)
+RECORDED_ERRORS = (UserNotFound, MediaNotFound)
+
+
+class ReplayMissError(LookupError):
+    """녹화되지 않은 요청"""
+
+
+def _dump(value):
+    if isinstance(value, list):
+        return [_dump(item) for item in value]
+    if hasattr(value, 'model_dump'):
+        return value.model_dump(mode='json')
+    return value
+
+
+def _record_path(directory: str, method: str, key) -> str:
+    # 첫 번째 인자로 파일명 결정 (user_medias_v1은 amount와 무관하게 user_id 기준, 재생 시 amount만큼 잘라서 반환)
+    return os.path.join(directory, method, f"{re.sub(r'[^A-Za-z0-9_.-]', '_', str(key))}.json.gz")
+
+
+class RecordingClient:
+    def __init__(self, client, directory: str):
+        """
+        instagrapi Client 래퍼 - 녹화 대상 메서드 응답을 gzip JSON으로 저장
+
+        녹화 대상이 아닌 속성/메서드(login, load_settings 등)는 원본 Client로 위임한다.
+
+        Args:
+            client: 로그인된 instagrapi Client
+            directory: 녹화 디렉토리
+        """
+        self._client = client
+        self.directory = directory
+        self._lock = threading.Lock()
+        os.makedirs(directory, exist_ok=True)
+        logger.info(f"⏺️ instagrapi 응답 녹화: {directory}")
+
+    def __getattr__(self, name):
+        attr = getattr(self._client, name)
+        if name not in RECORDED_METHODS:
+            return attr
+
+        def recorded(*args, **kwargs):
+            entry = {
+                'method': name,
+                'args': list(args),
+                'kwargs': kwargs,
+                'recorded_at': datetime.now(timezone.utc).isoformat(),
+            }
+            try:
+                response = attr(*args, **kwargs)
+            except RECORDED_ERRORS as e:
+                entry['error'] = {'type': type(e).__name__, 'message': str(e)}
+                self._write(name, args, entry)
+                raise
+            entry['response'] = _dump(response)
+            self._write(name, args, entry)
+            return response
+
+        return recorded
+
+    def _write(self, method: str, args: tuple, entry: Dict):
+        path = _record_path(self.directory, method, args[0])
+        data = gzip.compress(json.dumps(entry, ensure_ascii=False, default=str).encode('utf-8'))
+        with self._lock:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix='.tmp')
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        logger.debug("⏺️ 녹화: %s(%s) -> %s", method, args[0], path)
+
+
+class ReplayClient:
+    def __init__(self, directory: str, shift_time: bool = True):
+        """
+        녹화된 응답을 제공하는 instagrapi Client 대체 객체 (네트워크/로그인 없음)
+
+        Args:
+            directory: 녹화 디렉토리
+            shift_time: 게시물 taken_at을 (현재 - 녹화 시각)만큼 이동
+                        (녹화 후 시간이 지나도 --days 필터 결과가 같도록)
+        """
+        if not os.path.isdir(directory):
+            raise FileNotFoundError(f"녹화 디렉토리가 없습니다: {directory}")
+        self.directory = directory
+        self.shift_time = shift_time
+        self._cache: Dict[str, Dict] = {}
+        self._lock = threading.Lock()
+        logger.info(f"▶️ instagrapi 응답 재생: {directory}")
+
+    def usernames(self) -> List[str]:
+        """녹화된 사용자명 목록"""
+        method_dir = os.path.join(self.directory, 'user_info_by_username_v1')
+        if not os.path.isdir(method_dir):
+            return []
+        return sorted(name[:-len('.json.gz')] for name in os.listdir(method_dir) if name.endswith('.json.gz'))
+
+    def user_info_by_username_v1(self, username: str) -> User:
+        return self._replay('user_info_by_username_v1', username)
+
+    def user_medias_v1(self, user_id, amount: int = 0) -> List[Media]:
+        medias = self._replay('user_medias_v1', user_id)
+        if amount and amount > len(medias):
+            logger.debug("녹화된 게시물 수(%d)가 요청 수(%d)보다 적음", len(medias), amount)
+        return medias[:amount] if amount else medias
+
+    def media_pk_from_code(self, code: str) -> str:
+        return self._replay('media_pk_from_code', code)
+
+    def media_info(self, media_pk) -> Media:
+        return self._replay('media_info', media_pk)
+
+    def _replay(self, method: str, key):
+        entry = self._load(method, key)
+
+        error = entry.get('error')
+        if error:
+            error_class = getattr(ig_exceptions, error['type'], ig_exceptions.ClientError)
+            raise error_class(error['message'])
+
+        response = entry['response']
+        model = RECORDED_METHODS[method]
+        if model is None:
+            return response
+
+        delta = None
+        if self.shift_time:
+            delta = datetime.now(timezone.utc) - datetime.fromisoformat(entry['recorded_at'])
+
+        if isinstance(response, list):
+            return [self._restore(model, item, delta) for item in response]
+        return self._restore(model, response, delta)
+
+    @staticmethod
+    def _restore(model, data: Dict, delta):
+        # 매 호출마다 새 객체 생성 (호출 측의 del/변경이 다음 재생에 영향 없도록)
+        obj = model.model_validate(data)
+        if delta is not None and getattr(obj, 'taken_at', None):
+            obj.taken_at = obj.taken_at + delta
+        return obj
+
+    def _load(self, method: str, key) -> Dict:
+        path = _record_path(self.directory, method, key)
+        with self._lock:
+            entry = self._cache.get(path)
+        if entry is not None:
+            return entry
+
+        try:
+            with gzip.open(path, 'rt', encoding='utf-8') as f:
+                entry = json.load(f)
+        except FileNotFoundError:
+            raise ReplayMissError(f"녹화되지 않은 요청: {method}({key})") from None
+
+        with self._lock:
+            self._cache[path] = entry
+        return entry
+
+    def __getattr__(self, name):
+        raise AttributeError(f"ReplayClient는 '{name}'을(를) 지원하지 않습니다 (재생 모드)")
+
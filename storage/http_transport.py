@@ -0,0 +1,137 @@
+"""
+이미지 다운로드용 HTTP 세션 (커넥션 풀/재시도/타임아웃 설정)
+"""
+import time
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from typing import Tuple
+from utils.logger import setup_logger
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+logger = setup_logger('http_transport')
+
+# 재시도 대상 HTTP 상태 코드
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+
+# 다운로드 중 발생 가능한 전송 계층 예외
+DOWNLOAD_ERRORS: Tuple[type, ...] = (requests.exceptions.RequestException,)
+if httpx is not None:
+    DOWNLOAD_ERRORS += (httpx.HTTPError,)
+
+DEFAULT_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+}
+
+
+def build_http_session(config: dict):
+    """
+    설정에 맞는 HTTP 세션 생성
+
+    http2가 켜져 있고 httpx[http2]가 설치되어 있으면 HTTP/2 세션을,
+    그렇지 않으면 커넥션 풀/재시도가 설정된 requests.Session을 반환한다.
+    두 세션 모두 get(url, timeout=(connect, read))을 지원한다.
+
+    Args:
+        config: HTTP_CONFIG
+
+    Returns:
+        requests.Session 또는 Http2Session
+    """
+    if config['http2']:
+        if httpx is None:
+            logger.warning("⚠️ httpx 미설치 - HTTP/1.1 세션 사용 (pip install 'httpx[http2]')")
+        else:
+            try:
+                return Http2Session(config)
+            except ImportError as e:
+                logger.warning(f"⚠️ HTTP/2 사용 불가 ({e}) - HTTP/1.1 세션 사용")
+
+    retry = Retry(
+        total=config['max_retries'],
+        backoff_factor=config['backoff_factor'],
+        status_forcelist=RETRY_STATUS_CODES,
+        allowed_methods=frozenset(['GET', 'HEAD']),
+        respect_retry_after_header=True,
+        raise_on_status=False
+    )
+    adapter = HTTPAdapter(
+        pool_connections=config['pool_connections'],
+        pool_maxsize=config['pool_maxsize'],
+        max_retries=retry,
+        pool_block=True
+    )
+
+    session = requests.Session()
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    session.headers.update(DEFAULT_HEADERS)
+    return session
+
+
+class Http2Session:
+    def __init__(self, config: dict):
+        """
+        httpx 기반 HTTP/2 세션
+
+        httpx 전송 계층은 연결 실패만 재시도하므로 429/5xx 재시도는 직접 처리한다.
+
+        Args:
+            config: HTTP_CONFIG
+        """
+        self.max_retries = config['max_retries']
+        self.backoff_factor = config['backoff_factor']
+        limits = httpx.Limits(
+            max_connections=config['pool_maxsize'],
+            max_keepalive_connections=config['pool_maxsize']
+        )
+        transport = httpx.HTTPTransport(
+            http2=True,
+            limits=limits,
+            retries=config['max_retries']
+        )
+        self.client = httpx.Client(
+            transport=transport,
+            headers=DEFAULT_HEADERS,
+            timeout=httpx.Timeout(config['read_timeout'], connect=config['connect_timeout']),
+            follow_redirects=True
+        )
+        self.headers = self.client.headers
+
+    def get(self, url: str, timeout=None):
+        """
+        GET 요청 (429/5xx는 지수 백오프로 재시도, Retry-After 우선)
+
+        Args:
+            url: 요청 URL
+            timeout: (connect, read) 튜플 또는 초 단위 숫자
+
+        Returns:
+            httpx.Response
+        """
+        if isinstance(timeout, tuple):
+            timeout = httpx.Timeout(timeout[1], connect=timeout[0])
+        elif timeout is None:
+            timeout = httpx.USE_CLIENT_DEFAULT
+
+        attempt = 0
+        while True:
+            response = self.client.get(url, timeout=timeout)
+            if response.status_code not in RETRY_STATUS_CODES or attempt >= self.max_retries:
+                return response
+
+            retry_after = response.headers.get('Retry-After')
+            if retry_after and retry_after.isdigit():
+                delay = int(retry_after)
+            else:
+                delay = self.backoff_factor * (2 ** attempt)
+            attempt += 1
+            logger.warning(f"⚠️ HTTP {response.status_code} - {delay:.1f}초 후 재시도 ({attempt}/{self.max_retries})")
+            time.sleep(delay)
+
+    def close(self):
+        self.client.close()
@@ -0,0 +1,169 @@
+"""
+다운로드 이미지 로컬 디스크 캐시 (Instagram CDN 경로 기준, LRU)
+"""
+import hashlib
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from typing import Optional
+from urllib.parse import urlsplit
+from utils.logger import setup_logger
+
+logger = setup_logger('image_cache')
+
+
+def canonical_cdn_path(url: str) -> str:
+    """
+    CDN URL에서 변하지 않는 경로만 추출
+
+    Instagram CDN URL은 호스트(scontent-xxx)와 서명 쿼리스트링이 요청마다
+    달라지므로 경로 부분만 같은 이미지를 가리키는 키로 사용한다.
+
+    Args:
+        url: 이미지 URL
+
+    Returns:
+        쿼리스트링/호스트를 제외한 경로 (예: '/v/t51.2885-15/123_n.jpg')
+    """
+    return urlsplit(url).path
+
+
+class ImageCache:
+    def __init__(self, directory: str, max_bytes: int):
+        """
+        디스크 캐시 초기화 (기존 캐시 파일을 수정 시각 순으로 인덱싱)
+
+        Args:
+            directory: 캐시 디렉토리
+            max_bytes: 최대 캐시 용량 (초과 시 오래 사용되지 않은 항목부터 삭제)
+        """
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()  # key -> size (오래된 순)
+        self._total_bytes = 0
+
+        os.makedirs(directory, exist_ok=True)
+        self._load_index()
+
+        logger.info(
+            f"✅ 이미지 캐시 초기화: {directory} "
+            f"({len(self._entries)}개, {self._total_bytes / 1024 / 1024:.1f}/{max_bytes / 1024 / 1024:.0f} MB)"
+        )
+
+    @staticmethod
+    def cache_key(url: str) -> str:
+        return hashlib.sha256(canonical_cdn_path(url).encode('utf-8')).hexdigest()
+
+    def get(self, url: str) -> Optional[bytes]:
+        """
+        캐시된 이미지 조회
+
+        Args:
+            url: 이미지 URL
+
+        Returns:
+            이미지 바이너리 또는 None
+        """
+        key = self.cache_key(url)
+        with self._lock:
+            if key not in self._entries:
+                return None
+            self._entries.move_to_end(key)
+
+        path = self._path(key)
+        try:
+            with open(path, 'rb') as f:
+                data = f.read()
+            # 재시작 후에도 사용 순서를 유지하도록 수정 시각 갱신
+            os.utime(path)
+            return data
+        except OSError:
+            self._forget(key)
+            return None
+
+    def put(self, url: str, data: bytes):
+        """
+        이미지 저장 (임시 파일에 쓴 뒤 교체하여 부분 기록 방지)
+
+        Args:
+            url: 이미지 URL
+            data: 이미지 바이너리
+        """
+        if len(data) > self.max_bytes:
+            return
+
+        key = self.cache_key(url)
+        path = self._path(key)
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix='.tmp')
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f"⚠️ 이미지 캐시 저장 실패: {e}")
+            return
+
+        with self._lock:
+            self._total_bytes -= self._entries.pop(key, 0)
+            self._entries[key] = len(data)
+            self._total_bytes += len(data)
+            evicted = self._evict()
+
+        for old_key in evicted:
+            self._remove_file(old_key)
+
+    def discard(self, url: str):
+        """캐시 항목 삭제 (손상된 데이터 등)"""
+        key = self.cache_key(url)
+        self._forget(key)
+
+    def _forget(self, key: str):
+        with self._lock:
+            self._total_bytes -= self._entries.pop(key, 0)
+        self._remove_file(key)
+
+    def _evict(self) -> list:
+        """용량 초과분을 LRU 순으로 인덱스에서 제거 (lock 보유 상태에서 호출)"""
+        evicted = []
+        while self._total_bytes > self.max_bytes and self._entries:
+            key, size = self._entries.popitem(last=False)
+            self._total_bytes -= size
+            evicted.append(key)
+        return evicted
+
+    def _remove_file(self, key: str):
+        self._remove_file_path(self._path(key))
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key[:2], key)
+
+    def _load_index(self):
+        files = []
+        for root, _, names in os.walk(self.directory):
+            for name in names:
+                path = os.path.join(root, name)
+                if name.endswith('.tmp'):
+                    self._remove_file_path(path)
+                    continue
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                files.append((stat.st_mtime, name, stat.st_size))
+
+        for _, key, size in sorted(files):
+            self._entries[key] = size
+            self._total_bytes += size
+
+        for key in self._evict():
+            self._remove_file(key)
+
+    @staticmethod
+    def _remove_file_path(path: str):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
@@ -1,29 +1,120 @@
 """
 이미지 다운로드 및 업로드 
 """
-import requests
-import uuid, os
+import uuid, os, threading
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from io import BytesIO
 from PIL import Image
-from typing import Optional, Dict, List
+from typing import Optional, Dict, List, Tuple
 from utils.logger import setup_logger
 from storage.r2_storage import R2StorageAdapter
+from storage.image_probe import probe_image
+from storage.image_cache import ImageCache, canonical_cdn_path
+from storage.http_transport import build_http_session, DOWNLOAD_ERRORS
+from utils.metrics import metrics
+from config.settings import IMAGE_CONFIG, HTTP_CONFIG
 
 logger = setup_logger('image_manager')
 
+
+def render_derivatives(
+    image_data: bytes,
+    thumbnail_width: int,
+    thumbnail_quality: int,
+    webp_enabled: bool,
+    webp_quality: int
+) -> List[Tuple[str, bytes, str]]:
+    """
+    원본 이미지로 파생 이미지(썸네일/WebP) 생성
+    
+    ProcessPoolExecutor에서 실행되므로 모듈 최상위 함수로 둔다.
+    
+    Args:
+        image_data: 원본 이미지 바이너리
+        thumbnail_width: 썸네일 가로 크기 (0이면 생성 안 함)
+        thumbnail_quality: 썸네일 JPEG 품질
+        webp_enabled: 원본 크기 WebP 재인코딩 여부
+        webp_quality: WebP 품질
+        
+    Returns:
+        [(variant, 바이너리, 확장자), ...]
+    """
+    derivatives = []
+    
+    with Image.open(BytesIO(image_data)) as img:
+        needs_thumbnail = bool(thumbnail_width) and img.width > thumbnail_width
+        if not needs_thumbnail and not webp_enabled:
+            return derivatives
+        
+        thumb_size = None
+        if needs_thumbnail:
+            thumb_size = (thumbnail_width, max(1, round(img.height * thumbnail_width / img.width)))
+            # 썸네일만 필요하면 JPEG 디코딩 단계에서 축소 (DCT 스케일링)
+            if not webp_enabled and img.format == 'JPEG':
+                img.draft('RGB', thumb_size)
+        
+        img.load()
+        
+        if needs_thumbnail:
+            thumb = img if img.mode in ('RGB', 'L') else img.convert('RGB')
+            thumb = thumb.resize(thumb_size, Image.LANCZOS)
+            buffer = BytesIO()
+            thumb.save(buffer, 'JPEG', quality=thumbnail_quality, optimize=True)
+            derivatives.append(('thumbnail', buffer.getvalue(), '.jpg'))
+        
+        if webp_enabled and img.format != 'WEBP':
+            buffer = BytesIO()
+            img.save(buffer, 'WEBP', quality=webp_quality, method=4)
+            derivatives.append(('webp', buffer.getvalue(), '.webp'))
+    
+    return derivatives
+
+
 class ImageManager:
-    def __init__(self, storage_adapter: R2StorageAdapter):
+    def __init__(
+        self,
+        storage_adapter: R2StorageAdapter,
+        config: Optional[dict] = None,
+        http_config: Optional[dict] = None
+    ):
         """
         이미지 관리자 초기화
         
         Args:
             storage_adapter: R2StorageAdapter 인스턴스
+            config: 이미지 처리 설정 (기본값: IMAGE_CONFIG)
+            http_config: 다운로드 HTTP 설정 (기본값: HTTP_CONFIG)
         """
         self.storage = storage_adapter
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        })
+        self.config = {**IMAGE_CONFIG, **(config or {})}
+        
+        http_config = {**HTTP_CONFIG, **(http_config or {})}
+        self.session = build_http_session(http_config)
+        self.timeout = (http_config['connect_timeout'], http_config['read_timeout'])
+        
+        # 파생 이미지 생성용 프로세스 풀 (첫 사용 시 생성)
+        self._derivative_pool = None
+        self._pool_lock = threading.Lock()
+        
+        # 다운로드 이미지 디스크 캐시 (cache_dir 설정 시에만 사용)
+        self.cache = None
+        if self.config['cache_dir']:
+            self.cache = ImageCache(
+                self.config['cache_dir'],
+                self.config['cache_max_mb'] * 1024 * 1024
+            )
+    
+    @property
+    def derivatives_enabled(self) -> bool:
+        return bool(self.config['thumbnail_width']) or self.config['webp_enabled']
+    
+    def close(self):
+        """파생 이미지 프로세스 풀 및 HTTP 세션 종료"""
+        if self._derivative_pool:
+            self._derivative_pool.shutdown(wait=True)
+            self._derivative_pool = None
+        self.session.close()
     
     def download_and_upload_image(
         self, 
@@ -44,7 +135,11 @@ class ImageManager:
             {
                 'file_path': str,
                 'file_size': int,
-                'original_name': str
+                'original_name': str,
+                'is_main': bool,
+                'perform_id': int,
+                'variant': 'original',
+                'derivatives': [파생 이미지 결과 딕셔너리, ...]
             }
         """
         if not image_url:
@@ -52,27 +147,42 @@ class ImageManager:
             return None
         
         try:
-            # 1. 이미지 다운로드
-            logger.info(f"📥 이미지 다운로드 시작: {image_url[:100]}...")
-            response = self.session.get(image_url, timeout=30)
-            response.raise_for_status()
+            # 1. 이미지 다운로드 (캐시 우선)
+            image_data = self.cache.get(image_url) if self.cache else None
+            from_cache = image_data is not None
+            
+            if from_cache:
+                metrics.incr('image.cache_hit')
+                logger.debug("💾 캐시에서 이미지 로드: %.100s...", image_url)
+            else:
+                if self.cache:
+                    metrics.incr('image.cache_miss')
+                logger.debug("📥 이미지 다운로드 시작: %.100s...", image_url)
+                with metrics.timer('image.download'):
+                    response = self.session.get(image_url, timeout=self.timeout)
+                    response.raise_for_status()
+                    image_data = response.content
+                metrics.incr('image.bytes_downloaded', len(image_data))
             
-            image_data = response.content
             file_size = len(image_data)
             
-            logger.info(f"✅ 다운로드 완료: {file_size / 1024:.2f} KB")
+            logger.debug("✅ 다운로드 완료: %.2f KB", file_size / 1024)
             
-            # 2. 이미지 검증 (PIL로 열어서 유효성 확인)
-            try:
-                img = Image.open(BytesIO(image_data))
-                img.verify()
-                logger.info(f"✅ 이미지 검증 완료: {img.format}, {img.size}")
-            except Exception as e:
-                logger.error(f"❌ 이미지 검증 실패: {e}")
+            # 2. 이미지 검증 (헤더 검사 또는 PIL)
+            with metrics.timer('image.validate'):
+                validated = self._validate_image(image_data)
+            if not validated:
+                if from_cache:
+                    self.cache.discard(image_url)
                 return None
+            image_format, image_size = validated
+            
+            # 검증된 이미지만 캐시에 저장
+            if self.cache and not from_cache:
+                self.cache.put(image_url, image_data)
             
             # 3. 파일명 생성
-            extension = self._get_extension(image_url, img.format)
+            extension = self._get_extension(image_url, image_format)
             uuid_str = str(uuid.uuid4())
             file_name = f"{uuid_str}{extension}"
 
@@ -80,26 +190,36 @@ class ImageManager:
             file_path = f"perform_tmp/{perform_id}/{file_name}"
             
             # 4. R2 업로드
-            logger.info(f"📤 R2 업로드 시작: {file_path}")
+            logger.debug("📤 R2 업로드 시작: %s", file_path)
             uploaded_path = self.storage.upload(image_data, file_path)
             
-            original_name = os.path.basename(image_url.split("?")[0])  
+            original_name = os.path.basename(canonical_cdn_path(image_url))
             if not original_name:
                 original_name = "unknown"
             
             if uploaded_path:
+                # 5. 파생 이미지 (썸네일/WebP) 생성 및 업로드
+                derivatives = []
+                if self.derivatives_enabled:
+                    with metrics.timer('image.derivatives'):
+                        derivatives = self._create_derivatives(
+                            image_data, perform_id, uuid_str, original_name
+                        )
+                
                 return {
                     'file_path': uploaded_path,
                     'file_size': file_size,
                     'original_name': original_name,
                     'is_main': is_main,
-                    'perform_id': perform_id
+                    'perform_id': perform_id,
+                    'variant': 'original',
+                    'derivatives': derivatives
                 }
             else:
                 logger.error("❌ R2 업로드 실패")
                 return None
                 
-        except requests.exceptions.RequestException as e:
+        except DOWNLOAD_ERRORS as e:
             logger.error(f"❌ 이미지 다운로드 실패: {e}")
             return None
         except Exception as e:
@@ -123,21 +243,140 @@ class ImageManager:
         Returns:
             업로드 결과 리스트
         """
-        results = []
+        total = len(image_urls)
         
-        for i, url in enumerate(image_urls):
+        def process(i: int, url: str) -> Optional[Dict]:
             is_main = (i == 0)  # 첫 번째 이미지를 메인으로
             
-            logger.info(f"\n[{i+1}/{len(image_urls)}] 이미지 처리 중...")
+            logger.debug("[%d/%d] 이미지 처리 중...", i + 1, total)
             result = self.download_and_upload_image(url, perform_id, is_main)
             
             if result:
-                results.append(result)
-                logger.info(f"✅ 이미지 {i+1} 처리 완료")
+                logger.info(
+                    "✅ 이미지 %d/%d 처리 완료",
+                    i + 1, total,
+                    extra={'perform_id': perform_id, 'file_path': result['file_path'], 'file_size': result['file_size']}
+                )
             else:
                 logger.warning(f"⚠️ 이미지 {i+1} 처리 실패")
+            return result
+        
+        workers = min(self.config['download_workers'], total)
+        if workers > 1:
+            # Carousel 이미지는 동시에 다운로드/업로드 (결과 순서는 입력 순서 유지)
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                outcomes = list(executor.map(process, range(total), image_urls))
+        else:
+            outcomes = [process(i, url) for i, url in enumerate(image_urls)]
+        
+        results = [result for result in outcomes if result]
+        
+        logger.info(f"\n총 {len(results)}/{total}개 이미지 업로드 완료")
+        return results
+    
+    def _validate_image(self, image_data: bytes) -> Optional[Tuple[str, Tuple[int, int]]]:
+        """
+        이미지 유효성 검증
+        
+        validation_mode가 'header'이면 헤더만 읽어 포맷/크기를 확인하고,
+        판단할 수 없는 경우에만 PIL verify로 대체한다.
+        
+        Args:
+            image_data: 이미지 바이너리
+            
+        Returns:
+            (포맷, (width, height)) 또는 검증 실패 시 None
+        """
+        if self.config['validation_mode'] == 'header':
+            probed = probe_image(image_data)
+            if probed:
+                logger.debug("✅ 이미지 검증 완료 (헤더): %s, %s", probed[0], probed[1])
+                return probed
+        
+        try:
+            img = Image.open(BytesIO(image_data))
+            img.verify()
+            logger.debug("✅ 이미지 검증 완료: %s, %s", img.format, img.size)
+            return img.format, img.size
+        except Exception as e:
+            logger.error(f"❌ 이미지 검증 실패: {e}")
+            return None
+    
+    def _create_derivatives(
+        self,
+        image_data: bytes,
+        perform_id: int,
+        uuid_str: str,
+        original_name: str
+    ) -> List[Dict]:
+        """
+        파생 이미지 생성 후 R2 업로드
+        
+        PIL 작업은 프로세스 풀에서 실행되어 GIL을 점유하지 않으므로 다른 다운로드/업로드 스레드는
+        계속 진행된다. 호출한 스레드는 렌더링이 끝날 때까지 기다린 뒤 파생 이미지를 업로드한다.
+        
+        Args:
+            image_data: 원본 이미지 바이너리
+            perform_id: 공연 ID
+            uuid_str: 원본 파일명 UUID (파생 파일명에 사용)
+            original_name: 원본 파일명
+            
+        Returns:
+            파생 이미지 업로드 결과 리스트
+        """
+        args = (
+            image_data,
+            self.config['thumbnail_width'],
+            self.config['thumbnail_quality'],
+            self.config['webp_enabled'],
+            self.config['webp_quality']
+        )
+        
+        try:
+            if self.config['derivative_workers'] > 0:
+                with self._pool_lock:
+                    if self._derivative_pool is None:
+                        # 다운로드/로깅 스레드가 실행 중인 프로세스를 fork하면 자식이 잠긴 락을 물려받을 수 있으므로
+                        # forkserver(미지원 플랫폼은 spawn)로 작업 프로세스 생성
+                        start_method = 'forkserver' if 'forkserver' in multiprocessing.get_all_start_methods() else 'spawn'
+                        self._derivative_pool = ProcessPoolExecutor(
+                            max_workers=self.config['derivative_workers'],
+                            mp_context=multiprocessing.get_context(start_method)
+                        )
+                rendered = self._derivative_pool.submit(render_derivatives, *args).result()
+            else:
+                rendered = render_derivatives(*args)
+        except Exception as e:
+            logger.warning(f"⚠️ 파생 이미지 생성 실패: {e}")
+            return []
+        
+        if not rendered:
+            return []
+        
+        # 파생 이미지는 한 번에 동시 업로드
+        uploads = []
+        for variant, data, extension in rendered:
+            suffix = '_thumb' if variant == 'thumbnail' else ''
+            uploads.append((f"perform_tmp/{perform_id}/{uuid_str}{suffix}{extension}", data))
+        
+        upload_results = self.storage.upload_many(uploads)
+        
+        results = []
+        for (variant, data, _), upload_result in zip(rendered, upload_results):
+            if not upload_result['success']:
+                logger.warning(f"⚠️ 파생 이미지 업로드 실패: {variant}")
+                continue
+            
+            logger.debug("✅ 파생 이미지 업로드 완료: %s, %.2f KB", variant, len(data) / 1024)
+            results.append({
+                'file_path': upload_result['file_path'],
+                'file_size': len(data),
+                'original_name': original_name,
+                'is_main': False,
+                'perform_id': perform_id,
+                'variant': variant
+            })
         
-        logger.info(f"\n총 {len(results)}/{len(image_urls)}개 이미지 업로드 완료")
         return results
     
     def _get_extension(self, url: str, image_format: Optional[str]) -> str:
@@ -0,0 +1,126 @@
+"""
+이미지 헤더 검사 (디코딩 없이 포맷/크기 확인)
+"""
+import struct
+from typing import Optional, Tuple
+
+# 길이 필드가 없는 JPEG 마커 (TEM, RST0-7)
+_JPEG_STANDALONE_MARKERS = {0x01} | set(range(0xD0, 0xD8))
+
+# 크기 정보를 담은 JPEG SOF 마커 (DHT/JPG/DAC 제외)
+_JPEG_SOF_MARKERS = {
+    0xC0, 0xC1, 0xC2, 0xC3, 0xC5, 0xC6, 0xC7,
+    0xC9, 0xCA, 0xCB, 0xCD, 0xCE, 0xCF
+}
+
+
+def probe_image(data: bytes) -> Optional[Tuple[str, Tuple[int, int]]]:
+    """
+    매직 바이트와 헤더만 읽어 이미지 포맷과 크기 확인
+
+    JPEG/PNG/GIF/WebP를 지원하며, 헤더가 정상이어도 파일 끝 표식(EOI/IEND 등)이
+    없거나 RIFF 크기가 맞지 않으면 잘린 파일일 수 있으므로 판단하지 않는다.
+
+    Args:
+        data: 이미지 바이너리
+
+    Returns:
+        (PIL 포맷명, (width, height)) 또는 판단 불가 시 None
+    """
+    try:
+        if data[:3] == b'\xff\xd8\xff':
+            result = _probe_jpeg(data)
+        elif data[:8] == b'\x89PNG\r\n\x1a\n':
+            result = _probe_png(data)
+        elif data[:6] in (b'GIF87a', b'GIF89a'):
+            result = _probe_gif(data)
+        elif data[:4] == b'RIFF' and data[8:12] == b'WEBP':
+            result = _probe_webp(data)
+        else:
+            return None
+    except (struct.error, IndexError):
+        return None
+
+    if not result:
+        return None
+
+    image_format, (width, height) = result
+    if width <= 0 or height <= 0:
+        return None
+    return image_format, (width, height)
+
+
+def _probe_jpeg(data: bytes) -> Optional[Tuple[str, Tuple[int, int]]]:
+    # 끝 표식(EOI) 확인 - 뒤에 패딩이 붙는 경우는 PIL 판단에 맡김
+    if not data.endswith(b'\xff\xd9'):
+        return None
+
+    pos = 2
+    length = len(data)
+    while pos < length:
+        if data[pos] != 0xFF:
+            return None
+        # 채움 바이트(0xFF) 건너뛰기
+        while pos < length and data[pos] == 0xFF:
+            pos += 1
+        marker = data[pos]
+        pos += 1
+
+        if marker in _JPEG_STANDALONE_MARKERS:
+            continue
+        # 크기 정보 전에 이미지 데이터(SOS)나 끝(EOI)이 나오면 판단 불가
+        if marker in (0xDA, 0xD9):
+            return None
+
+        segment_length = struct.unpack('>H', data[pos:pos + 2])[0]
+        if marker in _JPEG_SOF_MARKERS:
+            height, width = struct.unpack('>HH', data[pos + 3:pos + 7])
+            return 'JPEG', (width, height)
+        pos += segment_length
+
+    return None
+
+
+def _probe_png(data: bytes) -> Optional[Tuple[str, Tuple[int, int]]]:
+    if data[12:16] != b'IHDR':
+        return None
+    # 마지막 청크는 IEND (길이 0 + 'IEND' + CRC)
+    if data[-8:-4] != b'IEND':
+        return None
+    width, height = struct.unpack('>II', data[16:24])
+    return 'PNG', (width, height)
+
+
+def _probe_gif(data: bytes) -> Optional[Tuple[str, Tuple[int, int]]]:
+    # 트레일러(0x3B) 확인
+    if not data.endswith(b'\x3b'):
+        return None
+    width, height = struct.unpack('<HH', data[6:10])
+    return 'GIF', (width, height)
+
+
+def _probe_webp(data: bytes) -> Optional[Tuple[str, Tuple[int, int]]]:
+    # RIFF 크기 필드로 잘림 여부 확인
+    riff_size = struct.unpack('<I', data[4:8])[0]
+    if riff_size + 8 != len(data):
+        return None
+
+    chunk = data[12:16]
+    if chunk == b'VP8 ':
+        # 손실 압축: 프레임 태그(3) + 시작 코드(9d 01 2a) + 14비트 크기
+        if data[23:26] != b'\x9d\x01\x2a':
+            return None
+        width, height = struct.unpack('<HH', data[26:30])
+        return 'WEBP', (width & 0x3FFF, height & 0x3FFF)
+    if chunk == b'VP8L':
+        # 무손실 압축: 시그니처(0x2f) + 14비트(width-1) + 14비트(height-1)
+        if data[20] != 0x2F:
+            return None
+        bits = struct.unpack('<I', data[21:25])[0]
+        return 'WEBP', ((bits & 0x3FFF) + 1, ((bits >> 14) & 0x3FFF) + 1)
+    if chunk == b'VP8X':
+        # 확장 포맷: 24비트(canvas width-1), 24비트(canvas height-1)
+        width = int.from_bytes(data[24:27], 'little') + 1
+        height = int.from_bytes(data[27:30], 'little') + 1
+        return 'WEBP', (width, height)
+    return None
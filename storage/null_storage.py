@@ -0,0 +1,61 @@
+"""
+업로드하지 않는 스토리지 어댑터 (--dry-run)
+"""
+import io
+from typing import Dict, Iterable, Iterator, Optional
+from utils.logger import setup_logger
+from utils.metrics import metrics
+from storage.r2_storage import R2StorageAdapter, UploadBody, MB
+
+logger = setup_logger('null_storage')
+
+
+class NullStorageAdapter(R2StorageAdapter):
+    def __init__(self, config: Optional[dict] = None):
+        """
+        R2StorageAdapter와 같은 인터페이스로 업로드 본문을 읽기만 하고 버리는 어댑터
+
+        upload/upload_many는 부모 구현(동시 업로드 스레드 풀 포함)을 그대로 사용하고,
+        실제 전송 단계(_upload)만 no-op으로 바꿔 r2.upload 타이머/바이트 카운터를 유지한다.
+
+        Args:
+            config: R2_CONFIG (upload_workers, multipart_threshold_mb만 사용, 접속 정보 불필요)
+        """
+        config = config or {}
+        self.bucket_name = config.get('bucket_name') or 'dry-run'
+        self.multipart_threshold = config.get('multipart_threshold_mb', 8) * MB
+        self.upload_workers = config.get('upload_workers', 8)
+        self.client = None
+        logger.info("🧪 DRY-RUN: R2 업로드 비활성화 (업로드 본문은 읽고 버림)")
+
+    @metrics.timed('r2.upload')
+    def _upload(self, body: UploadBody, file_path: str, content_type: Optional[str] = None):
+        """업로드 대신 본문 크기만 집계 (스트림/이터레이터는 끝까지 소비)"""
+        if isinstance(body, (bytes, bytearray)):
+            size = len(body)
+        elif hasattr(body, 'read'):
+            size = 0
+            for chunk in iter(lambda: body.read(MB), b''):
+                size += len(chunk)
+        else:
+            size = sum(len(chunk) for chunk in body)
+        metrics.incr('r2.bytes_uploaded', size)
+        logger.debug("🧪 DRY-RUN 업로드 생략: %s (%d bytes)", file_path, size)
+
+    def delete(self, file_path: str) -> bool:
+        logger.info(f"🧪 DRY-RUN 삭제 생략: {file_path}")
+        return True
+
+    def delete_many(self, file_paths: Iterable[str]) -> Dict:
+        file_paths = list(dict.fromkeys(path for path in file_paths if path))
+        logger.info(f"🧪 DRY-RUN 일괄 삭제 생략: {len(file_paths)}개")
+        return {'deleted': file_paths, 'errors': []}
+
+    def list_objects(self, prefix: str) -> Iterator[Dict]:
+        return iter(())
+
+    def exists(self, file_path: str) -> bool:
+        return False
+
+    def generate_presigned_url(self, file_path: str, expires_in: int = 3600) -> str:
+        return f"dry-run://{self.bucket_name}/{file_path}"
@@ -2,14 +2,49 @@
 R2 스토리지 어댑터
 """
 import boto3
+from boto3.s3.transfer import TransferConfig
+from botocore.config import Config
 from botocore.exceptions import ClientError
-import os
-from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
+import io, os
+from typing import Optional, Union, BinaryIO, Iterable, Iterator, List, Dict, Tuple
 from utils.logger import setup_logger
+from utils.metrics import metrics
 
 logger = setup_logger('r2_storage')
 
+MB = 1024 * 1024
+
+# 업로드 가능한 본문: 바이너리, 파일 객체, 바이트 청크 이터레이터
+UploadBody = Union[bytes, bytearray, BinaryIO, Iterable[bytes]]
+
+
+class _IterableStream(io.RawIOBase):
+    """바이트 청크 이터레이터를 읽기 전용 파일 객체로 변환"""
+    
+    def __init__(self, chunks: Iterable[bytes]):
+        self._chunks: Iterator[bytes] = iter(chunks)
+        self._pending = b''
+    
+    def readable(self) -> bool:
+        return True
+    
+    def readinto(self, buffer) -> int:
+        while not self._pending:
+            try:
+                self._pending = next(self._chunks)
+            except StopIteration:
+                return 0
+        size = min(len(buffer), len(self._pending))
+        buffer[:size] = self._pending[:size]
+        self._pending = self._pending[size:]
+        return size
+
+
 class R2StorageAdapter:
+    # DeleteObjects 요청당 최대 키 수
+    DELETE_BATCH_SIZE = 1000
+    
     def __init__(self, config: dict):
         """
         R2 클라이언트 초기화
@@ -20,41 +55,95 @@ class R2StorageAdapter:
                 'access_key_id': str,
                 'secret_access_key': str,
                 'endpoint_url': str,
-                'region': str (optional, default='auto')
+                'region': str (optional, default='auto'),
+                'multipart_threshold_mb': int (optional, 이 크기 이상은 멀티파트 업로드),
+                'multipart_chunksize_mb': int (optional, 파트 크기, R2 최소 5MB),
+                'max_concurrency': int (optional, 파일당 동시 파트 업로드 수),
+                'upload_workers': int (optional, upload_many 동시 업로드 수),
+                'max_pool_connections': int (optional, HTTP 커넥션 풀 크기),
+                'retry_mode': str (optional, 'standard' | 'adaptive' | 'legacy'),
+                'max_attempts': int (optional, 최초 요청 포함 최대 시도 횟수),
+                'connect_timeout': float (optional, 연결 타임아웃 초),
+                'read_timeout': float (optional, 읽기 타임아웃 초),
+                'tcp_keepalive': bool (optional, TCP keepalive 사용)
             }
         """
         self.bucket_name = config['bucket_name']
+        self.multipart_threshold = config.get('multipart_threshold_mb', 8) * MB
+        self.upload_workers = config.get('upload_workers', 8)
+        self.transfer_config = TransferConfig(
+            multipart_threshold=self.multipart_threshold,
+            multipart_chunksize=config.get('multipart_chunksize_mb', 8) * MB,
+            max_concurrency=config.get('max_concurrency', 4),
+            use_threads=True
+        )
         self.client = boto3.client(
             's3',
             region_name=config.get('region', 'auto'),
             endpoint_url=config['endpoint_url'],
             aws_access_key_id=config['access_key_id'],
-            aws_secret_access_key=config['secret_access_key']
+            aws_secret_access_key=config['secret_access_key'],
+            config=self._build_client_config(config)
         )
         logger.info(f"✅ R2 클라이언트 초기화 완료: {self.bucket_name}")
     
-    def upload(self, buffer: bytes, file_path: str) -> Optional[str]:
+    @staticmethod
+    def _build_client_config(config: dict) -> Config:
+        """
+        boto3 클라이언트 전송 설정
+        
+        커넥션 풀은 동시 업로드 수(upload_workers x max_concurrency)보다 작으면
+        풀 대기가 생기므로 최소 그 크기 이상으로 맞춘다.
+        
+        Args:
+            config: R2_CONFIG
+            
+        Returns:
+            botocore Config
+        """
+        concurrent_requests = config.get('upload_workers', 8) * config.get('max_concurrency', 4)
+        max_pool_connections = max(config.get('max_pool_connections', 32), concurrent_requests)
+        
+        client_config = Config(
+            max_pool_connections=max_pool_connections,
+            retries={
+                'mode': config.get('retry_mode', 'adaptive'),
+                'max_attempts': config.get('max_attempts', 5)
+            },
+            connect_timeout=config.get('connect_timeout', 5),
+            read_timeout=config.get('read_timeout', 60),
+            tcp_keepalive=config.get('tcp_keepalive', True)
+        )
+        logger.info(
+            f"   전송 설정: pool={max_pool_connections}, "
+            f"retry={client_config.retries['mode']}/{client_config.retries['max_attempts']}, "
+            f"timeout={client_config.connect_timeout}s/{client_config.read_timeout}s"
+        )
+        return client_config
+    
+    def upload(
+        self,
+        buffer: UploadBody,
+        file_path: str,
+        content_type: Optional[str] = None
+    ) -> Optional[str]:
         """
         R2에 파일 업로드
         
+        multipart_threshold 미만의 바이너리는 단일 put_object로, 그 외(큰 파일,
+        파일 객체, 이터레이터)는 boto3 managed transfer(멀티파트)로 업로드한다.
+        
         Args:
-            buffer: 파일 바이너리 데이터
+            buffer: 파일 바이너리 데이터, 파일 객체 또는 바이트 청크 이터레이터
             file_path: R2에 저장될 경로 (예: 'performance/123/image.jpg')
+            content_type: Content-Type (기본값: 확장자로 결정)
             
         Returns:
             업로드된 파일 경로 또는 None
         """
         try:
-            content_type = self._get_content_type(file_path)
-            
-            self.client.put_object(
-                Bucket=self.bucket_name,
-                Key=file_path,
-                Body=buffer,
-                ContentType=content_type
-            )
-            
-            logger.info(f"✅ R2 업로드 성공: {file_path}")
+            self._upload(buffer, file_path, content_type)
+            logger.debug("✅ R2 업로드 성공: %s", file_path)
             return file_path
             
         except ClientError as e:
@@ -64,6 +153,75 @@ class R2StorageAdapter:
             logger.error(f"❌ R2 업로드 오류: {e}")
             return None
     
+    def upload_many(
+        self,
+        items: Iterable[Tuple[str, UploadBody]],
+        max_workers: Optional[int] = None
+    ) -> List[Dict]:
+        """
+        여러 파일 동시 업로드
+        
+        Args:
+            items: (file_path, body) 리스트
+            max_workers: 동시 업로드 수 (기본값: upload_workers 설정)
+            
+        Returns:
+            입력 순서대로 [{'file_path': str, 'success': bool, 'error': str or None}, ...]
+        """
+        items = list(items)
+        if not items:
+            return []
+        
+        def upload_one(item: Tuple[str, UploadBody]) -> Dict:
+            file_path, body = item
+            try:
+                self._upload(body, file_path)
+                return {'file_path': file_path, 'success': True, 'error': None}
+            except Exception as e:
+                logger.error(f"❌ R2 업로드 실패: {file_path} ({e})")
+                return {'file_path': file_path, 'success': False, 'error': str(e)}
+        
+        workers = min(max_workers or self.upload_workers, len(items))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(upload_one, items))
+        
+        succeeded = sum(1 for result in results if result['success'])
+        logger.info(f"✅ R2 일괄 업로드: {succeeded}/{len(results)}개 성공")
+        return results
+    
+    @metrics.timed('r2.upload')
+    def _upload(self, body: UploadBody, file_path: str, content_type: Optional[str] = None):
+        """업로드 본문 종류/크기에 따라 put_object 또는 managed transfer 사용 (실패 시 예외)"""
+        content_type = content_type or self._get_content_type(file_path)
+        
+        if isinstance(body, (bytes, bytearray)):
+            if len(body) < self.multipart_threshold:
+                self.client.put_object(
+                    Bucket=self.bucket_name,
+                    Key=file_path,
+                    Body=body,
+                    ContentType=content_type
+                )
+                metrics.incr('r2.bytes_uploaded', len(body))
+                return
+            fileobj = io.BytesIO(body)
+        elif hasattr(body, 'read'):
+            fileobj = body
+        else:
+            fileobj = io.BufferedReader(_IterableStream(body), buffer_size=MB)
+        
+        # 스트림은 크기를 미리 알 수 없으므로 전송 콜백으로 집계 (재시도 시 음수 값으로 되돌려짐)
+        transferred = []
+        self.client.upload_fileobj(
+            fileobj,
+            self.bucket_name,
+            file_path,
+            ExtraArgs={'ContentType': content_type},
+            Config=self.transfer_config,
+            Callback=transferred.append
+        )
+        metrics.incr('r2.bytes_uploaded', sum(transferred))
+    
     def delete(self, file_path: str) -> bool:
         """
         R2에서 파일 삭제
@@ -86,6 +244,71 @@ class R2StorageAdapter:
             logger.error(f"❌ R2 삭제 실패: {e}")
             return False
     
+    @metrics.timed('r2.delete_many')
+    def delete_many(self, file_paths: Iterable[str]) -> Dict:
+        """
+        R2에서 여러 파일 일괄 삭제 (DeleteObjects, 요청당 최대 1000개)
+        
+        Args:
+            file_paths: 삭제할 파일 경로 리스트
+            
+        Returns:
+            {'deleted': [경로, ...], 'errors': [{'file_path': str, 'error': str}, ...]}
+        """
+        file_paths = list(dict.fromkeys(path for path in file_paths if path))
+        result = {'deleted': [], 'errors': []}
+        
+        for start in range(0, len(file_paths), self.DELETE_BATCH_SIZE):
+            chunk = file_paths[start:start + self.DELETE_BATCH_SIZE]
+            try:
+                response = self.client.delete_objects(
+                    Bucket=self.bucket_name,
+                    Delete={
+                        'Objects': [{'Key': path} for path in chunk],
+                        'Quiet': True
+                    }
+                )
+            except ClientError as e:
+                logger.error(f"❌ R2 일괄 삭제 실패 ({len(chunk)}개): {e}")
+                result['errors'].extend({'file_path': path, 'error': str(e)} for path in chunk)
+                continue
+            
+            # Quiet 모드는 실패한 항목만 반환
+            failed = {}
+            for error in response.get('Errors', []):
+                failed[error['Key']] = f"{error.get('Code')}: {error.get('Message')}"
+            
+            for path in chunk:
+                if path in failed:
+                    result['errors'].append({'file_path': path, 'error': failed[path]})
+                else:
+                    result['deleted'].append(path)
+        
+        if file_paths:
+            logger.info(f"✅ R2 일괄 삭제: {len(result['deleted'])}/{len(file_paths)}개")
+        if result['errors']:
+            logger.warning(f"⚠️ R2 삭제 실패: {len(result['errors'])}개")
+        return result
+    
+    def list_objects(self, prefix: str) -> Iterator[Dict]:
+        """
+        경로 접두사로 파일 목록 조회 (페이지 단위로 순회)
+        
+        Args:
+            prefix: 경로 접두사 (예: 'perform_tmp/')
+            
+        Yields:
+            {'file_path': str, 'size': int, 'last_modified': datetime}
+        """
+        paginator = self.client.get_paginator('list_objects_v2')
+        for page in paginator.paginate(Bucket=self.bucket_name, Prefix=prefix):
+            for obj in page.get('Contents', []):
+                yield {
+                    'file_path': obj['Key'],
+                    'size': obj['Size'],
+                    'last_modified': obj['LastModified']
+                }
+    
     def exists(self, file_path: str) -> bool:
         """
         파일 존재 여부 확인
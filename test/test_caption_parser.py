@@ -0,0 +1,190 @@
+"""
+캡션 추출(utils/caption_parser) 테스트
+"""
+import os, sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+from utils.caption_parser import PARSER_VERSION, SUGGESTION_FIELDS, caption_hash, parse_caption, parse_captions
+
+POSTED = '2024-11-01'
+
+
+def test_empty_caption():
+    assert parse_caption(None) == {'version': PARSER_VERSION}
+    assert parse_caption('   \n ') == {'version': PARSER_VERSION}
+
+
+def test_full_announcement():
+    caption = (
+        "2024.11.23 (토) 단독 공연\n"
+        "OPEN 19:00 / START 20:00\n"
+        "예매 25,000원 / 현장 30,000원\n"
+        "예매: https://forms.gle/abc123\n"
+        "LINE UP\n"
+        "Band A\n"
+        "Band B x Band C\n"
+        "\n"
+        "#live #hongdae"
+    )
+    assert parse_caption(caption, POSTED) == {
+        'version': PARSER_VERSION,
+        'title': '2024.11.23 (토) 단독 공연',
+        'perform_date': '2024-11-23',
+        'perform_time': '20:00',
+        'booking_price': 25000,
+        'onsite_price': 30000,
+        'booking_url': 'https://forms.gle/abc123',
+        'artists': ['Band A', 'Band B', 'Band C'],
+    }
+
+
+def test_only_suggestion_fields():
+    caption = "11월 23일 오후 8시\n예매 2만원\nLINE UP: A, B\nhttps://forms.gle/x"
+    assert set(parse_caption(caption, POSTED)) <= set(SUGGESTION_FIELDS)
+
+
+# 날짜
+
+@pytest.mark.parametrize('caption, expected', [
+    ("2024.11.23 공연", '2024-11-23'),
+    ("24-11-23 공연", '2024-11-23'),
+    ("2024년 11월 23일", '2024-11-23'),
+    ("11월 23일 토요일", '2024-11-23'),
+    ("Nov 23rd, 2024", '2024-11-23'),
+    ("23 November party", '2024-11-23'),
+    ("11.23 (토) 라이브", '2024-11-23'),
+    ("11/23 SAT", '2024-11-23'),
+    ("DATE: 11/23", '2024-11-23'),
+    ("일시 : 11.23", '2024-11-23'),
+])
+def test_date_formats(caption, expected):
+    assert parse_caption(caption, POSTED)['perform_date'] == expected
+
+
+@pytest.mark.parametrize('caption', [
+    "Update: the show starts at 9. 3/4 of tickets sold",
+    "1/2 price drinks all night",
+    "v2.5 release",
+    "11월 32일",
+])
+def test_no_date(caption):
+    assert 'perform_date' not in parse_caption(caption, POSTED)
+
+
+def test_date_without_year_rolls_over_to_next_year():
+    assert parse_caption("1월 3일 공연", '2024-12-20')['perform_date'] == '2025-01-03'
+    assert parse_caption("12/7 (SAT)", '2024-12-20')['perform_date'] == '2024-12-07'
+
+
+def test_first_date_wins_among_same_format_confidence():
+    caption = "11/30 (토) 공연\n12/7 (토) 얼리버드 마감"
+    assert parse_caption(caption, POSTED)['perform_date'] == '2024-11-30'
+
+
+def test_full_date_beats_bare_labelled_date():
+    caption = "DATE: 11/30\n2024.12.07 공연"
+    assert parse_caption(caption, POSTED)['perform_date'] == '2024-12-07'
+
+
+# 시간
+
+@pytest.mark.parametrize('caption, expected', [
+    ("START 20:00", '20:00'),
+    ("OPEN 19:00 / START 20:00", '20:00'),
+    ("OPEN 7PM", '19:00'),
+    ("8:30 PM", '20:30'),
+    ("오후 8시 반", '20:30'),
+    ("오후 8시 30분", '20:30'),
+    ("9시", '21:00'),
+    ("오전 11시", '11:00'),
+    ("12 AM", '00:00'),
+])
+def test_time_formats(caption, expected):
+    assert parse_caption(caption, POSTED)['perform_time'] == expected
+
+
+@pytest.mark.parametrize('caption', [
+    "러닝타임 2시간",
+    "the show starts at 9.",
+    "25:00",
+])
+def test_no_time(caption):
+    assert 'perform_time' not in parse_caption(caption, POSTED)
+
+
+# 가격
+
+@pytest.mark.parametrize('caption, expected', [
+    ("예매 2만원 / 현장 2만 5천원", {'booking_price': 20000, 'onsite_price': 25000}),
+    ("ADV ₩20000 DOOR ₩25,000", {'booking_price': 20000, 'onsite_price': 25000}),
+    ("입장료 15,000원", {'onsite_price': 15000}),
+    ("사전예약 10000원", {'booking_price': 10000}),
+    ("티켓 1.5만원", {'onsite_price': 15000}),
+    ("TICKET 30,000", {'onsite_price': 30000}),
+    ("무료입장", {'onsite_price': 0}),
+])
+def test_prices(caption, expected):
+    found = parse_caption(caption, POSTED)
+    assert {key: found[key] for key in ('booking_price', 'onsite_price') if key in found} == expected
+
+
+@pytest.mark.parametrize('caption', [
+    "팔로워 12,000명 감사합니다",
+    "500원",
+    "Room 1,234",
+])
+def test_no_price(caption):
+    found = parse_caption(caption, POSTED)
+    assert 'booking_price' not in found and 'onsite_price' not in found
+
+
+# 예매 링크
+
+@pytest.mark.parametrize('caption, expected', [
+    ("예매: https://forms.gle/abc123", 'https://forms.gle/abc123'),
+    ("tickets: linktr.ee/club", 'https://linktr.ee/club'),
+    ("more www.example.com/info.", 'https://www.example.com/info'),
+    ("blog https://example.com/a\n예매 https://ticket.interpark.com/x", 'https://ticket.interpark.com/x'),
+])
+def test_booking_url(caption, expected):
+    assert parse_caption(caption, POSTED)['booking_url'] == expected
+
+
+def test_instagram_links_are_not_booking_urls():
+    caption = "instagram.com/club https://www.instagram.com/p/abc/ instagr.am/x"
+    assert 'booking_url' not in parse_caption(caption, POSTED)
+
+
+# 라인업
+
+@pytest.mark.parametrize('caption, expected', [
+    ("LINE UP\nBand A\nBand B x Band C\n\nOPEN 19:00", ['Band A', 'Band B', 'Band C']),
+    ("라인업: A, B / C", ['A', 'B', 'C']),
+    ("출연\n- @band.a\n- Band B\n예매 20,000원", ['band.a', 'Band B']),
+    ("LINE-UP\nBand A\n2024.11.23\nBand B", ['Band A']),
+    ("오늘 밤\nDJ Foo / DJ Bar", ['DJ Foo', 'DJ Bar']),
+    ("LINE UP\nA\nA\nB", ['A', 'B']),
+])
+def test_artists(caption, expected):
+    assert parse_caption(caption, POSTED)['artists'] == expected
+
+
+# 제목
+
+def test_title_skips_date_and_link_lines():
+    caption = "2024.11.23 (토)\nhttps://forms.gle/abc\n🎸 Autumn Night Live 🎸 #live"
+    assert parse_caption(caption, POSTED)['title'] == 'Autumn Night Live'
+
+
+def test_parse_captions_keeps_ids():
+    results = dict(parse_captions([(1, "2024.11.23", POSTED), (2, None, POSTED)]))
+    assert results[1]['perform_date'] == '2024-11-23'
+    assert results[2] == {'version': PARSER_VERSION}
+
+
+def test_caption_hash_matches_postgres_md5():
+    # SELECT md5('') / md5('공연')
+    assert caption_hash(None) == 'd41d8cd98f00b204e9800998ecf8427e'
+    assert caption_hash('') == caption_hash(None)
+    assert len(caption_hash('공연')) == 32
@@ -0,0 +1,76 @@
+"""
+공연 공지 게시물 분류기(scraper/post_classifier) 테스트
+"""
+import os, sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+from scraper.post_classifier import (
+    Classification, PostClassifier, PostFilter, RuleBasedClassifier, load_classifier
+)
+
+ANNOUNCEMENT = (
+    "2024.11.23 (토) 단독 공연\n"
+    "START 20:00\n"
+    "예매 25,000원 / 현장 30,000원\n"
+    "LINE UP\nBand A\nBand B"
+)
+MERCH = "굿즈 재입고 안내! 티셔츠와 후드티가 스토어에 다시 들어왔습니다"
+RECAP = "어제 와주신 모든 분들 감사했습니다 사진 모음"
+
+
+def post(caption):
+    return {'caption': caption, 'post_date': '2024-11-01', 'post_url': 'https://www.instagram.com/p/abc/'}
+
+
+def test_announcement_scores_high():
+    result = RuleBasedClassifier().classify(post(ANNOUNCEMENT))
+    assert result.score > 0.9
+    assert {'date', 'time', 'price', 'lineup', 'event_keyword'} <= set(result.reasons)
+    assert result.suggestions['perform_date'] == '2024-11-23'
+
+
+@pytest.mark.parametrize('caption', [MERCH, RECAP, "휴무 안내", "", None])
+def test_non_event_posts_score_low(caption):
+    assert RuleBasedClassifier().classify(post(caption)).score < 0.35
+
+
+def test_reuses_existing_suggestions():
+    item = post("no date here")
+    item['suggestions'] = {'version': 1, 'perform_date': '2024-11-23'}
+    result = RuleBasedClassifier().classify(item)
+    assert 'date' in result.reasons
+    assert result.suggestions is item['suggestions']
+
+
+@pytest.mark.parametrize('mode, expected', [('off', None), ('skip', 'skip'), ('defer', 'defer')])
+def test_filter_modes(mode, expected):
+    post_filter = PostFilter({'mode': mode, 'threshold': 0.35, 'classifier': 'rules'})
+    item = post(MERCH)
+    assert post_filter.apply(item) == expected
+    assert 'score' in item['classification']
+    assert item['suggestions']['version']
+
+
+def test_filter_passes_announcements():
+    post_filter = PostFilter({'mode': 'skip', 'threshold': 0.35, 'classifier': 'rules'})
+    assert post_filter.apply(post(ANNOUNCEMENT)) is None
+
+
+def test_filter_rejects_unknown_mode():
+    with pytest.raises(ValueError):
+        PostFilter({'mode': 'drop', 'classifier': 'rules'})
+
+
+class ConstantClassifier(PostClassifier):
+    def classify(self, post):
+        return Classification(score=0.5)
+
+
+def test_load_classifier():
+    assert isinstance(load_classifier('rules'), RuleBasedClassifier)
+    assert isinstance(load_classifier(f'{__name__}:ConstantClassifier'), ConstantClassifier)
+    with pytest.raises(ValueError):
+        load_classifier('no_class_name')
+    with pytest.raises(TypeError):
+        load_classifier('collections:OrderedDict')
@@ -0,0 +1,434 @@
+"""
+게시물 캡션에서 공연 정보 후보값 추출 (관리자 입력 폼 미리 채우기용)
+
+정규식은 모듈 로드 시 한 번만 컴파일하고, 캡션 한 건당 줄 단위로 한 번씩 훑는다.
+추출값은 어디까지나 제안이므로 perform_tmp.suggestions(jsonb)에만 저장하고
+title 등 실제 컬럼은 관리자가 확인 후 저장할 때 채워진다.
+
+    {'version': PARSER_VERSION, 'title': ..., 'perform_date': 'YYYY-MM-DD', 'perform_time': 'HH:MM',
+     'booking_price': 20000, 'onsite_price': 25000, 'booking_url': 'https://...', 'artists': [...]}
+
+찾지 못한 항목은 키를 넣지 않는다.
+"""
+import hashlib
+import re
+from datetime import date, datetime, timedelta
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+# 추출 규칙이 바뀌면 올려서 admin/suggest_fields.py가 이전 결과를 다시 계산하게 한다
+PARSER_VERSION = 2
+
+# parse_caption이 채우는 키 (분류 결과 등 다른 키와 구분)
+SUGGESTION_FIELDS = (
+    'version', 'title', 'perform_date', 'perform_time',
+    'booking_price', 'onsite_price', 'booking_url', 'artists'
+)
+
+MAX_TITLE_LENGTH = 100      # perform_tmp.title varchar(100)
+MAX_URL_LENGTH = 255        # perform_tmp.booking_url varchar(255)
+MAX_ARTISTS = 30
+
+_FLAGS = re.IGNORECASE
+
+# 이모지/장식 기호, 해시태그, 멘션
+_EMOJI_RE = re.compile('[\U0001F000-\U0001FAFF\u2600-\u27BF\u2B00-\u2BFF\uFE0F\u200D]')
+_HASHTAG_RE = re.compile(r'#\S+')
+_MENTION_RE = re.compile(r'@[\w.]+')
+_BULLET_RE = re.compile(r'^[\s\-–—*•·▪▶►>~|:]+|[\s\-–—*•·▪|:]+$')
+
+# 날짜
+_WEEKDAY = r'(?:\s*\(?\s*(?:[월화수목금토일](?:요일)?|mon|tue|wed|thu|fri|sat|sun)[a-z]*\.?\s*\)?)'
+_MONTHS = {
+    'jan': 1, 'feb': 2, 'mar': 3, 'apr': 4, 'may': 5, 'jun': 6,
+    'jul': 7, 'aug': 8, 'sep': 9, 'oct': 10, 'nov': 11, 'dec': 12,
+}
+_MONTH_NAME = r'(?P<mon>jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)[a-z]*\.?'
+_ORDINAL = r'(?:st|nd|rd|th)?'
+
+# (정규식, 신뢰도) - 신뢰도가 높은 형식을 우선하고, 같은 신뢰도면 캡션에서 먼저 나온 날짜
+_DATE_PATTERNS = (
+    # 2024.11.23 / 2024-11-23 / 24.11.23
+    (re.compile(r'(?<![\d.])(?P<y>20\d{2}|\d{2})\s*[./-]\s*(?P<m>\d{1,2})\s*[./-]\s*(?P<d>\d{1,2})(?![\d.])'), 2),
+    # (2024년) 11월 23일
+    (re.compile(r'(?:(?P<y>20\d{2})\s*년\s*)?(?<!\d)(?P<m>\d{1,2})\s*월\s*(?P<d>\d{1,2})\s*일'), 2),
+    # Nov 23(rd)(, 2024)
+    (re.compile(r'\b' + _MONTH_NAME + r'\s+(?P<d>\d{1,2})' + _ORDINAL + r'\b(?:,?\s*(?P<y>20\d{2}))?', _FLAGS), 2),
+    # 23(rd) Nov(ember)( 2024)
+    (re.compile(r'\b(?P<d>\d{1,2})' + _ORDINAL + r'\s+' + _MONTH_NAME + r'(?:,?\s*(?P<y>20\d{2}))?', _FLAGS), 2),
+    # 11.23 (토) / 11/23 SAT
+    (re.compile(r'(?<![\d.,:/])(?P<m>\d{1,2})\s*[./]\s*(?P<d>\d{1,2})(?=' + _WEEKDAY + ')', _FLAGS), 2),
+    # 날짜: 11.23 / DATE 11/23 (요일 없음 - 소수/분수와 구분하기 위해 날짜 라벨이 있을 때만)
+    (re.compile(
+        r'(?:날짜|일시|일자|일정|date|when)\s*[:：\-]?\s*'
+        r'(?P<m>\d{1,2})\s*[./]\s*(?P<d>\d{1,2})(?![\d.,:/]|\s*만)',
+        _FLAGS
+    ), 1),
+)
+
+# 시간: 20:00 / 8:30PM / 오후 8시 / 8시 반 / 8PM
+_MERIDIEM = r'(?:오전|오후|[ap]\.?m\.?)'
+_TIME_RE = re.compile(
+    r'(?:(?P<pre>' + _MERIDIEM + r')\s*)?(?<![\d:.])(?P<h>\d{1,2})'
+    r'(?:\s*:\s*(?P<m>\d{2})|\s*시(?!간|작)(?:\s*(?P<m2>\d{1,2})\s*분|\s*(?P<half>반))?|(?=\s*[ap]\.?m\b))'
+    r'(?:\s*(?P<post>' + _MERIDIEM + r'))?(?![\d])',
+    _FLAGS
+)
+_START_LABEL_RE = re.compile(r'start|스타트|시작|공연', _FLAGS)
+_OPEN_LABEL_RE = re.compile(r'open|doors?|오픈|입장', _FLAGS)
+
+# 가격
+_PRICE_RE = re.compile(
+    r'(?P<man>\d+(?:\.\d+)?)\s*만(?:\s*(?P<cheon>\d)\s*천)?\s*원?'
+    r'|(?:₩|\\|krw)\s*(?P<prefixed>\d{1,3}(?:,\d{3})+|\d+)'
+    r'|(?P<suffixed>\d{1,3}(?:,\d{3})+|\d+)\s*(?:원|won\b|krw\b)'
+    r'|(?<![\d.,])(?P<bare>\d{1,3}(?:,\d{3})+)(?![\d,])',
+    _FLAGS
+)
+_BOOKING_LABEL_RE = re.compile(r'예매|사전|얼리|adv(?:ance)?|pre-?(?:sale|order)|early', _FLAGS)
+_ONSITE_LABEL_RE = re.compile(r'현장|당일|도어|door|on-?site|입장료|entry|entrance|admission|cover', _FLAGS)
+_PRICE_LINE_RE = re.compile(_BOOKING_LABEL_RE.pattern + '|' + _ONSITE_LABEL_RE.pattern + r'|가격|티켓|ticket|price|₩|원', _FLAGS)
+_FREE_RE = re.compile(r'무료\s*입장|입장(?:료)?\s*무료|free\s*(?:entry|entrance|admission)|^\s*free\s*$', _FLAGS)
+_MIN_PRICE, _MAX_PRICE = 1000, 1000000
+
+# 예매 링크
+_URL_RE = re.compile(
+    r'(?:https?://|www\.)[^\s<>()\[\]{}"\']+'
+    r'|\b(?:[a-z0-9-]+\.)+(?:com|net|org|kr|ee|gle|gl|ly|me|io|so|co|to|link|page)/[^\s<>()\[\]{}"\']*',
+    _FLAGS
+)
+_IGNORED_HOST_RE = re.compile(r'(?:^|//|\.)(?:instagram\.com|instagr\.am)(?:/|$)', _FLAGS)
+_TICKET_HOST_RE = re.compile(
+    r'interpark|yes24|ticketlink|ticket\.melon|melon\.com/ticket|linktr\.ee|forms\.gle|docs\.google\.com/forms'
+    r'|tally\.so|eventbrite|ra\.co|residentadvisor|booking\.naver|smartstore|tumblbug|dice\.fm|festa\.io',
+    _FLAGS
+)
+_URL_TRAILING = '.,!?;:)]}>\'"'
+
+# 아티스트
+_LINEUP_HEADER_RE = re.compile(
+    r'^[^\w@]*(?:line\s*-?\s*up|라인업|출연진?|artists?|아티스트|performers?)\b\s*[:：\-–]?\s*(?P<rest>.*)$',
+    _FLAGS
+)
+_DJ_LINE_RE = re.compile(r'^[^\w@]*(?P<name>dj\s+\S.*)$', _FLAGS)
+_ARTIST_SPLIT_RE = re.compile(r'\s*(?:[,/|·•、]|\s[x×]\s)\s*', _FLAGS)
+_SECTION_END_RE = re.compile(
+    _PRICE_LINE_RE.pattern + '|' + _START_LABEL_RE.pattern + '|' + _OPEN_LABEL_RE.pattern + r'|예약|문의|info|장소|venue|address',
+    _FLAGS
+)
+_MAX_ARTIST_LENGTH = 50
+
+
+def parse_caption(caption: Optional[str], reference: Union[datetime, date, str, None] = None) -> Dict:
+    """
+    캡션에서 공연 정보 후보값 추출
+
+    Args:
+        caption: 게시물 캡션
+        reference: 게시 시각 (연도 없는 날짜의 연도 추정 기준, 기본값: 현재)
+
+    Returns:
+        추출값 딕셔너리 (찾은 항목만 포함, 항상 'version' 포함)
+    """
+    result = {'version': PARSER_VERSION}
+    if not caption or not caption.strip():
+        return result
+
+    reference_date = _to_date(reference)
+    lines = [_EMOJI_RE.sub('', line) for line in caption.splitlines()]
+
+    title = _find_title(lines)
+    if title:
+        result['title'] = title
+
+    perform_date = _find_date(lines, reference_date)
+    if perform_date:
+        result['perform_date'] = perform_date.isoformat()
+
+    perform_time = _find_time(lines)
+    if perform_time:
+        result['perform_time'] = perform_time
+
+    result.update(_find_prices(lines))
+
+    booking_url = _find_booking_url(lines)
+    if booking_url:
+        result['booking_url'] = booking_url
+
+    artists = _find_artists(lines)
+    if artists:
+        result['artists'] = artists
+
+    return result
+
+
+def parse_captions(items: Iterable[Tuple[int, Optional[str], Union[datetime, date, str, None]]]) -> Iterator[Tuple[int, Dict]]:
+    """
+    여러 캡션 일괄 추출
+
+    Args:
+        items: (id, 캡션, 게시 시각) 반복자
+
+    Yields:
+        (id, 추출값)
+    """
+    for item_id, caption, reference in items:
+        yield item_id, parse_caption(caption, reference)
+
+
+def caption_hash(caption: Optional[str]) -> str:
+    """
+    캡션 변경 감지용 해시 (PostgreSQL md5(COALESCE(description, ''))와 같은 값)
+
+    Returns:
+        MD5 16진수 문자열 (32자)
+    """
+    return hashlib.md5((caption or '').encode('utf-8')).hexdigest()
+
+
+def _to_date(value: Union[datetime, date, str, None]) -> date:
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    if isinstance(value, str) and value:
+        try:
+            return datetime.fromisoformat(value.strip()[:10]).date()
+        except ValueError:
+            pass
+    return date.today()
+
+
+def _clean(text: str) -> str:
+    text = _HASHTAG_RE.sub('', _MENTION_RE.sub(lambda m: m.group(0)[1:], text))
+    return _BULLET_RE.sub('', text).strip()
+
+
+# 제목
+
+def _find_title(lines: List[str]) -> Optional[str]:
+    """날짜/가격/링크만 있는 줄을 건너뛴 첫 번째 텍스트 줄"""
+    for line in lines:
+        text = _clean(_HASHTAG_RE.sub('', line))
+        if len(text) < 2 or not any(ch.isalpha() for ch in text):
+            continue
+        if _URL_RE.search(text) or _PRICE_RE.search(text) or _LINEUP_HEADER_RE.match(text):
+            continue
+        leftover = text
+        for pattern, _ in _DATE_PATTERNS:
+            leftover = pattern.sub('', leftover)
+        leftover = _TIME_RE.sub('', leftover)
+        if not any(ch.isalpha() for ch in re.sub(_WEEKDAY, '', leftover, flags=_FLAGS)):
+            continue
+        return text.strip('"\'「」『』 ')[:MAX_TITLE_LENGTH] or None
+    return None
+
+
+# 날짜
+
+def _find_date(lines: List[str], reference: date) -> Optional[date]:
+    best = None  # (신뢰도, -줄 번호, -위치, 날짜)
+    for line_no, line in enumerate(lines):
+        for pattern, confidence in _DATE_PATTERNS:
+            for match in pattern.finditer(line):
+                found = _build_date(match, reference)
+                if found is None:
+                    continue
+                key = (confidence, -line_no, -match.start(), found)
+                if best is None or key[:3] > best[:3]:
+                    best = key
+    return best[3] if best else None
+
+
+def _build_date(match, reference: date) -> Optional[date]:
+    groups = match.groupdict()
+    month = _MONTHS[groups['mon'][:3].lower()] if groups.get('mon') else int(groups['m'])
+    day = int(groups['d'])
+    year = groups.get('y')
+
+    if year:
+        year = int(year)
+        if year < 100:
+            year += 2000
+        try:
+            return date(year, month, day)
+        except ValueError:
+            return None
+
+    # 연도 없음: 게시일 기준 올해, 이미 한 달 이상 지난 날짜면 내년 (12월 게시물의 1월 공연)
+    try:
+        found = date(reference.year, month, day)
+    except ValueError:
+        return None
+    if found < reference - timedelta(days=31):
+        try:
+            found = date(reference.year + 1, month, day)
+        except ValueError:
+            return None
+    return found
+
+
+# 시간
+
+def _find_time(lines: List[str]) -> Optional[str]:
+    """공연 시작 시간 (START 표기 > 표기 없음 > OPEN 표기 순)"""
+    candidates = {}
+    for line in lines:
+        for match in _TIME_RE.finditer(line):
+            value = _build_time(match)
+            if value is None:
+                continue
+            prefix = line[:match.start()]
+            if _START_LABEL_RE.search(prefix):
+                rank = 0
+            elif _OPEN_LABEL_RE.search(prefix):
+                rank = 2
+            else:
+                rank = 1
+            candidates.setdefault(rank, value)
+    return candidates[min(candidates)] if candidates else None
+
+
+def _build_time(match) -> Optional[str]:
+    hour = int(match.group('h'))
+    minute = match.group('m') or match.group('m2')
+    minute = 30 if match.group('half') else int(minute or 0)
+    meridiem = (match.group('pre') or match.group('post') or '').lower().replace('.', '')
+
+    if hour > 24 or minute >= 60:
+        return None
+    if meridiem in ('pm', '오후') and hour < 12:
+        hour += 12
+    elif meridiem in ('am', '오전') and hour == 12:
+        hour = 0
+    elif not meridiem and 1 <= hour <= 11:
+        # 오전/AM 표기가 없는 1~11시는 저녁 공연으로 본다
+        hour += 12
+    return f"{hour % 24:02d}:{minute:02d}"
+
+
+# 가격
+
+def _find_prices(lines: List[str]) -> Dict[str, int]:
+    """예매/현장 가격 (라벨 없는 가격은 현장 가격으로 사용)"""
+    booking = onsite = generic = None
+    free = False
+
+    for line in lines:
+        if _FREE_RE.search(line):
+            free = True
+        is_price_line = bool(_PRICE_LINE_RE.search(line))
+
+        segment_start = 0
+        for match in _PRICE_RE.finditer(line):
+            if match.group('bare') and not is_price_line:
+                continue
+            amount = _build_price(match)
+            if amount is None:
+                continue
+
+            # 직전 가격 이후 구간의 라벨, 없으면 줄 앞부분 라벨
+            segment = line[segment_start:match.start()]
+            segment_start = match.end()
+            label = _price_label(segment) or _price_label(line[:match.start()])
+
+            if label == 'booking' and booking is None:
+                booking = amount
+            elif label == 'onsite' and onsite is None:
+                onsite = amount
+            elif label is None and generic is None:
+                generic = amount
+
+    prices = {}
+    if booking is not None:
+        prices['booking_price'] = booking
+    if onsite is None:
+        onsite = generic
+    if onsite is None and free and booking is None:
+        onsite = 0
+    if onsite is not None:
+        prices['onsite_price'] = onsite
+    return prices
+
+
+def _price_label(text: str) -> Optional[str]:
+    booking = [m.end() for m in _BOOKING_LABEL_RE.finditer(text)]
+    onsite = [m.end() for m in _ONSITE_LABEL_RE.finditer(text)]
+    if not booking and not onsite:
+        return None
+    # 가격에 가장 가까운(마지막) 라벨
+    return 'booking' if max(booking, default=-1) > max(onsite, default=-1) else 'onsite'
+
+
+def _build_price(match) -> Optional[int]:
+    if match.group('man'):
+        amount = float(match.group('man')) * 10000 + int(match.group('cheon') or 0) * 1000
+    else:
+        digits = match.group('prefixed') or match.group('suffixed') or match.group('bare')
+        amount = int(digits.replace(',', ''))
+    amount = int(round(amount))
+    return amount if _MIN_PRICE <= amount <= _MAX_PRICE else None
+
+
+# 예매 링크
+
+def _find_booking_url(lines: List[str]) -> Optional[str]:
+    """예매 사이트 > 예매 라벨이 있는 줄의 링크 > 첫 번째 링크 (Instagram 링크 제외)"""
+    best = None  # (우선순위, url)
+    for line in lines:
+        labelled = bool(_BOOKING_LABEL_RE.search(line) or re.search(r'예약|티켓|ticket|신청|link', line, _FLAGS))
+        for match in _URL_RE.finditer(line):
+            url = match.group(0).rstrip(_URL_TRAILING)
+            if _IGNORED_HOST_RE.search(url):
+                continue
+            if not url.lower().startswith('http'):
+                url = 'https://' + url
+            if len(url) > MAX_URL_LENGTH:
+                continue
+
+            rank = 0 if _TICKET_HOST_RE.search(url) else 1 if labelled else 2
+            if best is None or rank < best[0]:
+                best = (rank, url)
+    return best[1] if best else None
+
+
+# 아티스트
+
+def _find_artists(lines: List[str]) -> List[str]:
+    """LINE UP/라인업/출연 머리말 아래(또는 같은 줄) 목록, 없으면 'DJ ...'로 시작하는 줄"""
+    artists = []
+
+    for index, line in enumerate(lines):
+        header = _LINEUP_HEADER_RE.match(line)
+        if not header:
+            continue
+
+        if header.group('rest').strip():
+            artists.extend(_split_artists(header.group('rest')))
+
+        for next_line in lines[index + 1:index + 1 + MAX_ARTISTS]:
+            if not next_line.strip() or _LINEUP_HEADER_RE.match(next_line):
+                break
+            if _SECTION_END_RE.search(next_line) or _URL_RE.search(next_line):
+                break
+            if any(pattern.search(next_line) for pattern, _ in _DATE_PATTERNS):
+                break
+            artists.extend(_split_artists(next_line))
+        if artists:
+            break
+
+    if not artists:
+        for line in lines:
+            dj = _DJ_LINE_RE.match(line)
+            if dj:
+                artists.extend(_split_artists(dj.group('name')))
+
+    return list(dict.fromkeys(artists))[:MAX_ARTISTS]
+
+
+def _split_artists(text: str) -> List[str]:
+    names = []
+    for part in _ARTIST_SPLIT_RE.split(_HASHTAG_RE.sub('', text)):
+        name = _clean(part)
+        if name and len(name) <= _MAX_ARTIST_LENGTH and any(ch.isalpha() for ch in name):
+            names.append(name)
+    return names
@@ -0,0 +1,103 @@
+"""
+Instagram URL 파싱/정규화 (프로필, 게시물, 릴스)
+
+DB 조회/중복 확인 키로 쓰이므로 같은 대상을 가리키는 URL은 항상 같은 문자열로 정규화한다.
+    프로필: https://www.instagram.com/<username>/   (username은 소문자)
+    게시물: https://www.instagram.com/p/<shortcode>/ (릴스/IGTV 포함, shortcode는 대소문자 구분)
+"""
+import re
+from functools import lru_cache
+from typing import Optional, Tuple
+
+# 호스트 (http(s), www/m 서브도메인, instagr.am 단축 도메인 허용) + 경로
+_URL_RE = re.compile(
+    r'^\s*(?:https?://)?(?:[a-z0-9-]+\.)?(?:instagram\.com|instagr\.am)(?P<path>/[^?#\s]*)?',
+    re.IGNORECASE
+)
+_SHORTCODE_RE = re.compile(r'^[A-Za-z0-9_-]{5,}$')
+_USERNAME_RE = re.compile(r'^[A-Za-z0-9_.]{1,30}$')
+
+# 게시물 경로 종류 (/p/, /reel/, /reels/, /tv/)
+POST_PATH_KINDS = frozenset({'p', 'reel', 'reels', 'tv'})
+
+# 사용자명이 아닌 최상위 경로
+RESERVED_PATHS = POST_PATH_KINDS | frozenset({
+    'explore', 'accounts', 'stories', 'direct', 'about', 'legal',
+    'developer', 'web', 'challenge', 'emails', 'session', 'graphql', 'api'
+})
+
+PROFILE_URL_FORMAT = 'https://www.instagram.com/{}/'
+POST_URL_FORMAT = 'https://www.instagram.com/p/{}/'
+
+
+@lru_cache(maxsize=4096)
+def _parse(url: str) -> Tuple[Optional[str], Optional[str]]:
+    """
+    URL을 (username, shortcode)로 분해 (해당 없는 값은 None)
+
+    '@handle' / 'handle' 형태의 사용자명 단독 입력도 허용한다.
+    """
+    match = _URL_RE.match(url)
+    if not match:
+        handle = url.strip().lstrip('@').rstrip('/')
+        if _USERNAME_RE.match(handle) and handle.lower() not in RESERVED_PATHS:
+            return handle.lower(), None
+        return None, None
+
+    segments = [segment for segment in (match.group('path') or '').split('/') if segment]
+    if not segments:
+        return None, None
+
+    first = segments[0].lower()
+
+    # /p/CODE/, /reel/CODE/
+    if first in POST_PATH_KINDS:
+        if len(segments) >= 2 and _SHORTCODE_RE.match(segments[1]):
+            return None, segments[1]
+        return None, None
+
+    if first in RESERVED_PATHS or not _USERNAME_RE.match(segments[0]):
+        return None, None
+
+    # /username/p/CODE/ 형태 (프로필 경유 게시물 링크)
+    if len(segments) >= 3 and segments[1].lower() in POST_PATH_KINDS and _SHORTCODE_RE.match(segments[2]):
+        return first, segments[2]
+
+    return first, None
+
+
+def extract_username(url: str) -> Optional[str]:
+    """
+    프로필 URL(또는 '@handle')에서 소문자 사용자명 추출
+
+    Returns:
+        사용자명 또는 None (프로필 URL이 아닌 경우)
+    """
+    if not url:
+        return None
+    username, shortcode = _parse(url)
+    return username if shortcode is None else None
+
+
+def extract_shortcode(url: str) -> Optional[str]:
+    """
+    게시물/릴스 URL에서 shortcode 추출
+
+    Returns:
+        shortcode 또는 None (게시물 URL이 아닌 경우)
+    """
+    if not url:
+        return None
+    return _parse(url)[1]
+
+
+def canonical_profile_url(url: str) -> Optional[str]:
+    """프로필 URL 정규화 (예: 'instagram.com/HongdaeFF?igsh=x' -> 'https://www.instagram.com/hongdaeff/')"""
+    username = extract_username(url)
+    return PROFILE_URL_FORMAT.format(username) if username else None
+
+
+def canonical_post_url(url: str) -> Optional[str]:
+    """게시물 URL 정규화 (예: '.../reel/ABC123/?igsh=x' -> 'https://www.instagram.com/p/ABC123/')"""
+    shortcode = extract_shortcode(url)
+    return POST_URL_FORMAT.format(shortcode) if shortcode else None
@@ -1,12 +1,49 @@
+import atexit
+import json
 import logging
+import logging.handlers
 import os
-from config.settings import LOG_LEVEL, LOG_FILE
+import queue
+import threading
+from config.settings import LOG_LEVEL, LOG_FILE, LOG_FORMAT, LOG_ASYNC
 
-def setup_logger(name: str) -> logging.Logger:
+# LogRecord 기본 속성 (이외의 속성은 extra로 전달된 구조화 필드)
+_RECORD_ATTRS = set(vars(logging.LogRecord('', 0, '', 0, '', (), None))) | {'message', 'asctime'}
 
-    logger = logging.getLogger(name)
-    logger.setLevel(getattr(logging, LOG_LEVEL))
-    
+# 모든 모듈 로거가 공유하는 핸들러와 비동기 리스너 (프로세스당 한 번 생성)
+_handlers = None
+_queue_listener = None
+_configure_lock = threading.Lock()
+
+
+class JsonFormatter(logging.Formatter):
+    """한 줄당 하나의 JSON 객체로 출력 (extra 필드 포함)"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        payload = {
+            'time': self.formatTime(record),
+            'logger': record.name,
+            'level': record.levelname,
+            'message': record.getMessage(),
+            'thread': record.threadName,
+        }
+        for key, value in record.__dict__.items():
+            if key not in _RECORD_ATTRS and not key.startswith('_'):
+                payload[key] = value
+        if record.exc_info:
+            payload['exc_info'] = self.formatException(record.exc_info)
+        return json.dumps(payload, ensure_ascii=False, default=str)
+
+
+def _build_formatter() -> logging.Formatter:
+    if LOG_FORMAT == 'json':
+        return JsonFormatter()
+    return logging.Formatter(
+        '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+
+
+def _build_output_handlers() -> list:
     # 로그 디렉토리 생성
     os.makedirs(os.path.dirname(LOG_FILE), exist_ok=True)
     
@@ -19,13 +56,65 @@ def setup_logger(name: str) -> logging.Logger:
     console_handler.setLevel(logging.INFO)
     
     # 포매터
-    formatter = logging.Formatter(
-        '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-    )
+    formatter = _build_formatter()
     file_handler.setFormatter(formatter)
     console_handler.setFormatter(formatter)
     
-    logger.addHandler(file_handler)
-    logger.addHandler(console_handler)
+    return [file_handler, console_handler]
+
+
+def configure_logging() -> list:
+    """
+    프로세스 전체 로깅 설정 (최초 1회만 적용)
+
+    파일/콘솔 핸들러(비동기 모드에서는 QueueHandler 하나)를 한 번만 만들고
+    모든 모듈 로거가 같은 핸들러를 공유한다. 비동기 모드에서는 로그를 남기는
+    스레드가 큐에 레코드만 넣고, 실제 쓰기는 QueueListener 스레드가 처리하며
+    프로세스 종료 시 남은 로그를 모두 기록한다.
+
+    Returns:
+        모듈 로거에 연결할 공유 핸들러 리스트
+    """
+    global _handlers, _queue_listener
+    with _configure_lock:
+        if _handlers is None:
+            if LOG_ASYNC:
+                log_queue = queue.Queue(-1)
+                _queue_listener = logging.handlers.QueueListener(
+                    log_queue, *_build_output_handlers(), respect_handler_level=True
+                )
+                _queue_listener.start()
+                atexit.register(_queue_listener.stop)
+                handlers = [logging.handlers.QueueHandler(log_queue)]
+            else:
+                handlers = _build_output_handlers()
+            
+            for handler in handlers:
+                handler._litup_handler = True
+            _handlers = handlers
+    return _handlers
+
+
+def setup_logger(name: str) -> logging.Logger:
+    """
+    모듈 로거 반환 (여러 번 호출해도 핸들러가 중복 추가되지 않음)
+
+    Streamlit 재실행 등으로 같은 이름이 반복 호출되어도 공유 핸들러가
+    이미 연결되어 있으면 그대로 반환한다.
+
+    Args:
+        name: 로거 이름
+
+    Returns:
+        logging.Logger
+    """
+    logger = logging.getLogger(name)
+    
+    if not any(getattr(handler, '_litup_handler', False) for handler in logger.handlers):
+        logger.setLevel(getattr(logging, LOG_LEVEL))
+        for handler in configure_logging():
+            logger.addHandler(handler)
+        # 루트 로거에 핸들러가 추가되더라도 중복 출력되지 않도록 전파 차단
+        logger.propagate = False
     
     return logger
@@ -0,0 +1,187 @@
+"""
+실행 단계별 시간/횟수 측정 및 리포트 (JSON, Prometheus textfile)
+"""
+import functools
+import json
+import os
+import tempfile
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Dict, Optional
+
+# 히스토그램 버킷 상한 (초)
+BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 300, float('inf'))
+
+
+class _Histogram:
+    __slots__ = ('count', 'total', 'min', 'max', 'buckets')
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.min = float('inf')
+        self.max = 0.0
+        self.buckets = [0] * len(BUCKETS)
+
+    def observe(self, value: float):
+        self.count += 1
+        self.total += value
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+        self.buckets[bisect_left(BUCKETS, value)] += 1
+
+    def to_dict(self) -> Dict:
+        return {
+            'count': self.count,
+            'sum': round(self.total, 6),
+            'mean': round(self.total / self.count, 6) if self.count else 0,
+            'min': round(self.min, 6) if self.count else 0,
+            'max': round(self.max, 6),
+            'buckets': {
+                ('+Inf' if bound == float('inf') else str(bound)): count
+                for bound, count in zip(BUCKETS, self.buckets)
+            }
+        }
+
+
+class MetricsRegistry:
+    def __init__(self):
+        """단계별 타이머(히스토그램)와 카운터 저장소 (스레드 안전)"""
+        self._lock = threading.Lock()
+        self._timers: Dict[str, _Histogram] = {}
+        self._counters: Dict[str, float] = {}
+        self.started_at = datetime.now()
+        self._started = time.perf_counter()
+
+    def reset(self):
+        """측정값 초기화 (실행 시작 시 호출)"""
+        with self._lock:
+            self._timers.clear()
+            self._counters.clear()
+            self.started_at = datetime.now()
+            self._started = time.perf_counter()
+
+    def incr(self, name: str, value: float = 1):
+        """카운터 증가"""
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + value
+
+    def observe(self, name: str, seconds: float):
+        """소요 시간 기록"""
+        with self._lock:
+            histogram = self._timers.get(name)
+            if histogram is None:
+                histogram = self._timers[name] = _Histogram()
+            histogram.observe(seconds)
+
+    @contextmanager
+    def timer(self, name: str):
+        """
+        블록 실행 시간 측정 (예외가 발생해도 기록)
+
+        사용 예:
+            with metrics.timer('image.download'):
+                ...
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - start)
+
+    def timed(self, name: str):
+        """함수 실행 시간 측정 데코레이터"""
+        def decorator(func):
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                with self.timer(name):
+                    return func(*args, **kwargs)
+            return wrapper
+        return decorator
+
+    def snapshot(self) -> Dict:
+        """
+        현재 측정값
+
+        Returns:
+            {'started_at', 'elapsed_seconds', 'timers': {이름: 통계}, 'counters': {이름: 값}}
+        """
+        with self._lock:
+            return {
+                'started_at': self.started_at.isoformat(timespec='seconds'),
+                'elapsed_seconds': round(time.perf_counter() - self._started, 3),
+                'timers': {name: h.to_dict() for name, h in sorted(self._timers.items())},
+                'counters': dict(sorted(self._counters.items()))
+            }
+
+    def write_json(self, path: str, extra: Optional[Dict] = None) -> str:
+        """
+        실행 리포트 JSON 저장
+
+        Args:
+            path: 저장 경로
+            extra: 리포트에 함께 기록할 정보 (실행 모드, 결과 통계 등)
+
+        Returns:
+            저장 경로
+        """
+        report = self.snapshot()
+        if extra:
+            report.update(extra)
+        _atomic_write(path, json.dumps(report, ensure_ascii=False, indent=2, default=str))
+        return path
+
+    def write_prometheus(self, path: str, prefix: str = 'litup_scraper') -> str:
+        """
+        Prometheus textfile collector 형식으로 저장 (node_exporter가 읽는 중
+        부분 파일을 읽지 않도록 임시 파일에 쓴 뒤 교체)
+
+        Args:
+            path: 저장 경로 (.prom)
+            prefix: 메트릭 이름 접두사
+
+        Returns:
+            저장 경로
+        """
+        snapshot = self.snapshot()
+        lines = [
+            f'# TYPE {prefix}_stage_seconds histogram',
+        ]
+        with self._lock:
+            timers = sorted(self._timers.items())
+        for name, histogram in timers:
+            cumulative = 0
+            for bound, count in zip(BUCKETS, histogram.buckets):
+                cumulative += count
+                le = '+Inf' if bound == float('inf') else repr(float(bound))
+                lines.append(f'{prefix}_stage_seconds_bucket{{stage="{name}",le="{le}"}} {cumulative}')
+            lines.append(f'{prefix}_stage_seconds_sum{{stage="{name}"}} {histogram.total:.6f}')
+            lines.append(f'{prefix}_stage_seconds_count{{stage="{name}"}} {histogram.count}')
+
+        lines.append(f'# TYPE {prefix}_events_total counter')
+        for name, value in snapshot['counters'].items():
+            lines.append(f'{prefix}_events_total{{name="{name}"}} {value}')
+
+        lines.append(f'# TYPE {prefix}_run_seconds gauge')
+        lines.append(f'{prefix}_run_seconds {snapshot["elapsed_seconds"]}')
+        lines.append(f'# TYPE {prefix}_last_run_timestamp_seconds gauge')
+        lines.append(f'{prefix}_last_run_timestamp_seconds {int(time.time())}')
+
+        _atomic_write(path, '\n'.join(lines) + '\n')
+        return path
+
+
+def _atomic_write(path: str, content: str):
+    directory = os.path.dirname(path) or '.'
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+    with os.fdopen(fd, 'w', encoding='utf-8') as f:
+        f.write(content)
+    os.replace(tmp_path, path)
+
+
+# 프로세스 전역 레지스트리
+metrics = MetricsRegistry()
@@ -0,0 +1,262 @@
+"""
+실행 프로파일링 (main.py --profile)
+
+- sample: 모든 스레드의 스택을 주기적으로 수집 (collapsed stacks, flamegraph/speedscope용)
+- cprofile: 메인 스레드 결정적 프로파일 (pstats)
+
+두 방식 모두 time.sleep을 감싸 대기 시간을 CPU 시간과 분리해 요약 리포트에 기록한다.
+"""
+import cProfile
+import io
+import json
+import os
+import pstats
+import sys
+import threading
+import time
+from collections import Counter
+from datetime import datetime
+from typing import Dict, Optional
+from utils.logger import setup_logger
+from config.settings import PROFILE_CONFIG
+
+logger = setup_logger('profiling')
+
+PROFILE_KINDS = ('sample', 'cprofile')
+
+# collapsed stacks에서 time.sleep 래퍼 프레임 대신 표시할 이름
+SLEEP_FRAME = 'time.sleep'
+
+
+class _SleepAccounting:
+    """time.sleep 호출을 감싸 스레드별 대기 시간 집계"""
+
+    def __init__(self):
+        self._real_sleep = None
+        self._lock = threading.Lock()
+        self.calls = 0
+        self.total = 0.0
+        self.main_thread = 0.0
+        self._main_ident = threading.main_thread().ident
+
+        real_sleep = time.sleep
+
+        def sleep(seconds):
+            start = time.perf_counter()
+            try:
+                real_sleep(seconds)
+            finally:
+                elapsed = time.perf_counter() - start
+                with self._lock:
+                    self.calls += 1
+                    self.total += elapsed
+                    if threading.get_ident() == self._main_ident:
+                        self.main_thread += elapsed
+
+        self.wrapper = sleep
+        self.code = sleep.__code__
+
+    def install(self):
+        self._real_sleep = time.sleep
+        time.sleep = self.wrapper
+
+    def uninstall(self):
+        if self._real_sleep is not None:
+            time.sleep = self._real_sleep
+            self._real_sleep = None
+
+
+class _StackSampler(threading.Thread):
+    def __init__(self, interval: float, sleep_code):
+        """
+        모든 스레드의 현재 스택을 interval마다 수집
+
+        Args:
+            interval: 샘플링 간격 (초)
+            sleep_code: time.sleep 래퍼의 code 객체 (SLEEP_FRAME으로 표시)
+        """
+        super().__init__(name='profile-sampler', daemon=True)
+        self.interval = interval
+        self.sleep_code = sleep_code
+        self.stacks: Counter = Counter()
+        self.samples = 0
+        self._stop_event = threading.Event()
+        self._labels: Dict[object, str] = {}
+
+    def run(self):
+        own_ident = threading.get_ident()
+        while not self._stop_event.wait(self.interval):
+            names = {thread.ident: thread.name for thread in threading.enumerate()}
+            for ident, frame in sys._current_frames().items():
+                if ident == own_ident:
+                    continue
+                self.stacks[self._collapse(names.get(ident, str(ident)), frame)] += 1
+            self.samples += 1
+
+    def stop(self):
+        self._stop_event.set()
+        self.join()
+
+    def _collapse(self, thread_name: str, frame) -> str:
+        labels = []
+        while frame is not None:
+            code = frame.f_code
+            label = self._labels.get(code)
+            if label is None:
+                if code is self.sleep_code:
+                    label = SLEEP_FRAME
+                else:
+                    label = f"{os.path.basename(code.co_filename)}:{code.co_name}"
+                self._labels[code] = label
+            labels.append(label)
+            frame = frame.f_back
+        labels.append(thread_name)
+        return ';'.join(reversed(labels))
+
+
+class RunProfiler:
+    def __init__(self, kind: str = 'sample', output_dir: Optional[str] = None, interval: Optional[float] = None):
+        """
+        실행 프로파일러
+
+        Args:
+            kind: 'sample' (전체 스레드 샘플링) 또는 'cprofile' (메인 스레드 결정적 프로파일)
+            output_dir: 리포트 저장 디렉토리 (기본값: PROFILE_CONFIG['output_dir'])
+            interval: 샘플링 간격 초 (기본값: PROFILE_CONFIG['sample_interval'])
+        """
+        if kind not in PROFILE_KINDS:
+            raise ValueError(f"지원하지 않는 프로파일러: {kind} ({', '.join(PROFILE_KINDS)})")
+        self.kind = kind
+        self.output_dir = output_dir or PROFILE_CONFIG['output_dir']
+        self.interval = interval or PROFILE_CONFIG['sample_interval']
+
+        self._sleep = _SleepAccounting()
+        self._sampler = None
+        self._profile = None
+        self._started_at = None
+        self._wall = self._cpu = self._main_cpu = 0.0
+
+    def start(self):
+        self._started_at = datetime.now()
+        self._sleep.install()
+
+        if self.kind == 'sample':
+            self._sampler = _StackSampler(self.interval, self._sleep.code)
+            self._sampler.start()
+        else:
+            self._profile = cProfile.Profile()
+
+        self._wall = time.perf_counter()
+        self._cpu = time.process_time()
+        self._main_cpu = time.thread_time()
+
+        if self._profile:
+            self._profile.enable()
+        logger.info(f"🔬 프로파일링 시작 ({self.kind})")
+
+    def stop(self):
+        """측정 종료 (start를 호출한 스레드에서 호출)"""
+        if self._profile:
+            self._profile.disable()
+
+        self._wall = time.perf_counter() - self._wall
+        self._cpu = time.process_time() - self._cpu
+        self._main_cpu = time.thread_time() - self._main_cpu
+
+        if self._sampler:
+            self._sampler.stop()
+        self._sleep.uninstall()
+
+    def summary(self) -> Dict:
+        """
+        시간 분해 요약
+
+        메인 스레드 기준 wall = CPU + sleep + 기타 대기(네트워크/DB/디스크/락)로 나누고,
+        프로세스 전체 CPU(워커 스레드 포함, 파생 이미지 프로세스 풀 제외)와
+        전체 스레드 sleep 합계를 함께 기록한다.
+        """
+        main_other_wait = max(0.0, self._wall - self._main_cpu - self._sleep.main_thread)
+        summary = {
+            'kind': self.kind,
+            'started_at': self._started_at.isoformat(timespec='seconds') if self._started_at else None,
+            'wall_seconds': round(self._wall, 3),
+            'process_cpu_seconds': round(self._cpu, 3),
+            'process_cpu_utilization': round(self._cpu / self._wall, 3) if self._wall else 0,
+            'main_thread': {
+                'cpu_seconds': round(self._main_cpu, 3),
+                'sleep_seconds': round(self._sleep.main_thread, 3),
+                'other_wait_seconds': round(main_other_wait, 3),
+            },
+            'sleep_seconds_all_threads': round(self._sleep.total, 3),
+            'sleep_calls': self._sleep.calls,
+        }
+
+        if self._sampler:
+            summary['samples'] = self._sampler.samples
+            summary['sample_interval'] = self.interval
+            summary['top_leaf_frames'] = self._top_frames(leaf_only=True)
+            summary['top_inclusive_frames'] = self._top_frames(leaf_only=False)
+        return summary
+
+    def _top_frames(self, leaf_only: bool, limit: int = 25) -> Dict[str, int]:
+        counts: Counter = Counter()
+        for stack, count in self._sampler.stacks.items():
+            frames = stack.split(';')[1:]  # 첫 항목은 스레드 이름
+            if not frames:
+                continue
+            if leaf_only:
+                counts[frames[-1]] += count
+            else:
+                for frame in set(frames):
+                    counts[frame] += count
+        return dict(counts.most_common(limit))
+
+    def write_report(self, mode: str) -> Dict[str, str]:
+        """
+        리포트 저장
+
+        Args:
+            mode: 실행 모드 (파일명에 사용)
+
+        Returns:
+            {'summary': 경로, 'collapsed' 또는 'pstats'/'text': 경로}
+        """
+        os.makedirs(self.output_dir, exist_ok=True)
+        base = os.path.join(
+            self.output_dir,
+            f"profile_{self._started_at.strftime('%Y%m%d_%H%M%S')}_{mode}"
+        )
+        paths = {'summary': f"{base}_summary.json"}
+
+        summary = self.summary()
+        with open(paths['summary'], 'w', encoding='utf-8') as f:
+            json.dump(summary, f, ensure_ascii=False, indent=2)
+
+        if self._sampler:
+            paths['collapsed'] = f"{base}.collapsed"
+            with open(paths['collapsed'], 'w', encoding='utf-8') as f:
+                for stack, count in sorted(self._sampler.stacks.items()):
+                    f.write(f"{stack} {count}\n")
+
+        if self._profile:
+            paths['pstats'] = f"{base}.pstats"
+            self._profile.dump_stats(paths['pstats'])
+
+            paths['text'] = f"{base}.txt"
+            buffer = io.StringIO()
+            stats = pstats.Stats(self._profile, stream=buffer)
+            stats.sort_stats('cumulative').print_stats(40)
+            stats.sort_stats('tottime').print_stats(40)
+            with open(paths['text'], 'w', encoding='utf-8') as f:
+                f.write(buffer.getvalue())
+
+        main_thread = summary['main_thread']
+        logger.info(
+            f"🔬 프로파일 요약: wall {summary['wall_seconds']:.1f}s = "
+            f"CPU {main_thread['cpu_seconds']:.1f}s + sleep {main_thread['sleep_seconds']:.1f}s + "
+            f"기타 대기 {main_thread['other_wait_seconds']:.1f}s (메인 스레드), "
+            f"프로세스 CPU {summary['process_cpu_seconds']:.1f}s"
+        )
+        for name, path in paths.items():
+            logger.info(f"   {name}: {path}")
+        return paths